@@ -0,0 +1,263 @@
+"""Time and peak memory of each inspection stage on synthetic pipelines.
+
+Usage::
+
+    python -m benchmarks.run --sizes 1000 10000 100000 -o results.json
+    python -m benchmarks.run -o new.json --compare results.json
+
+Every stage is timed ``--repeat`` times and the fastest run is reported; peak
+memory is measured in a separate run under ``tracemalloc``, so it does not
+inflate the timings. The end-to-end stage runs ``kedro-inspect`` in a
+subprocess on a generated project and reports the child's peak RSS.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from kedro import __version__ as kedro_version
+from typing_extensions import TypedDict
+
+from benchmarks.synthetic import make_pipeline, write_project
+from kedro_inspect import __version__
+from kedro_inspect.analysis import analyze_pipeline
+from kedro_inspect.codec import get_codec
+from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect.typecheck import check_types
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class ResultDict(TypedDict):
+    stage: str
+    n_nodes: int
+    seconds: float
+    peak_bytes: int
+
+
+class ReportDict(TypedDict):
+    metadata: Dict[str, Any]
+    results: List[ResultDict]
+
+
+def measure(func: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """Fastest wall time of ``repeat`` calls and peak traced memory of one more."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def measure_cli(n_nodes: int, seed: int, repeat: int) -> Tuple[float, int]:
+    """Fastest wall time of ``kedro-inspect`` and the largest peak RSS of its runs."""
+    with tempfile.TemporaryDirectory() as tmp:
+        project = write_project(Path(tmp) / "project", n_nodes, seed)
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])
+            ),
+        }
+        times = []
+        for i in range(repeat):
+            output = Path(tmp) / f"out_{i}.json"
+            start = time.perf_counter()
+            subprocess.run(
+                [sys.executable, "-m", "kedro_inspect.cli", str(project)]
+                + ["--no-cache", "-o", str(output)],
+                env=env,
+                check=True,
+                stdout=subprocess.DEVNULL,
+            )
+            times.append(time.perf_counter() - start)
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return min(times), max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def run_size(n_nodes: int, seed: int, repeat: int, cli: bool) -> List[ResultDict]:
+    kedro_pipeline = make_pipeline(n_nodes, seed)
+    inspected = InspectedPipeline.from_kedro_pipeline(kedro_pipeline)
+    dct = inspected.to_dict()
+    json_codec = get_codec("json")
+    compact_codec = get_codec("compact")
+    encoded = json_codec.encode(dct)
+    compact = compact_codec.encode(dct)
+
+    stages: Dict[str, Callable[[], Any]] = {
+        "from_kedro_pipeline": lambda: InspectedPipeline.from_kedro_pipeline(
+            kedro_pipeline
+        ),
+        "to_dict": inspected.to_dict,
+        "from_dict": lambda: InspectedPipeline.from_dict(dct),
+        "from_dict_lazy": lambda: InspectedPipeline.from_dict(dct, lazy=True),
+        "to_kedro_pipeline": inspected.to_kedro_pipeline,
+        "to_kedro_bulk": lambda: InspectedPipeline.from_dict(
+            dct, lazy=True
+        ).to_kedro_pipeline_bulk(),
+        "encode_json": lambda: json_codec.encode(dct),
+        "decode_json": lambda: json_codec.decode(encoded),
+        "encode_compact": lambda: compact_codec.encode(dct),
+        "decode_compact": lambda: compact_codec.decode(compact),
+        "check_types": lambda: check_types(InspectedPipeline(inspected.nodes)),
+        "analyze": lambda: analyze_pipeline(
+            InspectedPipeline(inspected.nodes), workers=[1, 4, 16]
+        ),
+    }
+    results: List[ResultDict] = []
+    for stage, func in stages.items():
+        seconds, peak = measure(func, repeat)
+        results.append(
+            {"stage": stage, "n_nodes": n_nodes, "seconds": seconds, "peak_bytes": peak}
+        )
+        print(format_result(results[-1]), file=sys.stderr)
+    if cli:
+        seconds, peak = measure_cli(n_nodes, seed, repeat)
+        results.append(
+            {"stage": "cli", "n_nodes": n_nodes, "seconds": seconds, "peak_bytes": peak}
+        )
+        print(format_result(results[-1]), file=sys.stderr)
+    return results
+
+
+def format_result(result: ResultDict) -> str:
+    return (
+        f"{result['stage']:<20} {result['n_nodes']:>7} nodes "
+        f"{result['seconds'] * 1000:>10.1f} ms {result['peak_bytes'] / 2**20:>9.1f} MiB"
+    )
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(args: BenchmarkArgs) -> Dict[str, Any]:
+    return {
+        "commit": git_commit(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "kedro": kedro_version,
+        "kedro_inspect": __version__,
+        "seed": args.seed,
+        "repeat": args.repeat,
+    }
+
+
+def compare(old: ReportDict, new: ReportDict) -> List[str]:
+    """One line per stage and size present in both reports, with the ratio of
+    new to old time and peak memory."""
+    old_results = {(r["stage"], r["n_nodes"]): r for r in old["results"]}
+    lines = []
+    for result in new["results"]:
+        base = old_results.get((result["stage"], result["n_nodes"]))
+        if base is None:
+            continue
+        time_ratio = result["seconds"] / base["seconds"] if base["seconds"] else 0.0
+        mem_ratio = (
+            result["peak_bytes"] / base["peak_bytes"] if base["peak_bytes"] else 0.0
+        )
+        lines.append(
+            f"{result['stage']:<20} {result['n_nodes']:>7} nodes "
+            f"time x{time_ratio:.2f} memory x{mem_ratio:.2f}"
+        )
+    return lines
+
+
+class BenchmarkArgs(argparse.Namespace):
+    """Used to typehint parsed CLI arguments."""
+
+    sizes: List[int]
+    repeat: int
+    seed: int
+    no_cli: bool
+    output: Path | None
+    compare: Path | None
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark kedro-inspect on synthetic pipelines.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="numbers of nodes of the generated pipelines",
+        default=[1000, 10000, 100000],
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="timed runs per stage, the fastest is kept",
+        default=3,
+    )
+    parser.add_argument("--seed", type=int, help="pipeline generator seed", default=0)
+    parser.add_argument(
+        "--no-cli", action="store_true", help="skip the end-to-end CLI benchmark"
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="path to write the JSON results to"
+    )
+    parser.add_argument(
+        "--compare", type=Path, help="previous results to compare against"
+    )
+    return parser
+
+
+def main(argv: List[str] | None = None) -> int:
+    args = get_parser().parse_args(argv, namespace=BenchmarkArgs)
+    if args.repeat < 1:
+        raise ValueError("--repeat must be at least 1.")
+
+    results = []
+    for n_nodes in args.sizes:
+        results += run_size(n_nodes, args.seed, args.repeat, not args.no_cli)
+    report: ReportDict = {"metadata": metadata(args), "results": results}
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    else:
+        print(json.dumps(report, indent=2))
+    if args.compare:
+        for line in compare(json.loads(args.compare.read_text()), report):
+            print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
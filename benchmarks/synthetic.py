@@ -0,0 +1,128 @@
+"""Synthetic Kedro pipelines and projects for benchmarking.
+
+Nodes reuse a small set of functions covering the signatures found in real
+projects: positional and keyword-only arguments, defaults, ``*args``,
+``**kwargs``, missing or nested type hints, and dict inputs. Nodes are grouped
+into namespaces and each one consumes outputs of recent nodes, so the
+pipelines have realistic depth and width.
+"""
+
+from __future__ import annotations
+
+import random
+import textwrap
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from kedro import __version__ as kedro_version
+from kedro.pipeline import Pipeline, node
+
+NODES_PER_NAMESPACE = 250
+WINDOW = 50
+
+
+def clean(table: Dict[str, List[int]], schema: str) -> Dict[str, List[int]]:
+    return table
+
+
+def scale(data: List[float], factor: float = 1.0, *, clip: bool = False) -> List[float]:
+    return data
+
+
+def combine(*parts: List[int]) -> List[int]:
+    return [x for part in parts for x in part]
+
+
+def report(data: Any, **extra: Optional[str]) -> Dict[str, Any]:
+    return {"data": data, **extra}
+
+
+def fit(features, target, *extra, seed: int = 0, **options) -> Tuple[Any, float]:
+    return features, 0.0
+
+
+def untyped(a, b):
+    return a
+
+
+def _positional(
+    rng: random.Random, func: Callable, available: List[str], n_inputs: int
+) -> Tuple[Callable, List[str]]:
+    return func, rng.sample(available, min(n_inputs, len(available)))
+
+
+def _random_node_inputs(
+    rng: random.Random, available: List[str]
+) -> Tuple[Callable, Any]:
+    kind = rng.randrange(6)
+    if kind == 0:
+        return clean, [rng.choice(available), "params:schema"]
+    if kind == 1:
+        return scale, {"data": rng.choice(available), "factor": "params:factor"}
+    if kind == 2:
+        return _positional(rng, combine, available, rng.randint(1, 4))
+    if kind == 3:
+        data, *extra = rng.sample(available, min(3, len(available)))
+        return report, {"data": data, **{f"e{i}": ds for i, ds in enumerate(extra)}}
+    if kind == 4:
+        return _positional(rng, fit, available, rng.randint(2, 4))
+    return _positional(rng, untyped, available, 2)
+
+
+def make_pipeline(n_nodes: int, seed: int = 0) -> Pipeline:
+    """Build a pipeline of ``n_nodes`` nodes, deterministically for a ``seed``."""
+    rng = random.Random(seed)
+    available = [f"raw_{i}" for i in range(WINDOW)]
+    nodes = []
+    for i in range(n_nodes):
+        func, inputs = _random_node_inputs(rng, available[-WINDOW:])
+        outputs: Any = f"ds_{i}"
+        if func is fit:
+            outputs = [f"ds_{i}", f"ds_{i}_score"]
+        nodes.append(
+            node(
+                func,
+                inputs,
+                outputs,
+                name=f"node_{i}",
+                namespace=f"ns_{i // NODES_PER_NAMESPACE}",
+                tags=["synthetic", f"kind_{func.__name__}"],
+            )
+        )
+        available.append(f"ds_{i}")
+    return Pipeline(nodes)
+
+
+PACKAGE = "synthetic_bench"
+
+REGISTRY = """
+from benchmarks.synthetic import make_pipeline
+
+
+def register_pipelines():
+    return {{"__default__": make_pipeline({n_nodes}, {seed})}}
+"""
+
+
+def write_project(root: Path, n_nodes: int, seed: int = 0) -> Path:
+    """Write a minimal Kedro project whose default pipeline is
+    ``make_pipeline(n_nodes, seed)``.
+
+    The project imports this module, so the directory containing the
+    ``benchmarks`` package has to be on ``PYTHONPATH`` when it is inspected.
+    """
+    root.mkdir(parents=True, exist_ok=True)
+    (root / "pyproject.toml").write_text(textwrap.dedent(f"""\
+            [tool.kedro]
+            package_name = "{PACKAGE}"
+            project_name = "synthetic"
+            kedro_init_version = "{kedro_version}"
+            """))
+    package = root / "src" / PACKAGE
+    package.mkdir(parents=True, exist_ok=True)
+    (package / "__init__.py").write_text("")
+    (package / "settings.py").write_text("")
+    (package / "pipeline_registry.py").write_text(
+        REGISTRY.format(n_nodes=n_nodes, seed=seed)
+    )
+    return root
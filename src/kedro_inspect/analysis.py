@@ -0,0 +1,218 @@
+"""Parallelism and critical-path analysis of a pipeline's dependency graph.
+
+Node costs are arbitrary weights, e.g. seconds; nodes cost ``DEFAULT_COST``
+unless given a cost by name or by a tag like ``cost_2.5``. All analyses are
+linear in the number of nodes and dependencies, except the makespan estimates,
+which additionally keep a heap of the nodes ready to run.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
+
+from typing_extensions import NotRequired, TypedDict
+
+from kedro_inspect.diff import unnamed_node_key
+
+if TYPE_CHECKING:
+    from kedro_inspect.index import PipelineIndex
+    from kedro_inspect.node import InspectedNode
+    from kedro_inspect.pipeline import InspectedPipeline
+
+DEFAULT_COST = 1.0
+COST_TAG_PREFIX = "cost_"
+
+
+class ScheduleDict(TypedDict):
+    workers: int
+    makespan: float
+    # no schedule can be shorter than the critical path or the total cost
+    # spread evenly across the workers
+    lower_bound: float
+    # share of the workers' time spent running nodes
+    efficiency: float
+
+
+class PipelineAnalysisDict(TypedDict):
+    n_nodes: int
+    n_dependencies: int
+    n_levels: int
+    # number of nodes per level, nodes of a level only depend on earlier levels
+    level_widths: List[int]
+    max_width: int
+    # node names per level, if requested
+    levels: NotRequired[List[List[str]]]
+    total_cost: float
+    critical_path: List[str]
+    critical_path_cost: float
+    # speed-up with unlimited workers, total cost over critical path cost
+    parallelism: float
+    schedules: List[ScheduleDict]
+
+
+def node_label(node: InspectedNode) -> str:
+    """Namespaced name of a node, see ``diff.node_key`` for unnamed nodes."""
+    if node.name is None:
+        return unnamed_node_key(
+            node.namespace, node.function.fqn, node.inputs, node.outputs
+        )
+    return node.full_name
+
+
+def node_costs(
+    pipeline: InspectedPipeline,
+    costs: Dict[str, float] | None = None,
+    tag_prefix: str | None = COST_TAG_PREFIX,
+    default: float = DEFAULT_COST,
+) -> List[float]:
+    """Cost of every node, from ``costs`` by node name, a cost tag or ``default``."""
+    costs = costs or {}
+    result = []
+    for node in pipeline.nodes:
+        label = node_label(node)
+        cost = costs.get(label)
+        if cost is None and tag_prefix:
+            for tag in node.tags:
+                if tag.startswith(tag_prefix):
+                    try:
+                        cost = float(tag[len(tag_prefix) :])
+                    except ValueError:
+                        raise ValueError(
+                            f"Node {label!r} has an invalid cost tag {tag!r}."
+                        ) from None
+                    break
+        cost = default if cost is None else float(cost)
+        if cost < 0:
+            raise ValueError(f"Node {label!r} has a negative cost {cost}.")
+        result.append(cost)
+    return result
+
+
+def critical_path(index: PipelineIndex, costs: List[float]) -> Tuple[List[int], float]:
+    """The most expensive chain of dependent nodes and its cost."""
+    finish = [0.0] * len(costs)
+    previous = [-1] * len(costs)
+    for idx in index.topological_order:
+        parents = index.parents[idx]
+        if parents:
+            previous[idx] = max(parents, key=finish.__getitem__)
+            finish[idx] = finish[previous[idx]]
+        finish[idx] += costs[idx]
+    if not finish:
+        return [], 0.0
+    last = max(range(len(finish)), key=finish.__getitem__)
+    path = [last]
+    while previous[path[-1]] >= 0:
+        path.append(previous[path[-1]])
+    return path[::-1], finish[last]
+
+
+def bottom_levels(index: PipelineIndex, costs: List[float]) -> List[float]:
+    """Cost of the most expensive chain from each node to the end of the pipeline."""
+    levels = [0.0] * len(costs)
+    for idx in reversed(index.topological_order):
+        children = index.children[idx]
+        levels[idx] = costs[idx] + max((levels[c] for c in children), default=0.0)
+    return levels
+
+
+def estimate_makespan(
+    index: PipelineIndex,
+    costs: List[float],
+    workers: int,
+    priorities: List[float] | None = None,
+) -> float:
+    """Time to run the pipeline on ``workers`` workers.
+
+    Simulates list scheduling: whenever a worker is free, it runs the ready node
+    with the highest priority, by default the node heading the most expensive
+    remaining chain. This is within a factor of two of the optimum.
+    """
+    if workers < 1:
+        raise ValueError("The number of workers must be at least 1.")
+    if priorities is None:
+        priorities = bottom_levels(index, costs)
+    n_parents = [len(parents) for parents in index.parents]
+    ready = [(-priorities[idx], idx) for idx, n in enumerate(n_parents) if n == 0]
+    heapq.heapify(ready)
+    # finish time and node of the nodes being run
+    running: List[Tuple[float, int]] = []
+    now = 0.0
+    while ready or running:
+        while ready and len(running) < workers:
+            _, idx = heapq.heappop(ready)
+            heapq.heappush(running, (now + costs[idx], idx))
+        now, idx = heapq.heappop(running)
+        for child in index.children[idx]:
+            n_parents[child] -= 1
+            if n_parents[child] == 0:
+                heapq.heappush(ready, (-priorities[child], child))
+    return now
+
+
+def analyze_pipeline(
+    pipeline: InspectedPipeline,
+    costs: List[float] | None = None,
+    workers: Iterable[int] = (),
+    include_levels: bool = False,
+) -> PipelineAnalysisDict:
+    """Levels, critical path and makespan estimates for each number of ``workers``.
+
+    ``costs`` are per node, in the order of ``pipeline.nodes``, see ``node_costs``.
+    """
+    index = pipeline.index
+    if costs is None:
+        costs = node_costs(pipeline)
+    # raises on circular dependencies, before anything else is computed
+    layers = index.layers
+    path, path_cost = critical_path(index, costs)
+    total = sum(costs)
+    priorities = bottom_levels(index, costs)
+
+    schedules: List[ScheduleDict] = []
+    for n_workers in workers:
+        makespan = estimate_makespan(index, costs, n_workers, priorities)
+        schedules.append(
+            {
+                "workers": n_workers,
+                "makespan": makespan,
+                "lower_bound": max(path_cost, total / n_workers),
+                "efficiency": total / (n_workers * makespan) if makespan else 1.0,
+            }
+        )
+
+    labels = [node_label(node) for node in pipeline.nodes]
+    analysis: PipelineAnalysisDict = {
+        "n_nodes": len(costs),
+        "n_dependencies": sum(map(len, index.parents)),
+        "n_levels": len(layers),
+        "level_widths": [len(layer) for layer in layers],
+        "max_width": max(map(len, layers), default=0),
+        "total_cost": total,
+        "critical_path": [labels[idx] for idx in path],
+        "critical_path_cost": path_cost,
+        "parallelism": total / path_cost if path_cost else 1.0,
+        "schedules": schedules,
+    }
+    if include_levels:
+        analysis["levels"] = [[labels[idx] for idx in layer] for layer in layers]
+    return analysis
+
+
+def summarise_analysis(analysis: PipelineAnalysisDict) -> List[str]:
+    lines = [
+        f"nodes: {analysis['n_nodes']}, dependencies: {analysis['n_dependencies']}",
+        f"levels: {analysis['n_levels']}, max width: {analysis['max_width']}",
+        f"total cost: {analysis['total_cost']:g}, critical path cost: "
+        f"{analysis['critical_path_cost']:g}, parallelism: "
+        f"{analysis['parallelism']:.2f}",
+        f"critical path: {' -> '.join(analysis['critical_path'])}",
+    ]
+    lines += [
+        f"{schedule['workers']} workers: makespan {schedule['makespan']:g} "
+        f"(lower bound {schedule['lower_bound']:g}, efficiency "
+        f"{schedule['efficiency']:.0%})"
+        for schedule in analysis["schedules"]
+    ]
+    return lines
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import glob
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from typing_extensions import TypedDict
+
+from kedro_inspect.pipeline import InspectedPipelineDict
+
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+class ProjectResultDict(TypedDict):
+    project: str
+    seconds: float
+    pipelines: Dict[str, InspectedPipelineDict]
+    error: str | None
+
+
+class BatchReportDict(TypedDict):
+    seconds: float
+    n_failed: int
+    projects: List[ProjectResultDict]
+
+
+def expand_projects(patterns: Iterable[str]) -> List[Path]:
+    """Project paths given directly or as glob patterns, without duplicates.
+
+    Patterns only match directories with a ``pyproject.toml``; paths given
+    directly are kept so that invalid ones are reported as errors.
+    """
+    paths: Dict[Path, None] = {}
+    for pattern in patterns:
+        if _GLOB_CHARACTERS.isdisjoint(pattern):
+            paths[Path(pattern).resolve()] = None
+            continue
+        for match in sorted(glob.glob(pattern)):
+            path = Path(match)
+            if (path / "pyproject.toml").is_file():
+                paths[path.resolve()] = None
+    return list(paths)
+
+
+def inspect_project(
+    path: Path,
+    pipeline_names: List[str] | None = None,
+    static: bool = False,
+    use_cache: bool = True,
+    evaluate_hints: bool = True,
+) -> ProjectResultDict:
+    """Inspect the pipelines of a project, all of them if ``pipeline_names`` is
+    None, catching any error.
+
+    Bootstrapping changes global Kedro state, so this is meant to run in a
+    process of its own; the project's modules and ``sys.path`` entries added
+    while inspecting are removed again in case the process is reused.
+    """
+    start = time.perf_counter()
+    modules = set(sys.modules)
+    sys_path = list(sys.path)
+    pipelines: Dict[str, InspectedPipelineDict] = {}
+    error = None
+    try:
+        if static:
+            pipelines = _inspect_static(path, pipeline_names)
+        else:
+            pipelines = _inspect_runtime(
+                path, pipeline_names, use_cache, evaluate_hints
+            )
+    except Exception:  # noqa: BLE001 - reported per project
+        error = traceback.format_exc(limit=-3).strip()
+    finally:
+        for name in set(sys.modules) - modules:
+            if _is_within(getattr(sys.modules[name], "__file__", None), path):
+                del sys.modules[name]
+        sys.path[:] = sys_path
+    return {
+        "project": str(path),
+        "seconds": time.perf_counter() - start,
+        "pipelines": pipelines,
+        "error": error,
+    }
+
+
+def _is_within(file: str | None, directory: Path) -> bool:
+    return file is not None and directory in Path(file).resolve().parents
+
+
+def _inspect_static(
+    path: Path, pipeline_names: List[str] | None
+) -> Dict[str, InspectedPipelineDict]:
+    from kedro_inspect.pipeline import to_pipeline_dict
+    from kedro_inspect.static import StaticProject
+
+    project = StaticProject(path)
+    names = list(project.pipelines) if pipeline_names is None else pipeline_names
+    return {name: to_pipeline_dict(project.inspect(name)["nodes"]) for name in names}
+
+
+def _inspect_runtime(
+    path: Path,
+    pipeline_names: List[str] | None,
+    use_cache: bool,
+    evaluate_hints: bool,
+) -> Dict[str, InspectedPipelineDict]:
+    from kedro.framework.project import pipelines
+    from kedro.framework.startup import bootstrap_project
+
+    from kedro_inspect.cache import DEFAULT_CACHE_DIR, InspectionCache
+    from kedro_inspect.caches import clear_caches
+    from kedro_inspect.introspection import introspection_cache
+    from kedro_inspect.pipeline import InspectedPipeline
+
+    if not path.is_dir():
+        raise ValueError(f"Project path {path} is not a directory.")
+    # the process may be reused for several projects
+    clear_caches()
+    introspection_cache.resolver.evaluate = evaluate_hints
+    bootstrap_project(path)
+    names = list(pipelines) if pipeline_names is None else pipeline_names
+    missing = [name for name in names if name not in pipelines]
+    if missing:
+        raise ValueError(
+            f"Pipelines {missing} not found. Available pipelines: {list(pipelines)}"
+        )
+
+    disk_cache = InspectionCache(path / DEFAULT_CACHE_DIR) if use_cache else None
+    node_cache: Dict[Any, Any] = {}
+    result = {
+        name: InspectedPipeline.from_kedro_pipeline(
+            pipelines[name], node_cache, disk_cache
+        ).to_dict()
+        for name in names
+    }
+    if disk_cache is not None:
+        disk_cache.save()
+    return result
+
+
+def _init_worker() -> None:
+    # Kedro logs to stdout, which the parent may be writing the report to
+    sys.stdout = sys.stderr
+
+
+def iter_batch(
+    paths: List[Path], jobs: int | None = None, **kwargs: Any
+) -> Iterator[ProjectResultDict]:
+    """Inspect each of ``paths`` with ``inspect_project`` in a fresh worker
+    process, at most ``jobs`` at a time, yielding results in order of completion.
+
+    Every project gets an executor of its own, so no Kedro state is shared
+    between projects and a worker that dies, e.g. of a crash in a project's
+    code, only fails its own project.
+    """
+    context = multiprocessing.get_context("spawn")
+    jobs = jobs or os.cpu_count() or 1
+    pending = list(reversed(paths))
+    # executor and start time of each running project
+    running: Dict[Future, Tuple[Path, ProcessPoolExecutor, float]] = {}
+    try:
+        while pending or running:
+            while pending and len(running) < jobs:
+                path = pending.pop()
+                pool = ProcessPoolExecutor(
+                    max_workers=1, mp_context=context, initializer=_init_worker
+                )
+                future = pool.submit(inspect_project, path, **kwargs)
+                running[future] = (path, pool, time.perf_counter())
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                path, pool, start = running.pop(future)
+                pool.shutdown()
+                try:
+                    result = future.result()
+                except Exception as exc:  # noqa: BLE001 - e.g. BrokenProcessPool
+                    result = {
+                        "project": str(path),
+                        "seconds": time.perf_counter() - start,
+                        "pipelines": {},
+                        "error": f"{type(exc).__name__}: {exc}",
+                    }
+                yield result
+    finally:
+        for _, pool, _ in running.values():
+            pool.shutdown(cancel_futures=True)
+
+
+def make_report(
+    results: Iterable[ProjectResultDict], seconds: float
+) -> BatchReportDict:
+    projects = sorted(results, key=lambda result: result["project"])
+    return {
+        "seconds": seconds,
+        "n_failed": sum(result["error"] is not None for result in projects),
+        "projects": projects,
+    }
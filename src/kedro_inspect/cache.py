@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict
+
+from kedro_inspect import __version__
+from kedro_inspect.files import write_atomic
+from kedro_inspect.introspection import introspection_cache
+from kedro_inspect.node import InspectedNode
+
+if TYPE_CHECKING:
+    from kedro.pipeline.node import Node as KedroNode
+
+    from kedro_inspect.node import InspectedNodeDict
+
+DEFAULT_CACHE_DIR = ".kedro_inspect_cache"
+_CACHE_FILE = "nodes.json"
+# bumped when the serialised node format changes
+_FORMAT = 2
+
+
+class InspectionCache:
+    """Persistent cache of ``InspectedNodeDict`` entries.
+
+    An entry is keyed by the node's definition together with the content hash of
+    the source file defining the node's function, so editing a module invalidates
+    exactly the nodes backed by functions from that module.
+    """
+
+    def __init__(self, directory: Path, max_entries: int = 100_000) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._file_hashes: Dict[str, str | None] = {}
+        self._used: Dict[str, InspectedNodeDict] = {}
+        self._entries = self._load()
+
+    def _load(self) -> Dict[str, InspectedNodeDict]:
+        path = self.directory / _CACHE_FILE
+        try:
+            content = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if content.get("version") != __version__ or content.get("format") != _FORMAT:
+            return {}
+        return content["entries"]
+
+    def save(self) -> None:
+        # entries used in this run come last so that they are evicted last
+        entries = {k: v for k, v in self._entries.items() if k not in self._used}
+        entries.update(self._used)
+        if len(entries) > self.max_entries:
+            entries = dict(list(entries.items())[-self.max_entries :])
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / _CACHE_FILE
+        write_atomic(
+            path,
+            json.dumps(
+                {"version": __version__, "format": _FORMAT, "entries": entries}
+            ).encode(),
+        )
+
+    def key(self, node: KedroNode) -> str | None:
+        """Return the cache key of the node, or None if it cannot be cached."""
+        func = node.func
+        module = getattr(func, "__module__", None)
+        qualname = getattr(func, "__qualname__", None)
+        if module is None or qualname is None:
+            return None
+        file_hash = self._module_hash(module)
+        if file_hash is None:
+            return None
+        definition = json.dumps(
+            [
+                f"{module}.{qualname}",
+                file_hash,
+                node._name,
+                node._namespace,
+                node._inputs,
+                node._outputs,
+                sorted(node.tags),
+                node.confirms,
+                introspection_cache.resolver.evaluate,
+            ]
+        )
+        return hashlib.sha256(definition.encode()).hexdigest()
+
+    def _module_hash(self, module_name: str) -> str | None:
+        if module_name not in self._file_hashes:
+            module = sys.modules.get(module_name)
+            path = getattr(module, "__file__", None)
+            try:
+                content = Path(path).read_bytes() if path else None
+            except OSError:
+                content = None
+            self._file_hashes[module_name] = (
+                hashlib.sha256(content).hexdigest() if content is not None else None
+            )
+        return self._file_hashes[module_name]
+
+    def get(self, node: KedroNode) -> InspectedNode | None:
+        key = self.key(node)
+        dct = self._entries.get(key) if key is not None else None
+        if dct is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used[key] = dct
+        # functions and type hints are already imported, resolve them on demand
+        return InspectedNode.from_dict(dct, lazy=True)
+
+    def put(self, node: KedroNode, inspected: InspectedNode) -> None:
+        key = self.key(node)
+        if key is not None:
+            self._used[key] = inspected.to_dict()
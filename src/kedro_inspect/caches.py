@@ -0,0 +1,18 @@
+"""Process-level caches of inspections, cleared together when project modules
+are reloaded, so that nothing keeps referring to stale functions and types."""
+
+from __future__ import annotations
+
+from kedro_inspect import serialisation, typecheck
+from kedro_inspect.introspection import introspection_cache
+from kedro_inspect.node_func import clear_interned_parameters
+
+
+def clear_caches() -> None:
+    """Clear every in-memory cache that may hold objects of project modules."""
+    introspection_cache.clear()
+    serialisation.fqn_to_obj.cache_clear()
+    serialisation._encode_type_cached.cache_clear()
+    serialisation._decode_type_cached.cache_clear()
+    clear_interned_parameters()
+    typecheck._is_compatible_cached.cache_clear()
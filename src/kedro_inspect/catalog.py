@@ -0,0 +1,180 @@
+"""Dataset metadata from the resolved catalog config, without instantiating
+datasets.
+
+Dataset classes are only looked up, never constructed, so no connections or
+filesystems are opened. Credentials are reported by name only.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from kedro.io.catalog_config_resolver import CatalogConfigResolver
+from typing_extensions import TypedDict
+
+from kedro_inspect.serialisation import obj_to_fqn, resolve_fqns
+
+_TYPE_KEY = "type"
+_FILEPATH_KEY = "filepath"
+_CREDENTIALS_KEY = "credentials"
+_HIDDEN_CREDENTIALS_KEY = "__credentials_name__"
+_METADATA_KEY = "metadata"
+_PARAMETERS = "parameters"
+_PARAMS_PREFIX = "params:"
+# prefixes Kedro tries for dataset types that are not fully qualified
+_TYPE_PREFIXES = ("kedro.io.", "kedro_datasets.", "")
+# what Kedro creates for datasets missing from the catalog
+_DEFAULT_RUNTIME_PATTERNS = {"{default}": {_TYPE_KEY: "kedro.io.MemoryDataset"}}
+
+
+class DatasetInfoDict(TypedDict):
+    # "catalog" for explicit entries, "pattern" for dataset factories,
+    # "parameters", or "default" for datasets Kedro creates as MemoryDatasets
+    source: str
+    type: str | None
+    # fully qualified name of the dataset class, None if it cannot be imported
+    class_fqn: str | None
+    filepath: str | None
+    layer: str | None
+    params: Dict[str, Any]
+
+
+def _hide_credentials(value: Any) -> Any:
+    """Move credentials names out of Kedro's way, which would look them up, and
+    drop credentials written into the catalog, which are secrets."""
+    if not isinstance(value, dict):
+        return value
+    hidden = {}
+    for k, v in value.items():
+        if k == _CREDENTIALS_KEY:
+            hidden[_HIDDEN_CREDENTIALS_KEY] = v if isinstance(v, str) else None
+        else:
+            hidden[k] = _hide_credentials(v)
+    return hidden
+
+
+def _restore_credentials(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    return {
+        _CREDENTIALS_KEY if k == _HIDDEN_CREDENTIALS_KEY else k: _restore_credentials(v)
+        for k, v in value.items()
+    }
+
+
+def load_catalog_config(project_path: Path, env: str | None = None) -> Dict[str, Any]:
+    """The project's catalog config, as Kedro's config loader resolves it.
+
+    The project's settings are used if it was bootstrapped, the defaults
+    otherwise.
+    """
+    from kedro.framework.project import settings
+
+    conf_source = project_path / settings.CONF_SOURCE
+    if not conf_source.exists():
+        return {}
+    config_loader = settings.CONFIG_LOADER_CLASS(
+        conf_source=str(conf_source), env=env, **settings.CONFIG_LOADER_ARGS
+    )
+    try:
+        return dict(config_loader["catalog"])
+    except KeyError:
+        return {}
+
+
+class CatalogInspector:
+    """Metadata of datasets referenced by inspected nodes.
+
+    Dataset classes are imported only for the types of requested datasets, in
+    parallel, and each type is looked up once per inspector.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        resolve_classes: bool = True,
+        max_workers: int | None = None,
+    ) -> None:
+        self.resolve_classes = resolve_classes
+        self.max_workers = max_workers
+        # entries starting with an underscore are only used for interpolation
+        config = {k: v for k, v in config.items() if not k.startswith("_")}
+        self._resolver = CatalogConfigResolver(
+            {name: _hide_credentials(entry) for name, entry in config.items()},
+            default_runtime_patterns=_DEFAULT_RUNTIME_PATTERNS,
+        )
+        self._explicit = set(config)
+        self._classes: Dict[str, str | None] = {}
+
+    def inspect(self, datasets: Iterable[str]) -> Dict[str, DatasetInfoDict]:
+        """Metadata by dataset name, sorted by name."""
+        # Kedro warns about every dataset matching a catch-all pattern, which
+        # takes longer than resolving thousands of them
+        logger = logging.getLogger(CatalogConfigResolver.__module__)
+        level = logger.level
+        logger.setLevel(logging.ERROR)
+        try:
+            infos = {name: self._dataset_info(name) for name in sorted(set(datasets))}
+        finally:
+            logger.setLevel(level)
+        if self.resolve_classes:
+            types = [info["type"] for info in infos.values() if info["type"]]
+            self._lookup_classes(types)
+            for info in infos.values():
+                if info["type"]:
+                    info["class_fqn"] = self._classes[info["type"]]
+        return infos
+
+    def _dataset_info(self, name: str) -> DatasetInfoDict:
+        if name == _PARAMETERS or name.startswith(_PARAMS_PREFIX):
+            return {
+                "source": "parameters",
+                "type": None,
+                "class_fqn": None,
+                "filepath": None,
+                "layer": None,
+                "params": {},
+            }
+        if name in self._explicit:
+            source = "catalog"
+        elif self._resolver.match_dataset_pattern(
+            name
+        ) or self._resolver.match_user_catch_all_pattern(name):
+            source = "pattern"
+        else:
+            source = "default"
+        config = _restore_credentials(self._resolver.resolve_pattern(name))
+        dataset_type = config.pop(_TYPE_KEY, None)
+        metadata = config.pop(_METADATA_KEY, None) or {}
+        layer = (metadata.get("kedro-viz") or {}).get("layer")
+        filepath = config.pop(_FILEPATH_KEY, None)
+        return {
+            "source": source,
+            "type": (
+                dataset_type
+                if dataset_type is None or isinstance(dataset_type, str)
+                else obj_to_fqn(dataset_type)
+            ),
+            "class_fqn": None,
+            "filepath": None if filepath is None else str(filepath),
+            "layer": layer,
+            "params": config,
+        }
+
+    def _lookup_classes(self, types: Iterable[str]) -> None:
+        missing = [t for t in dict.fromkeys(types) if t not in self._classes]
+        # prefixes are tried in order like Kedro does, each for all types at once,
+        # so that no module is imported needlessly
+        for prefix in _TYPE_PREFIXES:
+            if not missing:
+                break
+            resolved, _ = resolve_fqns([prefix + t for t in missing], self.max_workers)
+            for dataset_type in missing:
+                found = resolved.get(prefix + dataset_type)
+                if isinstance(found, type):
+                    self._classes[dataset_type] = obj_to_fqn(found)
+            missing = [t for t in missing if t not in self._classes]
+        for dataset_type in missing:
+            self._classes[dataset_type] = None
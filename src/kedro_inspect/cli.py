@@ -1,29 +1,108 @@
 from __future__ import annotations
 
 import argparse
+import cProfile
+import io
 import json
+import os
 import sys
+import time
 from pathlib import Path
-from typing import Type
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
 
+import yaml
 from kedro.framework.project import pipelines
 from kedro.framework.startup import bootstrap_project
 
-from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect import profiling
+from kedro_inspect.analysis import (
+    COST_TAG_PREFIX,
+    DEFAULT_COST,
+    analyze_pipeline,
+    node_costs,
+    node_label,
+    summarise_analysis,
+)
+from kedro_inspect.batch import expand_projects, iter_batch, make_report
+from kedro_inspect.cache import DEFAULT_CACHE_DIR, InspectionCache
+from kedro_inspect.catalog import CatalogInspector, load_catalog_config
+from kedro_inspect.codec import CODECS, get_codec
+from kedro_inspect.diff import diff_pipelines, is_empty, summarise
+from kedro_inspect.introspection import introspection_cache
+from kedro_inspect.ndjson import dump_ndjson, iter_ndjson
+from kedro_inspect.node import InspectedNode
+from kedro_inspect.pipeline import InspectedPipeline, to_pipeline_dict
+from kedro_inspect.server import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    InspectionService,
+    make_server,
+    serve,
+)
+from kedro_inspect.static import StaticProject
+from kedro_inspect.stats import load_node_stats, merge_stats, stats_costs
+from kedro_inspect.typecheck import check_types
+from kedro_inspect.watch import DEFAULT_DEBOUNCE, DEFAULT_INTERVAL, Watcher
+
+if TYPE_CHECKING:
+    from kedro.pipeline.node import Node as KedroNode
+
+    from kedro_inspect.node import InspectedNodeDict
+    from kedro_inspect.pipeline import InspectedPipelineDict
+    from kedro_inspect.stats import NodeStatsDict
 
 
 class CliArgs(argparse.Namespace):
     """Used to typehint parsed CLI arguments."""
 
     project_path: Path
-    pipeline: str
+    pipeline: List[str] | None
+    all: bool
     indent: int | None
     output: Path | None
+    output_dir: Path | None
+    format: str
+    static: bool
+    no_cache: bool
+    cache_dir: Path | None
+    profile: bool
+    profile_top: int
+    profile_trace: Path | None
+    profile_cprofile: Path | None
+    check_types: bool
+    no_eval_hints: bool
+    catalog: bool
+    env: str | None
+    stats: Path | None
+    watch: bool
+    watch_interval: float
+    watch_debounce: float
+    tags: List[str] | None
+    namespaces: List[str] | None
+    nodes: List[str] | None
+    from_nodes: List[str] | None
+    to_outputs: List[str] | None
+    with_inputs: List[str] | None
+
+
+def _split(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
 
 
 def get_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Inspect a Kedro pipeline.",
+        description="Inspect a Kedro pipeline. "
+        "Run 'kedro-inspect diff -h' to compare two inspections, "
+        "'kedro-inspect serve -h' to answer queries from a long-running process, "
+        "'kedro-inspect batch -h' to inspect many projects in parallel.",
         formatter_class=argparse.ArgumentDefaultsHelpFormatter,
     )
     parser.add_argument("project_path", type=Path, help="path to the Kedro project")
@@ -31,58 +110,917 @@ def get_parser() -> argparse.ArgumentParser:
         "-p",
         "--pipeline",
         type=str,
-        help="name of the pipeline to inspect",
-        default="__default__",
+        action="append",
+        help="name of the pipeline to inspect, can be repeated; "
+        "__default__ if omitted",
+        default=None,
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="inspect all registered pipelines"
+    )
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="path to the output file; multiple pipelines are written as a single "
+        "document keyed by pipeline name",
+        required=False,
+    )
+    output.add_argument(
+        "--output-dir",
+        type=Path,
+        help="directory to write one file per pipeline into",
+        required=False,
+    )
+    selection = parser.add_argument_group(
+        "node selection",
+        "inspect only part of each pipeline; values are comma-separated and nodes "
+        "must match all given options",
+    )
+    selection.add_argument(
+        "--tags", type=_split, help="nodes with any of these tags", default=None
+    )
+    selection.add_argument(
+        "--namespaces",
+        type=_split,
+        help="nodes in these namespaces or namespaces nested in them",
+        default=None,
+    )
+    selection.add_argument(
+        "--nodes", type=_split, help="nodes with these names", default=None
+    )
+    selection.add_argument(
+        "--from-nodes",
+        type=_split,
+        help="these nodes and all nodes depending on them",
+        default=None,
+    )
+    selection.add_argument(
+        "--to-outputs",
+        type=_split,
+        help="nodes needed to produce these datasets",
+        default=None,
+    )
+    selection.add_argument(
+        "--with-inputs",
+        type=_split,
+        help="nodes that directly consume these datasets",
+        default=None,
     )
     parser.add_argument(
-        "-o", "--output", type=Path, help="path to the output file", required=False
+        "--format",
+        choices=[*CODECS, "ndjson"],
+        help="output format; ndjson writes one node per line as it is inspected, "
+        "compact is a binary format with a shared string table",
+        default="json",
     )
     parser.add_argument(
         "--indent", type=int, help="indentation for JSON output", default=None
     )
+    parser.add_argument(
+        "--static",
+        action="store_true",
+        help="parse the project's source code instead of importing it",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="do not reuse or store inspections of unchanged nodes",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=f"inspection cache directory; <project_path>/{DEFAULT_CACHE_DIR} "
+        "if omitted",
+        default=None,
+    )
+    parser.add_argument(
+        "--no-eval-hints",
+        action="store_true",
+        help="record string annotations as written instead of evaluating them",
+    )
+    parser.add_argument(
+        "--check-types",
+        action="store_true",
+        help="check that the return type of each dataset's producer is compatible "
+        "with the type hints of its consumers; exits with 1 on mismatches",
+    )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="add the type, filepath, layer and parameters of every dataset from "
+        "the catalog config, without instantiating datasets",
+    )
+    parser.add_argument(
+        "--env",
+        type=str,
+        help="Kedro configuration environment to read the catalog from with "
+        "--catalog; the project's default run environment if omitted",
+        default=None,
+    )
+    parser.add_argument(
+        "--stats",
+        type=Path,
+        help="add the runtime costs recorded by kedro_inspect.hooks.NodeStatsHook "
+        "in this directory to the nodes",
+        default=None,
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep running and rewrite --output whenever the project's source "
+        "files change, re-inspecting only affected nodes",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        help="seconds between checks for changed files with --watch",
+        default=DEFAULT_INTERVAL,
+    )
+    parser.add_argument(
+        "--watch-debounce",
+        type=float,
+        help="seconds changed files must stay unchanged before they are reloaded "
+        "with --watch",
+        default=DEFAULT_DEBOUNCE,
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print the time spent in each phase and the slowest nodes and "
+        "functions to stderr",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        help="number of slowest nodes and functions listed by --profile",
+        default=10,
+    )
+    parser.add_argument(
+        "--profile-trace",
+        type=Path,
+        help="write the --profile spans as a Chrome trace (chrome://tracing, "
+        "Perfetto) to this path",
+        default=None,
+    )
+    parser.add_argument(
+        "--profile-cprofile",
+        type=Path,
+        help="write cProfile statistics of the whole run to this path, "
+        "readable with pstats or snakeviz",
+        default=None,
+    )
     return parser
 
 
-def validate_args_before_bootstrap(args: Type[CliArgs]) -> None:
+def validate_args_before_bootstrap(args: CliArgs) -> None:
     if not args.project_path.is_dir():
         raise ValueError(f"Project path {args.project_path} is not a directory.")
     if not args.project_path.exists():
         raise ValueError(f"Project path {args.project_path} does not exist.")
-    if args.output is not None and args.output.exists():
+    if args.output is not None and args.output.exists() and not args.watch:
         raise ValueError(f"Output path {args.output} already exists.")
+    if args.output_dir is not None and args.output_dir.is_file():
+        raise ValueError(f"Output directory {args.output_dir} is a file.")
+    if args.all and args.pipeline:
+        raise ValueError("--all and --pipeline are mutually exclusive.")
+    if args.check_types and args.static:
+        raise ValueError("--check-types cannot be used with --static.")
+    if args.profile_top < 0:
+        raise ValueError("--profile-top must not be negative.")
+    if args.catalog and args.format == "ndjson":
+        raise ValueError("--catalog cannot be used with the ndjson format.")
+    if args.stats is not None and not args.stats.is_dir():
+        raise ValueError(f"Stats directory {args.stats} does not exist.")
+    if args.watch:
+        if args.output is None:
+            raise ValueError("--watch needs --output.")
+        if args.static or args.check_types:
+            raise ValueError("--watch cannot be used with --static or --check-types.")
+        if args.watch_interval <= 0 or args.watch_debounce < 0:
+            raise ValueError(
+                "--watch-interval must be positive, "
+                "--watch-debounce must not be negative."
+            )
+
+
+def validate_args_after_bootstrap(args: CliArgs) -> None:
+    for name in args.pipeline or []:
+        if name not in pipelines:
+            raise ValueError(
+                f"Pipeline {name} not found. Available pipelines: {list(pipelines)}"
+            )
+
+
+def get_pipeline_names(args: CliArgs, available: List[str]) -> List[str]:
+    if args.all:
+        return list(available)
+    return list(dict.fromkeys(args.pipeline or ["__default__"]))
+
+
+def has_selection(args: CliArgs) -> bool:
+    return any(
+        value is not None
+        for value in (
+            args.tags,
+            args.namespaces,
+            args.nodes,
+            args.from_nodes,
+            args.to_outputs,
+            args.with_inputs,
+        )
+    )
+
 
+def select_nodes(pipeline: InspectedPipeline, args: CliArgs) -> InspectedPipeline:
+    with profiling.span("cli.select_nodes"):
+        return pipeline.filter(
+            tags=args.tags,
+            from_nodes=args.from_nodes,
+            to_outputs=args.to_outputs,
+            node_names=args.nodes,
+            node_namespaces=args.namespaces,
+            with_inputs=args.with_inputs,
+        )
+
+
+def inspect_pipelines(
+    names: List[str],
+    disk_cache: InspectionCache | None = None,
+    node_cache: Dict[KedroNode, Tuple[KedroNode, InspectedNode]] | None = None,
+    select: Callable[[InspectedPipeline], InspectedPipeline] | None = None,
+) -> Iterator[Tuple[str, Iterator[InspectedNodeDict]]]:
+    """Inspect registered pipelines lazily, introspecting and serialising every
+    node only once even if it is shared between pipelines.
+
+    A single pipeline is streamed: unless a ``node_cache`` is given, each node
+    can be released once it is serialised. If given, ``select`` slices each
+    inspected pipeline, which then has to be inspected completely before its
+    first node is serialised.
+    """
+    shared = len(names) > 1
+    if node_cache is None and shared:
+        node_cache = {}
+    # the nodes are kept alive so that their ids are not reused
+    dict_cache: Dict[int, Tuple[InspectedNode, InspectedNodeDict]] = {}
+
+    def iter_nodes(name: str) -> Iterable[InspectedNode]:
+        nodes = InspectedPipeline.iter_kedro_nodes(
+            pipelines[name], node_cache, disk_cache
+        )
+        if select is None:
+            return nodes
+        return select(InspectedPipeline(list(nodes))).nodes
+
+    def iter_dicts(name: str) -> Iterator[InspectedNodeDict]:
+        for node in iter_nodes(name):
+            if not shared:
+                with profiling.span("cli.to_dict"):
+                    dct = node.to_dict()
+                yield dct
+                continue
+            if id(node) not in dict_cache:
+                with profiling.span("cli.to_dict"):
+                    dict_cache[id(node)] = (node, node.to_dict())
+            yield dict_cache[id(node)][1]
+
+    for name in names:
+        yield name, iter_dicts(name)
+
+
+def _write_encoded(
+    dct: InspectedPipelineDict, path: Path, codec: str, indent: int | None
+) -> Path:
+    with profiling.span("cli.encode"):
+        encoded = get_codec(codec, indent).encode(dct)
+    path.write_bytes(encoded)
+    return path
+
+
+def _write_ndjson(node_dicts: Iterable[InspectedNodeDict], path: Path) -> Path:
+    with path.open("w") as f:
+        dump_ndjson(node_dicts, f)
+    return path
+
+
+def pipeline_document(
+    node_dicts: Iterable[InspectedNodeDict], catalog: CatalogInspector | None = None
+) -> InspectedPipelineDict:
+    """Serialised pipeline, with the catalog metadata of its datasets if a
+    ``catalog`` is given."""
+    dct = to_pipeline_dict(node_dicts)
+    if catalog is not None:
+        with profiling.span("cli.catalog"):
+            dct["datasets"] = catalog.inspect(
+                dataset
+                for node in dct["nodes"]
+                for datasets in (node["inputs"], node["outputs"])
+                for dataset in InspectedNode.dataset_names(datasets)
+            )
+    return dct
 
-def validate_args_after_bootstrap(args: Type[CliArgs]) -> None:
-    if args.pipeline not in pipelines:
-        raise ValueError(
-            f"Pipeline {args.pipeline} not found. "
-            f"Available pipelines: {list(pipelines)}"
+
+def encode_output(
+    results: Iterable[Tuple[str, Iterable[InspectedNodeDict]]],
+    format: str,
+    indent: int | None,
+    combined: bool,
+    catalog: CatalogInspector | None = None,
+) -> bytes:
+    """Encode inspected pipelines as a single document."""
+    if format == "ndjson":
+        if combined:
+            raise ValueError("ndjson output of several pipelines needs --output-dir.")
+        ((_, node_dicts),) = results
+        buffer = io.StringIO()
+        dump_ndjson(node_dicts, buffer)
+        return buffer.getvalue().encode()
+    pipeline_dicts = {
+        name: pipeline_document(nodes, catalog) for name, nodes in results
+    }
+    dct = pipeline_dicts if combined else next(iter(pipeline_dicts.values()))
+    with profiling.span("cli.encode"):
+        return get_codec(format, indent).encode(dct)
+
+
+def write_output(
+    results: Iterable[Tuple[str, Iterable[InspectedNodeDict]]],
+    args: CliArgs,
+    combined: bool,
+    catalog: CatalogInspector | None = None,
+) -> None:
+    if args.output_dir is not None:
+        extension = (
+            args.format if args.format == "ndjson" else CODECS[args.format].extension
         )
+        # the pipelines are still inspected lazily, one at a time
+        results = list(results)
+        paths = [args.output_dir / f"{name}.{extension}" for name, _ in results]
+        # check all paths before writing anything
+        existing = [str(path) for path in paths if path.exists()]
+        if existing:
+            raise ValueError(f"Output paths already exist: {existing}")
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+        for (_, node_dicts), path in zip(results, paths):
+            if args.format == "ndjson":
+                _write_ndjson(node_dicts, path)
+            else:
+                dct = pipeline_document(node_dicts, catalog)
+                _write_encoded(dct, path, args.format, args.indent)
+        return
+
+    if args.format == "ndjson":
+        if combined:
+            raise ValueError("ndjson output of several pipelines needs --output-dir.")
+        ((_, node_dicts),) = results
+        if args.output:
+            _write_ndjson(node_dicts, args.output)
+        else:
+            dump_ndjson(node_dicts, sys.stdout)
+        return
+
+    encoded = encode_output(results, args.format, args.indent, combined, catalog)
+    if args.output:
+        Path(args.output).write_bytes(encoded)
+    else:
+        sys.stdout.buffer.write(encoded + b"\n")
+        sys.stdout.flush()
+
+
+class DiffArgs(argparse.Namespace):
+    """Used to typehint parsed arguments of the diff subcommand."""
+
+    old: Path
+    new: Path
+    indent: int | None
+    summary: bool
+
+
+def get_diff_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kedro-inspect diff",
+        description="Compare two inspections of a pipeline. Exits with 1 if they "
+        "differ.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("old", type=Path, help="path to the old inspection")
+    parser.add_argument("new", type=Path, help="path to the new inspection")
+    parser.add_argument(
+        "--indent", type=int, help="indentation for JSON output", default=None
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="print one line per change instead of JSON",
+    )
+    return parser
+
+
+def load_inspection(path: Path) -> InspectedPipelineDict:
+    """Read an inspection written in any of the output formats."""
+    if path.suffix == ".ndjson":
+        with path.open() as f:
+            return {"nodes": list(iter_ndjson(f))}
+    for codec in CODECS.values():
+        if path.suffix == f".{codec.extension}":
+            return codec().decode(path.read_bytes())
+    return get_codec("json").decode(path.read_bytes())
+
+
+def diff_main(argv: List[str]) -> int:
+    args = get_diff_parser().parse_args(argv, namespace=DiffArgs())
+    diff = diff_pipelines(load_inspection(args.old), load_inspection(args.new))
+    if args.summary:
+        for line in summarise(diff):
+            print(line)
+    else:
+        sys.stdout.buffer.write(get_codec("json", args.indent).encode(diff) + b"\n")
+        sys.stdout.flush()
+    return 0 if is_empty(diff) else 1
+
+
+class ServeArgs(argparse.Namespace):
+    """Used to typehint parsed arguments of the serve subcommand."""
+
+    project_path: Path
+    host: str
+    port: int
+    socket: Path | None
+    verbose: bool
+
+
+def get_serve_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kedro-inspect serve",
+        description="Bootstrap a Kedro project once and answer inspection queries "
+        "over HTTP: GET /pipelines, /pipelines/<name>, "
+        "/pipelines/<name>/nodes/<node>, /pipelines/<name>/datasets/<dataset>, "
+        "/status and POST /reload. Modules whose files change are reloaded before "
+        "the next query.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("project_path", type=Path, help="path to the Kedro project")
+    parser.add_argument(
+        "--host", type=str, help="address to bind", default=DEFAULT_HOST
+    )
+    parser.add_argument("--port", type=int, help="port to bind", default=DEFAULT_PORT)
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        help="serve on this Unix socket instead of a TCP port",
+        default=None,
+    )
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    return parser
 
 
-def main() -> int:
+def serve_main(argv: List[str]) -> int:
+    args = get_serve_parser().parse_args(argv, namespace=ServeArgs())
+    if not args.project_path.is_dir():
+        raise ValueError(f"Project path {args.project_path} is not a directory.")
+    service = InspectionService(args.project_path.resolve())
+    server = make_server(service, args.host, args.port, args.socket, args.verbose)
+    address = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"Serving inspections of {args.project_path} on {address}", file=sys.stderr)
+    serve(server)
+    return 0
+
+
+class BatchArgs(argparse.Namespace):
+    """Used to typehint parsed arguments of the batch subcommand."""
+
+    projects: List[str]
+    pipeline: List[str] | None
+    all: bool
+    jobs: int
+    output: Path | None
+    indent: int | None
+    static: bool
+    no_cache: bool
+    no_eval_hints: bool
+
+
+def get_batch_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kedro-inspect batch",
+        description="Inspect many Kedro projects in parallel, each in a fresh "
+        "process, and write a combined report with the inspections, timing and "
+        "error of every project. Exits with 1 if any project failed.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "projects",
+        nargs="+",
+        help="paths to Kedro projects or glob patterns matching them",
+    )
+    parser.add_argument(
+        "-p",
+        "--pipeline",
+        type=str,
+        action="append",
+        help="name of the pipeline to inspect, can be repeated; "
+        "__default__ if omitted",
+        default=None,
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="inspect all registered pipelines"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="number of projects inspected at the same time",
+        default=os.cpu_count() or 1,
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path, help="path to the report file", default=None
+    )
+    parser.add_argument(
+        "--indent", type=int, help="indentation for JSON output", default=None
+    )
+    parser.add_argument(
+        "--static",
+        action="store_true",
+        help="parse the projects' source code instead of importing it",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="do not reuse or store inspections of unchanged nodes",
+    )
+    parser.add_argument(
+        "--no-eval-hints",
+        action="store_true",
+        help="record string annotations as written instead of evaluating them",
+    )
+    return parser
+
+
+def batch_main(argv: List[str]) -> int:
+    args = get_batch_parser().parse_args(argv, namespace=BatchArgs())
+    if args.all and args.pipeline:
+        raise ValueError("--all and --pipeline are mutually exclusive.")
+    if args.jobs < 1:
+        raise ValueError("--jobs must be at least 1.")
+    if args.output is not None and args.output.exists():
+        raise ValueError(f"Output path {args.output} already exists.")
+    paths = expand_projects(args.projects)
+    if not paths:
+        raise ValueError(f"No Kedro projects match {args.projects}.")
+
+    start = time.perf_counter()
+    results = []
+    for result in iter_batch(
+        paths,
+        min(args.jobs, len(paths)),
+        pipeline_names=None if args.all else args.pipeline or ["__default__"],
+        static=args.static,
+        use_cache=not args.no_cache,
+        evaluate_hints=not args.no_eval_hints,
+    ):
+        results.append(result)
+        status = "failed" if result["error"] else "ok"
+        print(
+            f"[{len(results)}/{len(paths)}] {result['project']}: {status} "
+            f"in {result['seconds']:.2f}s",
+            file=sys.stderr,
+        )
+        if result["error"]:
+            print(result["error"], file=sys.stderr)
+
+    report = make_report(results, time.perf_counter() - start)
+    encoded = get_codec("json", args.indent).encode(report)
+    if args.output:
+        args.output.write_bytes(encoded)
+    else:
+        sys.stdout.buffer.write(encoded + b"\n")
+        sys.stdout.flush()
+    return 1 if report["n_failed"] else 0
+
+
+class AnalyzeArgs(argparse.Namespace):
+    """Used to typehint parsed arguments of the analyze subcommand."""
+
+    inspection: Path
+    costs: Path | None
+    stats: Path | None
+    cost_tag_prefix: str
+    default_cost: float
+    workers: List[int]
+    levels: bool
+    indent: int | None
+    summary: bool
+
+
+def _split_ints(value: str) -> List[int]:
+    return [int(item) for item in _split(value)]
+
+
+def get_analyze_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="kedro-inspect analyze",
+        description="Analyse the dependency graph of an inspected pipeline: its "
+        "levels, maximum width, critical path and the estimated makespan for a "
+        "number of workers, given per-node costs.",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument("inspection", type=Path, help="path to the inspection")
+    parser.add_argument(
+        "--costs",
+        type=Path,
+        help="JSON or YAML file mapping namespaced node names to costs",
+        default=None,
+    )
+    parser.add_argument(
+        "--stats",
+        type=Path,
+        help="directory of runtime costs recorded by "
+        "kedro_inspect.hooks.NodeStatsHook, mean seconds are used as costs of "
+        "nodes missing from --costs",
+        default=None,
+    )
+    parser.add_argument(
+        "--cost-tag-prefix",
+        type=str,
+        help="prefix of node tags giving a cost, e.g. cost_2.5; empty to ignore tags",
+        default=COST_TAG_PREFIX,
+    )
+    parser.add_argument(
+        "--default-cost",
+        type=float,
+        help="cost of nodes without a cost",
+        default=DEFAULT_COST,
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=_split_ints,
+        help="comma-separated numbers of workers to estimate the makespan for",
+        default=[1, 2, 4, 8, 16],
+    )
+    parser.add_argument(
+        "--levels", action="store_true", help="list the nodes of every level"
+    )
+    parser.add_argument(
+        "--indent", type=int, help="indentation for JSON output", default=None
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="print a human-readable summary instead of JSON",
+    )
+    return parser
+
+
+def load_costs(path: Path) -> Dict[str, float]:
+    if path.suffix in (".yml", ".yaml"):
+        costs = yaml.safe_load(path.read_text())
+    else:
+        costs = get_codec("json").decode(path.read_bytes())
+    if not isinstance(costs, dict):
+        raise ValueError(f"Costs file {path} must map node names to costs.")
+    return costs
+
+
+def analyze_main(argv: List[str]) -> int:
+    args = get_analyze_parser().parse_args(argv, namespace=AnalyzeArgs())
+    if any(n_workers < 1 for n_workers in args.workers):
+        raise ValueError("--workers must be at least 1.")
+    pipeline = InspectedPipeline.from_dict(load_inspection(args.inspection), lazy=True)
+    # the stats may cover nodes of other pipelines, the costs file should not
+    costs = stats_costs(load_node_stats(args.stats)) if args.stats else {}
+    if args.costs:
+        file_costs = load_costs(args.costs)
+        unknown = file_costs.keys() - {node_label(node) for node in pipeline.nodes}
+        if unknown:
+            print(
+                f"Ignoring costs of unknown nodes: {sorted(unknown)}", file=sys.stderr
+            )
+        costs.update(file_costs)
+    analysis = analyze_pipeline(
+        pipeline,
+        node_costs(pipeline, costs, args.cost_tag_prefix, args.default_cost),
+        args.workers,
+        args.levels,
+    )
+    if args.summary:
+        for line in summarise_analysis(analysis):
+            print(line)
+    else:
+        sys.stdout.buffer.write(get_codec("json", args.indent).encode(analysis) + b"\n")
+        sys.stdout.flush()
+    return 0
+
+
+SUBCOMMANDS = {
+    "diff": diff_main,
+    "serve": serve_main,
+    "batch": batch_main,
+    "analyze": analyze_main,
+}
+
+
+def main(argv: List[str] | None = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+
     parser = get_parser()
-    if len(sys.argv) == 1:
+    if not argv:
         parser.print_help(sys.stderr)
         return 1
 
-    args = parser.parse_args(namespace=CliArgs)
+    args = parser.parse_args(argv, namespace=CliArgs())
     validate_args_before_bootstrap(args)
 
-    path = args.project_path.resolve()
-    _ = bootstrap_project(path)
+    if not (args.profile or args.profile_trace or args.profile_cprofile):
+        return run(args)
+
+    profiler = profiling.enable(trace=args.profile_trace is not None)
+    cprofiler = cProfile.Profile() if args.profile_cprofile else None
+    if cprofiler is not None:
+        cprofiler.enable()
+    try:
+        with profiler.span("cli.main"):
+            return run(args)
+    finally:
+        if cprofiler is not None:
+            cprofiler.disable()
+            cprofiler.dump_stats(args.profile_cprofile)
+        profiling.disable()
+        write_profile(profiler, args)
+
+
+def get_catalog(args: CliArgs) -> CatalogInspector | None:
+    if not args.catalog:
+        return None
+    with profiling.span("cli.catalog_config"):
+        config = load_catalog_config(args.project_path.resolve(), args.env)
+    return CatalogInspector(config)
+
+
+def with_stats(
+    results: Iterable[Tuple[str, Iterable[InspectedNodeDict]]],
+    stats: Dict[str, NodeStatsDict] | None,
+) -> Iterable[Tuple[str, Iterable[InspectedNodeDict]]]:
+    """Merge recorded runtime costs into the nodes of inspected pipelines."""
+    if not stats:
+        return results
+    return ((name, merge_stats(node_dicts, stats)) for name, node_dicts in results)
+
+
+def get_stats(args: CliArgs) -> Dict[str, NodeStatsDict] | None:
+    return None if args.stats is None else load_node_stats(args.stats)
+
+
+def run_watch(args: CliArgs) -> int:
+    introspection_cache.resolver.evaluate = not args.no_eval_hints
+    service = InspectionService(args.project_path.resolve())
     validate_args_after_bootstrap(args)
+    names = get_pipeline_names(args, list(pipelines))
+    combined = args.all or len(names) > 1
+    catalog = get_catalog(args)
+    stats = get_stats(args)
+    watcher = Watcher(
+        service,
+        names,
+        args.output,
+        lambda results: encode_output(
+            with_stats(results.items(), stats),
+            args.format,
+            args.indent,
+            combined,
+            catalog,
+        ),
+        (lambda p: select_nodes(p, args)) if has_selection(args) else None,
+        args.watch_debounce,
+    )
+    watcher.write()
+    print(
+        f"Wrote {args.output}, watching {service.reloader.source_dir} for changes",
+        file=sys.stderr,
+    )
+    try:
+        watcher.run(args.watch_interval)
+    except KeyboardInterrupt:
+        print("Stopped watching.", file=sys.stderr)
+    return 0
 
-    pipe = pipelines[args.pipeline]
-    inspected = InspectedPipeline.from_kedro_pipeline(pipe)
-    js = json.dumps(inspected.to_dict(), indent=args.indent)
-    if args.output:
-        Path(args.output).write_text(js)
+
+def run(args: CliArgs) -> int:
+    path = args.project_path.resolve()
+    if args.watch:
+        return run_watch(args)
+    if args.static:
+        with profiling.span("cli.static_inspect"):
+            project = StaticProject(path)
+            names = get_pipeline_names(args, list(project.pipelines))
+            combined = args.all or len(names) > 1
+            results = [
+                (name, iter(_static_nodes(project, name, args))) for name in names
+            ]
+        for warning in project.warnings:
+            print(f"WARNING: {warning}", file=sys.stderr)
+        with profiling.span("cli.write_output"):
+            write_output(
+                with_stats(results, get_stats(args)), args, combined, get_catalog(args)
+            )
     else:
-        print(js)
+        introspection_cache.resolver.evaluate = not args.no_eval_hints
+        with profiling.span("cli.bootstrap_project"):
+            _ = bootstrap_project(path)
+        with profiling.span("cli.pipeline_registry"):
+            validate_args_after_bootstrap(args)
+            names = get_pipeline_names(args, list(pipelines))
+        combined = args.all or len(names) > 1
+        disk_cache = None
+        if not args.no_cache:
+            disk_cache = InspectionCache(args.cache_dir or path / DEFAULT_CACHE_DIR)
+        # the type check inspects the pipelines again
+        node_cache: Dict[KedroNode, Tuple[KedroNode, InspectedNode]] | None = (
+            {} if len(names) > 1 or args.check_types else None
+        )
+        with profiling.span("cli.write_output"):
+            select = (lambda p: select_nodes(p, args)) if has_selection(args) else None
+            write_output(
+                with_stats(
+                    inspect_pipelines(names, disk_cache, node_cache, select),
+                    get_stats(args),
+                ),
+                args,
+                combined,
+                get_catalog(args),
+            )
+        for (
+            module,
+            annotation,
+        ), error in introspection_cache.resolver.failures.items():
+            print(
+                f"WARNING: could not evaluate annotation {annotation!r} in module "
+                f"{module} ({error}), recorded it as written",
+                file=sys.stderr,
+            )
+        if args.check_types:
+            with profiling.span("cli.check_types"):
+                n_mismatches = report_type_mismatches(names, node_cache, select)
+        if disk_cache is not None:
+            with profiling.span("cli.save_cache"):
+                disk_cache.save()
+            print(
+                f"Inspection cache: reused {disk_cache.hits} of "
+                f"{disk_cache.hits + disk_cache.misses} nodes",
+                file=sys.stderr,
+            )
+        if args.check_types and n_mismatches:
+            return 1
 
     return 0
 
 
+def _static_nodes(
+    project: StaticProject, name: str, args: CliArgs
+) -> List[InspectedNodeDict]:
+    dct = project.inspect(name)
+    if not has_selection(args):
+        return dct["nodes"]
+    # lazily, so that the project is still not imported
+    pipeline = InspectedPipeline.from_dict(dct, lazy=True)
+    return list(select_nodes(pipeline, args).iter_dicts())
+
+
+def report_type_mismatches(
+    names: List[str],
+    node_cache: Dict[KedroNode, Tuple[KedroNode, InspectedNode]] | None,
+    select: Callable[[InspectedPipeline], InspectedPipeline] | None = None,
+) -> int:
+    """Print type mismatches between producers and consumers of datasets to
+    stderr and return their number."""
+    n_mismatches = 0
+    for name in names:
+        pipeline = InspectedPipeline.from_kedro_pipeline(pipelines[name], node_cache)
+        if select is not None:
+            pipeline = select(pipeline)
+        for mismatch in check_types(pipeline):
+            n_mismatches += 1
+            print(
+                f"TYPE MISMATCH in pipeline {name}: dataset {mismatch['dataset']!r} "
+                f"is {mismatch['provided']} from node {mismatch['producer']!r}, "
+                f"but parameter {mismatch['parameter']!r} of node "
+                f"{mismatch['consumer']!r} expects {mismatch['expected']}",
+                file=sys.stderr,
+            )
+    return n_mismatches
+
+
+def write_profile(profiler: profiling.Profiler, args: CliArgs) -> None:
+    if args.profile:
+        for line in profiler.report(args.profile_top):
+            print(line, file=sys.stderr)
+    if args.profile_trace is not None:
+        args.profile_trace.write_text(json.dumps(profiler.chrome_trace()))
+
+
 if __name__ == "__main__":
     sys.exit(main())
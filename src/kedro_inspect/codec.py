@@ -0,0 +1,271 @@
+"""Encoders and decoders for ``InspectedPipelineDict`` documents.
+
+``json`` uses orjson or msgspec when installed and falls back to the standard
+library; all backends produce the same bytes for a given indentation.
+``compact`` is a binary format that stores every distinct string (kinds, FQNs,
+dataset names, ...) once in a string table and refers to it by index.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import struct
+from typing import Any, Dict, List, Tuple, Type
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover
+    msgspec = None
+
+
+class Codec:
+    name: str
+    extension: str
+
+    def encode(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+    def decode(self, data: bytes) -> Any:
+        raise NotImplementedError
+
+
+# a string, which is left as is, or a number as formatted by the json module
+_STRING_OR_NUMBER = re.compile(
+    rb'"[^"\\]*(?:\\.[^"\\]*)*"|(-?)(\d+)(?:\.(\d+))?(?:e([+-]\d+))?'
+)
+
+
+def _format_float(match: re.Match[bytes]) -> bytes:
+    """Reformat a float from ``float.__repr__`` notation to the one of orjson and
+    msgspec, which use exponents from 1e16 up and below 1e-5, e.g. 1e-05 is
+    0.00001 and 1e+16 is 1e16."""
+    sign, integer, fraction, exponent = match.groups()
+    if integer is None or (fraction is None and exponent is None):
+        return match.group()
+    mantissa = integer + (fraction or b"")
+    digits = mantissa.lstrip(b"0")
+    # position of the decimal point relative to the first significant digit
+    point = len(integer) - (len(mantissa) - len(digits)) + int(exponent or 0)
+    digits = digits.rstrip(b"0")
+    if not digits:
+        return sign + b"0.0"
+    n_digits = len(digits)
+    if n_digits <= point <= 16:
+        return sign + digits + b"0" * (point - n_digits) + b".0"
+    if 0 < point <= 16:
+        return sign + digits[:point] + b"." + digits[point:]
+    if -5 < point <= 0:
+        return sign + b"0." + b"0" * -point + digits
+    if n_digits > 1:
+        digits = digits[:1] + b"." + digits[1:]
+    return sign + digits + b"e" + str(point - 1).encode()
+
+
+class JsonCodec(Codec):
+    """JSON with orjson, msgspec or the json module as backend.
+
+    orjson only supports an indentation of 2. The output of the json module is
+    reformatted to match the other backends, which is slower.
+    """
+
+    name = "json"
+    extension = "json"
+
+    def __init__(self, indent: int | None = None, backend: str | None = None) -> None:
+        self.indent = indent
+        self.backend = backend or self.default_backend(indent)
+        if self.backend == "orjson" and orjson is None:
+            raise ImportError("orjson is not installed.")
+        if self.backend == "msgspec" and msgspec is None:
+            raise ImportError("msgspec is not installed.")
+        if indent is not None and indent < 1:
+            raise ValueError(f"Invalid indent {indent}, must be at least 1.")
+        if self.backend == "orjson" and indent not in (None, 2):
+            raise ValueError(f"orjson does not support an indent of {indent}.")
+
+    @staticmethod
+    def default_backend(indent: int | None) -> str:
+        if orjson is not None and indent in (None, 2):
+            return "orjson"
+        if msgspec is not None:
+            return "msgspec"
+        return "json"
+
+    def encode(self, obj: Any) -> bytes:
+        if self.backend == "orjson":
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if self.indent else 0)
+        if self.backend == "msgspec":
+            data = msgspec.json.encode(obj)
+            return (
+                data
+                if self.indent is None
+                else msgspec.json.format(data, indent=self.indent)
+            )
+        data = json.dumps(
+            obj,
+            indent=self.indent,
+            ensure_ascii=False,
+            separators=(",", ":") if self.indent is None else None,
+        ).encode()
+        return _STRING_OR_NUMBER.sub(_format_float, data)
+
+    def decode(self, data: bytes) -> Any:
+        if self.backend == "orjson":
+            return orjson.loads(data)
+        if self.backend == "msgspec":
+            return msgspec.json.decode(data)
+        return json.loads(data)
+
+
+_MAGIC = b"KIC\x01"
+_NONE, _FALSE, _TRUE, _INT, _STR, _LIST, _DICT, _FLOAT = range(8)
+_DOUBLE = struct.Struct("<d")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class CompactCodec(Codec):
+    """Binary encoding of JSON-like values with a shared string table.
+
+    Layout: magic, number of strings, each string as length-prefixed UTF-8, then
+    the tagged value tree in which strings (including dict keys) are indices.
+    """
+
+    name = "compact"
+    extension = "kic"
+
+    def encode(self, obj: Any) -> bytes:
+        strings: Dict[str, int] = {}
+        body = bytearray()
+
+        def intern(s: str) -> int:
+            idx = strings.get(s)
+            if idx is None:
+                idx = strings[s] = len(strings)
+            return idx
+
+        def write(value: Any) -> None:
+            if value is None:
+                body.append(_NONE)
+            elif value is True:
+                body.append(_TRUE)
+            elif value is False:
+                body.append(_FALSE)
+            elif isinstance(value, str):
+                body.append(_STR)
+                _write_varint(body, intern(value))
+            elif isinstance(value, int):
+                body.append(_INT)
+                # zigzag encoding so that negative numbers stay small, for ints
+                # of any size
+                _write_varint(body, value << 1 if value >= 0 else (-value << 1) - 1)
+            elif isinstance(value, float):
+                body.append(_FLOAT)
+                body.extend(_DOUBLE.pack(value))
+            elif isinstance(value, (list, tuple)):
+                body.append(_LIST)
+                _write_varint(body, len(value))
+                for item in value:
+                    write(item)
+            elif isinstance(value, dict):
+                body.append(_DICT)
+                _write_varint(body, len(value))
+                for key, item in value.items():
+                    _write_varint(body, intern(key))
+                    write(item)
+            else:
+                raise TypeError(f"Cannot encode {type(value)}")
+
+        write(obj)
+
+        out = bytearray(_MAGIC)
+        _write_varint(out, len(strings))
+        for s in strings:
+            encoded = s.encode()
+            _write_varint(out, len(encoded))
+            out.extend(encoded)
+        out.extend(body)
+        return bytes(out)
+
+    def decode(self, data: bytes) -> Any:
+        if data[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("Not a compact kedro-inspect document.")
+        pos = len(_MAGIC)
+        n_strings, pos = _read_varint(data, pos)
+        strings: List[str] = []
+        for _ in range(n_strings):
+            length, pos = _read_varint(data, pos)
+            strings.append(data[pos : pos + length].decode())
+            pos += length
+
+        def read(pos: int) -> Tuple[Any, int]:
+            tag = data[pos]
+            pos += 1
+            if tag == _STR:
+                idx, pos = _read_varint(data, pos)
+                return strings[idx], pos
+            if tag == _LIST:
+                length, pos = _read_varint(data, pos)
+                items = []
+                for _ in range(length):
+                    item, pos = read(pos)
+                    items.append(item)
+                return items, pos
+            if tag == _DICT:
+                length, pos = _read_varint(data, pos)
+                dct = {}
+                for _ in range(length):
+                    idx, pos = _read_varint(data, pos)
+                    dct[strings[idx]], pos = read(pos)
+                return dct, pos
+            if tag == _NONE:
+                return None, pos
+            if tag == _TRUE:
+                return True, pos
+            if tag == _FALSE:
+                return False, pos
+            if tag == _INT:
+                value, pos = _read_varint(data, pos)
+                return (value >> 1) ^ -(value & 1), pos
+            if tag == _FLOAT:
+                return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+            raise ValueError(f"Unknown tag {tag} at offset {pos - 1}.")
+
+        value, _ = read(pos)
+        return value
+
+
+CODECS: Dict[str, Type[Codec]] = {
+    JsonCodec.name: JsonCodec,
+    CompactCodec.name: CompactCodec,
+}
+
+
+def get_codec(name: str, indent: int | None = None) -> Codec:
+    if name not in CODECS:
+        raise ValueError(f"Unknown codec {name}. Available codecs: {list(CODECS)}")
+    if name == JsonCodec.name:
+        return JsonCodec(indent=indent)
+    return CODECS[name]()
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
+
+from typing_extensions import TypedDict
+
+from kedro_inspect.node import InspectedNode
+from kedro_inspect.serialisation import inline_types
+
+if TYPE_CHECKING:
+    from kedro_inspect.node import Datasets, FrozenDatasets, InspectedNodeDict
+    from kedro_inspect.pipeline import InspectedPipelineDict
+
+_FUNCTION_FIELDS = ("func", "parameters", "return_value")
+_NODE_FIELDS = (
+    "name",
+    "namespace",
+    "tags",
+    "confirms",
+    "inputs",
+    "outputs",
+    "param_to_input",
+)
+
+
+class FieldChangeDict(TypedDict):
+    old: Any
+    new: Any
+
+
+class NodeChangeDict(TypedDict):
+    node: str
+    fields: Dict[str, FieldChangeDict]
+
+
+class PipelineDiffDict(TypedDict):
+    added_nodes: List[str]
+    removed_nodes: List[str]
+    changed_nodes: List[NodeChangeDict]
+    added_datasets: List[str]
+    removed_datasets: List[str]
+
+
+def unnamed_node_key(
+    namespace: str | None,
+    func: str,
+    inputs: Datasets | FrozenDatasets,
+    outputs: Datasets | FrozenDatasets,
+) -> str:
+    """Key of an unnamed node from its function's FQN and datasets."""
+    ins = ";".join(InspectedNode.dataset_names(inputs))
+    outs = ";".join(InspectedNode.dataset_names(outputs))
+    name = f"{func}([{ins}]) -> [{outs}]"
+    return f"{namespace}.{name}" if namespace else name
+
+
+def node_key(dct: InspectedNodeDict) -> str:
+    """Identify a node across inspections by its namespace and name.
+
+    Unnamed nodes are identified by their function and datasets instead, so
+    changing any of them shows up as a removal plus an addition.
+    """
+    name = dct["name"]
+    if name is None:
+        return unnamed_node_key(
+            dct["namespace"], dct["function"]["func"], dct["inputs"], dct["outputs"]
+        )
+    return f"{dct['namespace']}.{name}" if dct["namespace"] else name
+
+
+def _keyed_nodes(nodes: List[InspectedNodeDict]) -> Dict[str, InspectedNodeDict]:
+    keyed = {}
+    seen: Counter[str] = Counter()
+    for node in nodes:
+        key = node_key(node)
+        seen[key] += 1
+        if seen[key] > 1:
+            # duplicated keys are matched by order of appearance
+            key = f"{key}#{seen[key]}"
+        keyed[key] = node
+    return keyed
+
+
+def _datasets(nodes: Dict[str, InspectedNodeDict]) -> Set[str]:
+    return {
+        ds
+        for node in nodes.values()
+        for ds in (
+            *InspectedNode.dataset_names(node["inputs"]),
+            *InspectedNode.dataset_names(node["outputs"]),
+        )
+    }
+
+
+def _changed_fields(
+    old: InspectedNodeDict, new: InspectedNodeDict
+) -> Dict[str, FieldChangeDict]:
+    changes: Dict[str, FieldChangeDict] = {}
+
+    def compare(field: str, old_value: Any, new_value: Any) -> None:
+        if old_value != new_value:
+            changes[field] = {"old": old_value, "new": new_value}
+
+    for field in _NODE_FIELDS:
+        if field == "tags":
+            compare(field, sorted(old[field]), sorted(new[field]))
+        else:
+            compare(field, old[field], new[field])
+    for field in _FUNCTION_FIELDS:
+        compare(f"function.{field}", old["function"][field], new["function"][field])
+    return changes
+
+
+def diff_pipelines(
+    old: InspectedPipelineDict, new: InspectedPipelineDict
+) -> PipelineDiffDict:
+    """Structural diff of two inspections in time linear in the number of nodes.
+
+    Matched nodes are compared as a whole first, which stops at the first
+    difference; only nodes that differ are compared field by field.
+    """
+    old_nodes = _keyed_nodes(inline_types(old))
+    new_nodes = _keyed_nodes(inline_types(new))
+
+    changed: List[NodeChangeDict] = []
+    for key, new_node in new_nodes.items():
+        old_node = old_nodes.get(key)
+        if old_node is None or old_node == new_node:
+            continue
+        fields = _changed_fields(old_node, new_node)
+        if fields:
+            changed.append({"node": key, "fields": fields})
+
+    old_datasets = _datasets(old_nodes)
+    new_datasets = _datasets(new_nodes)
+    return {
+        "added_nodes": [k for k in new_nodes if k not in old_nodes],
+        "removed_nodes": [k for k in old_nodes if k not in new_nodes],
+        "changed_nodes": changed,
+        "added_datasets": sorted(new_datasets - old_datasets),
+        "removed_datasets": sorted(old_datasets - new_datasets),
+    }
+
+
+def is_empty(diff: PipelineDiffDict) -> bool:
+    return not any(diff.values())
+
+
+def summarise(diff: PipelineDiffDict) -> List[str]:
+    lines: List[Tuple[str, str]] = []
+    lines += [("+", f"node {key}") for key in diff["added_nodes"]]
+    lines += [("-", f"node {key}") for key in diff["removed_nodes"]]
+    lines += [
+        ("~", f"node {change['node']}: {', '.join(change['fields'])}")
+        for change in diff["changed_nodes"]
+    ]
+    lines += [("+", f"dataset {ds}") for ds in diff["added_datasets"]]
+    lines += [("-", f"dataset {ds}") for ds in diff["removed_datasets"]]
+    return [f"{sign} {text}" for sign, text in lines]
@@ -0,0 +1,189 @@
+"""Kedro hook recording the runtime costs of nodes.
+
+Register it in the project's ``settings.py``::
+
+    from kedro_inspect.hooks import NodeStatsHook
+
+    HOOKS = (NodeStatsHook(),)
+
+and merge the stats into inspections with ``kedro-inspect --stats``.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Set, Tuple
+
+from kedro.framework.hooks import hook_impl
+
+from kedro_inspect.analysis import node_label
+from kedro_inspect.node import InspectedNode
+from kedro_inspect.stats import (
+    DEFAULT_STATS_DIR,
+    NodeRunDict,
+    aggregate_runs,
+    append_run,
+    data_size,
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from kedro.pipeline.node import Node as KedroNode
+
+
+class NodeStatsHook:
+    """Records the wall time, peak memory and output sizes of every node run.
+
+    Peak memory is how much a node raised the peak resident memory of its
+    process, which is 0 if it stayed below an earlier peak, so it only costs a
+    system call. With ``trace_memory``, it is the peak of the Python allocations
+    during the node instead, which is precise but slows down allocations. Nodes
+    run concurrently in threads share one process, so their memory is not told
+    apart.
+
+    A run is appended to the stats in ``directory`` once all outputs of the
+    node are saved, by whichever process ran it; runs are aggregated when the
+    pipeline run ends. A relative ``directory`` is relative to the working
+    directory when the hook is created.
+    """
+
+    def __init__(
+        self, directory: Path | str = DEFAULT_STATS_DIR, trace_memory: bool = False
+    ) -> None:
+        self.directory = Path(directory).resolve()
+        self.trace_memory = trace_memory
+        self._lock = threading.Lock()
+        self._labels: Dict[KedroNode, str] = {}
+        # start time and memory of running nodes
+        self._started: Dict[str, Tuple[float, int | None]] = {}
+        # runs waiting for their outputs to be saved
+        self._runs: Dict[str, NodeRunDict] = {}
+        self._unsaved: Dict[str, Set[str]] = {}
+
+    def _label(self, node: KedroNode) -> str:
+        label = self._labels.get(node)
+        if label is None:
+            if node._name is not None:
+                label = node.name
+            else:
+                try:
+                    label = node_label(InspectedNode.from_kedro_node(node))
+                except Exception:  # noqa: BLE001 - never fail a run for stats
+                    label = node.name
+            self._labels[node] = label
+        return label
+
+    def _memory(self) -> int | None:
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            return tracemalloc.get_traced_memory()[0]
+        if resource is None:
+            return None
+        # kilobytes on Linux, bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    def _peak_memory(self, start: int | None) -> int | None:
+        if start is None:
+            return None
+        if self.trace_memory:
+            return max(tracemalloc.get_traced_memory()[1] - start, 0)
+        end = self._memory()
+        return None if end is None else end - start
+
+    @hook_impl
+    def before_node_run(self, node: KedroNode) -> None:
+        label = self._label(node)
+        memory = self._memory()
+        if self.trace_memory and hasattr(tracemalloc, "reset_peak"):
+            # Python 3.9+, the peak is since tracing started otherwise
+            tracemalloc.reset_peak()
+        with self._lock:
+            self._started[label] = (time.perf_counter(), memory)
+
+    @hook_impl
+    def after_node_run(self, node: KedroNode) -> None:
+        end = time.perf_counter()
+        label = self._label(node)
+        with self._lock:
+            start, memory = self._started.pop(label)
+        run: NodeRunDict = {
+            "node": label,
+            "time": time.time(),
+            "seconds": end - start,
+            "peak_memory": self._peak_memory(memory),
+            "output_bytes": {},
+        }
+        with self._lock:
+            self._runs[label] = run
+            self._unsaved[label] = set(node.outputs)
+        self._flush_if_saved(label)
+
+    @hook_impl
+    def on_node_error(self, node: KedroNode) -> None:
+        label = self._label(node)
+        with self._lock:
+            _, memory = self._started.pop(label, (0.0, None))
+        self._append(
+            {
+                "node": label,
+                "time": time.time(),
+                "seconds": None,
+                "peak_memory": self._peak_memory(memory),
+                "output_bytes": {},
+            }
+        )
+
+    @hook_impl
+    def after_dataset_saved(
+        self, dataset_name: str, data: Any, node: KedroNode
+    ) -> None:
+        label = self._label(node)
+        size = data_size(data)
+        with self._lock:
+            run = self._runs.get(label)
+            if run is None:
+                return
+            run["output_bytes"][dataset_name] = size
+            self._unsaved[label].discard(dataset_name)
+        self._flush_if_saved(label)
+
+    @hook_impl
+    def after_pipeline_run(self) -> None:
+        self._aggregate()
+
+    @hook_impl
+    def on_pipeline_error(self) -> None:
+        self._aggregate()
+
+    def _flush_if_saved(self, label: str) -> None:
+        with self._lock:
+            if self._unsaved.get(label):
+                return
+            self._unsaved.pop(label, None)
+            run = self._runs.pop(label)
+        self._append(run)
+
+    def _append(self, run: NodeRunDict) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        append_run(self.directory, run)
+
+    def _aggregate(self) -> None:
+        # runs whose outputs were not all saved, e.g. because saving failed
+        with self._lock:
+            runs = list(self._runs.values())
+            self._runs.clear()
+            self._unsaved.clear()
+        for run in runs:
+            self._append(run)
+        if self.directory.exists():
+            aggregate_runs(self.directory)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from collections import deque
+from functools import cached_property
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set
+
+if TYPE_CHECKING:
+    from kedro_inspect.node import InspectedNode
+
+TRANSCODING_SEPARATOR = "@"
+
+
+def strip_transcoding(dataset: str) -> str:
+    return dataset.partition(TRANSCODING_SEPARATOR)[0]
+
+
+class PipelineIndex:
+    """Dataset and dependency lookups over a list of inspected nodes.
+
+    Nodes are referred to by their position in the list. Dataset names are
+    stripped of their transcoding suffix, so ``table@pandas`` and
+    ``table@spark`` are the same dataset, as in Kedro.
+    """
+
+    def __init__(self, nodes: List[InspectedNode]) -> None:
+        self.nodes = nodes
+        self.producers: Dict[str, int] = {}
+        self.consumers: Dict[str, List[int]] = {}
+        node_inputs: List[List[str]] = []
+        for idx, node in enumerate(nodes):
+            inputs = list(dict.fromkeys(map(strip_transcoding, node.input_names)))
+            node_inputs.append(inputs)
+            for dataset in inputs:
+                self.consumers.setdefault(dataset, []).append(idx)
+            for dataset in node.output_names:
+                self.producers[strip_transcoding(dataset)] = idx
+
+        self.parents: List[List[int]] = []
+        self.children: List[List[int]] = [[] for _ in nodes]
+        for idx, inputs in enumerate(node_inputs):
+            parents = list(
+                dict.fromkeys(
+                    self.producers[ds]
+                    for ds in inputs
+                    if ds in self.producers and self.producers[ds] != idx
+                )
+            )
+            self.parents.append(parents)
+            for parent in parents:
+                self.children[parent].append(idx)
+
+    @property
+    def datasets(self) -> Set[str]:
+        return self.producers.keys() | self.consumers.keys()
+
+    @property
+    def free_inputs(self) -> Set[str]:
+        return self.consumers.keys() - self.producers.keys()
+
+    @property
+    def terminal_outputs(self) -> Set[str]:
+        return self.producers.keys() - self.consumers.keys()
+
+    def producer(self, dataset: str) -> InspectedNode | None:
+        idx = self.producers.get(strip_transcoding(dataset))
+        return None if idx is None else self.nodes[idx]
+
+    def consumers_of(self, dataset: str) -> List[InspectedNode]:
+        return [
+            self.nodes[idx]
+            for idx in self.consumers.get(strip_transcoding(dataset), [])
+        ]
+
+    @cached_property
+    def layers(self) -> List[List[int]]:
+        """Groups of nodes whose dependencies are all in earlier groups."""
+        n_parents = [len(parents) for parents in self.parents]
+        layer = [idx for idx, count in enumerate(n_parents) if count == 0]
+        layers = []
+        while layer:
+            layers.append(layer)
+            next_layer = []
+            for idx in layer:
+                for child in self.children[idx]:
+                    n_parents[child] -= 1
+                    if n_parents[child] == 0:
+                        next_layer.append(child)
+            layer = next_layer
+        if sum(map(len, layers)) != len(self.nodes):
+            raise ValueError("Circular dependencies between nodes.")
+        return layers
+
+    @cached_property
+    def topological_order(self) -> List[int]:
+        return [idx for layer in self.layers for idx in layer]
+
+    @cached_property
+    def node_layer(self) -> List[int]:
+        layer_of = [0] * len(self.nodes)
+        for depth, layer in enumerate(self.layers):
+            for idx in layer:
+                layer_of[idx] = depth
+        return layer_of
+
+    def downstream(self, datasets: Iterable[str]) -> List[int]:
+        """Nodes that directly or transitively consume any of ``datasets``."""
+        start = [
+            idx
+            for ds in datasets
+            for idx in self.consumers.get(strip_transcoding(ds), [])
+        ]
+        return self._traverse(start, self.children)
+
+    def upstream(self, datasets: Iterable[str]) -> List[int]:
+        """Nodes that ``datasets`` directly or transitively depend on."""
+        start = [
+            self.producers[ds]
+            for ds in map(strip_transcoding, datasets)
+            if ds in self.producers
+        ]
+        return self._traverse(start, self.parents)
+
+    @cached_property
+    def tags(self) -> Dict[str, List[int]]:
+        by_tag: Dict[str, List[int]] = {}
+        for idx, node in enumerate(self.nodes):
+            for tag in node.tags:
+                by_tag.setdefault(tag, []).append(idx)
+        return by_tag
+
+    @cached_property
+    def namespaces(self) -> Dict[str, List[int]]:
+        """Nodes by namespace, including the nodes of nested namespaces."""
+        by_namespace: Dict[str, List[int]] = {}
+        for idx, node in enumerate(self.nodes):
+            if not node.namespace:
+                continue
+            parts = node.namespace.split(".")
+            for depth in range(1, len(parts) + 1):
+                by_namespace.setdefault(".".join(parts[:depth]), []).append(idx)
+        return by_namespace
+
+    @cached_property
+    def names(self) -> Dict[str, int]:
+        """Named nodes by their namespaced name, as Kedro names them."""
+        return {
+            node.full_name: idx
+            for idx, node in enumerate(self.nodes)
+            if node.full_name is not None
+        }
+
+    def with_tags(self, tags: Iterable[str]) -> List[int]:
+        """Nodes with any of ``tags``."""
+        return sorted({idx for tag in tags for idx in self.tags.get(tag, [])})
+
+    def in_namespaces(self, namespaces: Iterable[str]) -> List[int]:
+        """Nodes in any of ``namespaces`` or namespaces nested in them."""
+        namespaces = list(namespaces)
+        unknown = [ns for ns in namespaces if ns not in self.namespaces]
+        if unknown:
+            raise ValueError(
+                f"Pipeline does not contain nodes with the following namespaces: "
+                f"{unknown}"
+            )
+        return sorted({idx for ns in namespaces for idx in self.namespaces[ns]})
+
+    def named(self, names: Iterable[str]) -> List[int]:
+        names = list(names)
+        unknown = [name for name in names if name not in self.names]
+        if unknown:
+            raise ValueError(f"Pipeline does not contain nodes named {unknown}.")
+        return sorted({self.names[name] for name in names})
+
+    def consuming(self, datasets: Iterable[str]) -> List[int]:
+        """Nodes that directly consume any of ``datasets``.
+
+        A dataset name with a transcoding suffix only matches inputs with that
+        exact suffix, a name without one matches all of them.
+        """
+        found = set()
+        for dataset in datasets:
+            consumers = self.consumers.get(strip_transcoding(dataset))
+            if consumers is None:
+                raise ValueError(
+                    f"Pipeline does not contain datasets named {dataset!r}."
+                )
+            if TRANSCODING_SEPARATOR in dataset:
+                consumers = [
+                    idx for idx in consumers if dataset in self.nodes[idx].input_names
+                ]
+            found.update(consumers)
+        return sorted(found)
+
+    def producing(self, datasets: Iterable[str]) -> List[int]:
+        """Nodes that ``datasets`` need to be produced, including their producers."""
+        datasets = list(datasets)
+        unknown = [ds for ds in datasets if strip_transcoding(ds) not in self.producers]
+        if unknown:
+            raise ValueError(f"Pipeline does not produce datasets named {unknown}.")
+        return self.upstream(datasets)
+
+    def descendants(self, nodes: Iterable[int]) -> List[int]:
+        return self._traverse(list(nodes), self.children)
+
+    def ancestors(self, nodes: Iterable[int]) -> List[int]:
+        return self._traverse(list(nodes), self.parents)
+
+    @staticmethod
+    def _traverse(start: List[int], edges: List[List[int]]) -> List[int]:
+        seen = set(start)
+        queue = deque(start)
+        while queue:
+            for nxt in edges[queue.popleft()]:
+                if nxt not in seen:
+                    seen.add(nxt)
+                    queue.append(nxt)
+        return sorted(seen)
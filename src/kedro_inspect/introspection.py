@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import functools
+import inspect
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, NamedTuple, Tuple
+
+from typing_extensions import Annotated, Any, get_args, get_origin
+
+from kedro_inspect.serialisation import UnresolvedAnnotation
+
+_NoneType = type(None)
+
+
+class Introspection(NamedTuple):
+    signature: inspect.Signature
+    type_hints: Dict[str, Any]
+
+
+@dataclass
+class CacheInfo:
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class AnnotationResolver:
+    """Evaluates the annotations of callables without ever failing.
+
+    String annotations, as written by ``from __future__ import annotations``,
+    are evaluated once per module namespace and cached, since the same few
+    annotations recur across a module's functions. Annotations that cannot be
+    evaluated, or all string annotations if ``evaluate`` is False, are kept as
+    ``UnresolvedAnnotation`` and recorded in ``failures``.
+
+    Unlike ``typing.get_type_hints``, forward references nested in
+    non-string annotations are left as they are, and parameters defaulting to
+    None are not made Optional.
+    """
+
+    def __init__(self, evaluate: bool = True) -> None:
+        self.evaluate = evaluate
+        # (module name, annotation) -> error message
+        self.failures: Dict[Tuple[str, str], str] = {}
+        # id(globals) -> (globals, annotation -> evaluated annotation)
+        self._namespaces: Dict[int, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+
+    def type_hints(self, func: Callable) -> Dict[str, Any]:
+        if inspect.isclass(func):
+            hints = self._function_hints(func.__init__)
+            hints["return"] = func
+            return hints
+        while isinstance(func, functools.partial):
+            func = func.func
+        return self._function_hints(func)
+
+    def _function_hints(self, func: Callable) -> Dict[str, Any]:
+        annotations = getattr(func, "__annotations__", None)
+        if not isinstance(annotations, dict):
+            return {}
+        globalns = getattr(inspect.unwrap(func), "__globals__", {})
+        hints = {}
+        for name, value in annotations.items():
+            if isinstance(value, str):
+                value = self._evaluate(value, globalns)
+            elif value is None:
+                value = _NoneType
+            if get_origin(value) is Annotated:
+                value = get_args(value)[0]
+            hints[name] = value
+        return hints
+
+    def _evaluate(self, annotation: str, globalns: Dict[str, Any]) -> Any:
+        if not self.evaluate:
+            return UnresolvedAnnotation(annotation)
+        entry = self._namespaces.get(id(globalns))
+        if entry is None or entry[0] is not globalns:
+            entry = self._namespaces[id(globalns)] = (globalns, {})
+        evaluated = entry[1]
+        if annotation not in evaluated:
+            try:
+                value = eval(annotation, globalns)  # noqa: S307 - code of the project
+                evaluated[annotation] = _NoneType if value is None else value
+            except Exception as exc:  # noqa: BLE001 - annotations may raise anything
+                module = str(globalns.get("__name__"))
+                self.failures[(module, annotation)] = f"{type(exc).__name__}: {exc}"
+                evaluated[annotation] = UnresolvedAnnotation(annotation)
+        return evaluated[annotation]
+
+    def clear(self) -> None:
+        """Forget evaluated annotations, e.g. after modules were reloaded."""
+        self._namespaces.clear()
+        self.failures.clear()
+
+
+class IntrospectionCache:
+    """Bounded LRU cache of signatures and type hints, keyed by callable identity.
+
+    Entries of weak-referenceable callables are evicted as soon as the callable
+    is garbage collected, so that a recycled ``id`` never returns stale results.
+    Callables that cannot be weakly referenced are kept alive by the cache until
+    they fall out of the LRU window.
+    """
+
+    def __init__(self, maxsize: int = 4096, evaluate_annotations: bool = True) -> None:
+        self.maxsize = maxsize
+        self.resolver = AnnotationResolver(evaluate_annotations)
+        self.hits = 0
+        self.misses = 0
+        # id(func) -> (weakref or strong reference to func, introspection result)
+        self._entries: OrderedDict[int, tuple[Any, Introspection]] = OrderedDict()
+
+    def get(self, func: Callable) -> Introspection:
+        key = id(func)
+        entry = self._entries.get(key)
+        if entry is not None and self._deref(entry[0]) is func:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry[1]
+
+        self.misses += 1
+        result = Introspection(
+            signature=inspect.signature(func, follow_wrapped=False),
+            type_hints=self.resolver.type_hints(func),
+        )
+        self._entries[key] = (self._make_ref(func, key), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return result
+
+    def signature(self, func: Callable) -> inspect.Signature:
+        return self.get(func).signature
+
+    def type_hints(self, func: Callable) -> Dict[str, Any]:
+        return self.get(func).type_hints
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+        )
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.resolver.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _make_ref(self, func: Callable, key: int) -> Any:
+        entries_ref = weakref.ref(self._entries)
+
+        def _evict(ref: weakref.ref) -> None:
+            entries = entries_ref()
+            if entries is None:
+                return
+            entry = entries.get(key)
+            if entry is not None and entry[0] is ref:
+                del entries[key]
+
+        try:
+            return weakref.ref(func, _evict)
+        except TypeError:
+            # e.g. builtins; hold a strong reference instead
+            return func
+
+    @staticmethod
+    def _deref(ref: Any) -> Any:
+        return ref() if isinstance(ref, weakref.ref) else ref
+
+
+introspection_cache = IntrospectionCache()
@@ -0,0 +1,36 @@
+"""Newline-delimited JSON: one ``InspectedNodeDict`` per line.
+
+Unlike ``json.dumps(pipeline.to_dict())``, neither writing nor reading needs the
+whole document in memory.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import IO, TYPE_CHECKING, Iterable, Iterator
+
+from kedro_inspect.node import InspectedNode
+
+if TYPE_CHECKING:
+    from kedro_inspect.node import InspectedNodeDict
+
+
+def dump_ndjson(node_dicts: Iterable[InspectedNodeDict], fp: IO[str]) -> int:
+    """Write node dicts to ``fp`` as they are produced, return how many."""
+    count = 0
+    for dct in node_dicts:
+        fp.write(json.dumps(dct))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def iter_ndjson(fp: IO[str]) -> Iterator[InspectedNodeDict]:
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+
+def load_ndjson(fp: IO[str], lazy: bool = False) -> Iterator[InspectedNode]:
+    for dct in iter_ndjson(fp):
+        yield InspectedNode.from_dict(dct, lazy)
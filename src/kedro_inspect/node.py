@@ -1,18 +1,25 @@
 from __future__ import annotations
 
-import inspect
+import hashlib
+import json
+import sys
 from collections import defaultdict
-from copy import deepcopy
-from typing import TYPE_CHECKING, Dict, List, Set
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, AbstractSet, Any, Dict, List, Tuple, Union
 
 from kedro.pipeline.node import Node as KedroNode
-from typing_extensions import Self, TypedDict
+from typing_extensions import NotRequired, Self, TypedDict
 
+from kedro_inspect import profiling
+from kedro_inspect.introspection import introspection_cache
 from kedro_inspect.node_func import NodeFunction, NodeFunctionDict
 
 if TYPE_CHECKING:
     from inspect import BoundArguments
 
+    from kedro_inspect.stats import NodeStatsDict
+
 
 class InspectedNodeDict(TypedDict):
     name: str | None
@@ -23,43 +30,169 @@ class InspectedNodeDict(TypedDict):
     outputs: List[str] | Dict[str, str] | str | None
     function: NodeFunctionDict
     param_to_input: Dict[str, List[str]]
+    # runtime costs, if merged in from recorded stats
+    stats: NotRequired[NodeStatsDict]
+
+
+def fingerprint_node_dict(dct: InspectedNodeDict) -> str:
+    """Content hash of a serialised node, independent of tag and mapping order."""
+    canonical = json.dumps(
+        {**dct, "tags": sorted(dct["tags"])}, sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
+
+Datasets = Union[List[str], Dict[str, str], str, None]
+FrozenDatasets = Union[Tuple[str, ...], "Mapping[str, str]", str, None]
+
+
+def _intern(value: str | None) -> str | None:
+    return None if value is None else sys.intern(value)
+
+
+def freeze_datasets(datasets: Datasets | FrozenDatasets) -> FrozenDatasets:
+    """Immutable copy of node inputs/outputs with interned dataset names."""
+    if datasets is None or isinstance(datasets, str):
+        return _intern(datasets)
+    if isinstance(datasets, Mapping):
+        return MappingProxyType(
+            {sys.intern(k): sys.intern(v) for k, v in datasets.items()}
+        )
+    return tuple(map(sys.intern, datasets))
+
+
+def freeze_param_to_input(
+    param_to_input: Mapping[str, List[str] | Tuple[str, ...]],
+) -> Mapping[str, Tuple[str, ...]]:
+    """Read-only copy of a node's parameter to datasets binding."""
+    return MappingProxyType(
+        {
+            sys.intern(param): tuple(map(sys.intern, datasets))
+            for param, datasets in param_to_input.items()
+        }
+    )
+
+
+def thaw_datasets(datasets: FrozenDatasets) -> Datasets:
+    """Inverse of ``freeze_datasets``, returns the types Kedro and JSON expect."""
+    if isinstance(datasets, tuple):
+        return list(datasets)
+    if isinstance(datasets, Mapping):
+        return dict(datasets)
+    return datasets
 
 
 class InspectedNode:
+    """Inspection of a single Kedro node.
+
+    Instances are slotted and store inputs/outputs, confirms and param_to_input
+    as tuples or read-only mappings of interned strings, so that large
+    pipelines stay compact and the cached fingerprint cannot go stale.
+    """
+
+    __slots__ = (
+        "name",
+        "tags",
+        "confirms",
+        "namespace",
+        "inputs",
+        "outputs",
+        "function",
+        "param_to_input",
+        "_fingerprint",
+    )
+
     def __init__(
         self,
         name: str | None,
-        tags: Set[str],
-        confirms: List[str],
+        tags: AbstractSet[str],
+        confirms: List[str] | Tuple[str, ...],
         namespace: str | None,
-        inputs: List[str] | Dict[str, str] | str | None,
-        outputs: List[str] | Dict[str, str] | str | None,
+        inputs: Datasets | FrozenDatasets,
+        outputs: Datasets | FrozenDatasets,
         function: NodeFunction,
-        param_to_input: Dict[str, List[str]],
+        param_to_input: Mapping[str, List[str] | Tuple[str, ...]],
     ) -> None:
         self.name = name
         self.tags = tags
         self.confirms = confirms
-        self.namespace: str | None = namespace
+        self.namespace = namespace
         self.inputs = inputs
         self.outputs = outputs
         self.function = function
         self.param_to_input = param_to_input
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in ("inputs", "outputs"):
+            value = freeze_datasets(value)
+        elif name == "tags":
+            value = frozenset(map(sys.intern, value))
+        elif name == "confirms":
+            value = tuple(map(sys.intern, value))
+        elif name == "param_to_input":
+            value = freeze_param_to_input(value)
+        elif name in ("name", "namespace"):
+            value = _intern(value)
+        super().__setattr__(name, value)
+        if name != "_fingerprint":
+            super().__setattr__("_fingerprint", None)
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable content hash, computed on first access.
+
+        Reassigning an attribute resets it; attributes that could be mutated in
+        place are frozen on assignment.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = fingerprint_node_dict(self.to_dict())
+        return self._fingerprint
+
+    @property
+    def full_name(self) -> str | None:
+        """Name prefixed with the namespace, as in Kedro; None for unnamed nodes."""
+        if self.name is None:
+            return None
+        return f"{self.namespace}.{self.name}" if self.namespace else self.name
+
+    @property
+    def input_names(self) -> List[str]:
+        return self.dataset_names(self.inputs)
+
+    @property
+    def output_names(self) -> List[str]:
+        return self.dataset_names(self.outputs)
+
+    @staticmethod
+    def dataset_names(datasets: Datasets | FrozenDatasets) -> List[str]:
+        """Flatten any form of node inputs/outputs to a list of dataset names."""
+        if datasets is None:
+            return []
+        if isinstance(datasets, str):
+            return [datasets]
+        if isinstance(datasets, Mapping):
+            return list(datasets.values())
+        return list(datasets)
+
     def to_dict(self) -> InspectedNodeDict:
         return {
             "name": self.name,
             "tags": list(self.tags),
-            "confirms": self.confirms,
+            "confirms": list(self.confirms),
             "namespace": self.namespace,
-            "inputs": self.inputs,
-            "outputs": self.outputs,
+            "inputs": thaw_datasets(self.inputs),
+            "outputs": thaw_datasets(self.outputs),
             "function": self.function.to_dict(),
-            "param_to_input": self.param_to_input,
+            "param_to_input": {
+                param: list(datasets) for param, datasets in self.param_to_input.items()
+            },
         }
 
     @classmethod
-    def from_dict(cls, dct: InspectedNodeDict) -> Self:
+    def from_dict(
+        cls, dct: InspectedNodeDict, lazy: bool = False, types: List[Any] | None = None
+    ) -> Self:
+        """See ``NodeFunction.from_dict`` for ``lazy`` and ``types``."""
         return cls(
             name=dct["name"],
             tags=set(dct["tags"]),
@@ -67,37 +200,41 @@ class InspectedNode:
             namespace=dct["namespace"],
             inputs=dct["inputs"],
             outputs=dct["outputs"],
-            function=NodeFunction.from_dict(dct["function"]),
+            function=NodeFunction.from_dict(dct["function"], lazy, types),
             param_to_input=dct["param_to_input"],
         )
 
     def to_kedro_node(self) -> KedroNode:
         return KedroNode(
             func=self.function.func,
-            inputs=self.inputs,
-            outputs=self.outputs,
+            inputs=thaw_datasets(self.inputs),
+            outputs=thaw_datasets(self.outputs),
             name=self.name,
-            tags=self.tags,
-            confirms=self.confirms,
+            tags=set(self.tags),
+            confirms=list(self.confirms),
             namespace=self.namespace,
         )
 
     @classmethod
     def from_kedro_node(cls, node: KedroNode) -> Self:
-        return cls(
-            name=node._name,
-            tags=node.tags,
-            confirms=node.confirms,
-            namespace=node._namespace,
-            inputs=deepcopy(node._inputs),
-            outputs=deepcopy(node._outputs),
-            function=NodeFunction.from_callable(node.func),
-            param_to_input=cls.get_param_to_input(node),
-        )
+        with profiling.span("node.from_kedro_node", node):
+            function = NodeFunction.from_callable(node.func)
+            with profiling.span("node.param_to_input"):
+                param_to_input = cls.get_param_to_input(node)
+            return cls(
+                name=node._name,
+                tags=node.tags,
+                confirms=node.confirms,
+                namespace=node._namespace,
+                inputs=node._inputs,
+                outputs=node._outputs,
+                function=function,
+                param_to_input=param_to_input,
+            )
 
     @staticmethod
     def get_bound_datasets_from_node(node: KedroNode) -> BoundArguments:
-        sig = inspect.signature(node.func, follow_wrapped=False)
+        sig = introspection_cache.signature(node.func)
         return (
             sig.bind(**node._inputs)
             if isinstance(node._inputs, dict)
@@ -107,6 +244,12 @@ class InspectedNode:
     @staticmethod
     def get_param_to_input(node: KedroNode) -> Dict[str, List[str]]:
         bound_datasets = InspectedNode.get_bound_datasets_from_node(node)
+        return InspectedNode.bound_datasets_to_param_to_input(bound_datasets)
+
+    @staticmethod
+    def bound_datasets_to_param_to_input(
+        bound_datasets: BoundArguments,
+    ) -> Dict[str, List[str]]:
         p_to_ds = defaultdict(list)
         for param, dataset in bound_datasets.arguments.items():
             if type(dataset) is tuple:
@@ -123,4 +266,7 @@ class InspectedNode:
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, InspectedNode):
             return NotImplemented
-        return self.to_dict() == __value.to_dict()
+        return self.fingerprint == __value.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
@@ -1,57 +1,69 @@
 from __future__ import annotations
 
-import inspect
+import sys
+from collections import OrderedDict
 from dataclasses import dataclass
 from inspect import Parameter, _ParameterKind
-from typing import Callable, Dict, List
-
-from typing_extensions import (
-    Any,
-    Self,
-    TypedDict,
-    get_type_hints,
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from typing_extensions import Any, Self, TypedDict
+
+from kedro_inspect import profiling
+from kedro_inspect.introspection import introspection_cache
+from kedro_inspect.serialisation import (
+    EncodedType,
+    LazyAttribute,
+    decode_type,
+    encode_type,
+    fqn_to_lazy_obj,
+    get_unresolved,
+    obj_to_fqn,
 )
 
-from kedro_inspect.serialisation import fqn_to_obj, obj_to_fqn
-
 
 def get_type_hints_general(func: Callable) -> Dict[str, Any]:
-    # typing.get_type_hints does extra work to get the actual type, whereas
-    #   inspect.signature may return just a string
-    if inspect.isclass(func):
-        # TODO: if TypedDict, then do not use __init__
-        typehints = get_type_hints(func.__init__)
-        typehints["return"] = func
-    else:
-        typehints = get_type_hints(func)
-    return typehints
+    """Type hints of a function, or of a class's ``__init__`` with the class as
+    return type."""
+    return introspection_cache.type_hints(func)
 
 
 class ArgumentDict(TypedDict):
     name: str
     kind: str
-    type_hint: str
+    # an index into the type table in serialised pipelines
+    type_hint: EncodedType | int
 
 
-@dataclass
+@dataclass(frozen=True)
 class Argument:
+    __slots__ = ("name", "kind", "_type_hint")
+
     name: str
     kind: _ParameterKind
-    type_hint: Any
+    type_hint: Any = LazyAttribute()
 
     def to_dict(self) -> ArgumentDict:
         return {
             "name": self.name,
             "kind": self.kind_to_str(self.kind),
-            "type_hint": obj_to_fqn(self.type_hint),
+            "type_hint": encode_type(get_unresolved(self, "type_hint")),
         }
 
     @classmethod
-    def from_dict(cls, dct: ArgumentDict) -> Argument:
+    def from_dict(
+        cls, dct: ArgumentDict, lazy: bool = False, types: List[Any] | None = None
+    ) -> Argument:
+        """If ``lazy``, the type hint is only imported when first accessed. If
+        ``types`` is given, the type hint is an index into this decoded type
+        table, see ``serialisation.decode_types``."""
         return cls(
-            name=dct["name"],
+            name=sys.intern(dct["name"]),
             kind=cls.str_to_kind(dct["kind"]),
-            type_hint=fqn_to_obj(dct["type_hint"]),
+            type_hint=(
+                decode_type(dct["type_hint"], lazy)
+                if types is None
+                else types[dct["type_hint"]]
+            ),
         )
 
     @staticmethod
@@ -75,46 +87,91 @@ class Argument:
         }[kind_str]
 
 
+# identical signatures share one tuple of arguments, least recently used
+# signatures are forgotten so that the table does not grow with reloaded code
+_MAX_PARAMETER_TUPLES = 4096
+_parameter_tuples: OrderedDict[Tuple[Any, ...], Tuple[Argument, ...]] = OrderedDict()
+
+
+def intern_parameters(parameters: Iterable[Argument]) -> Tuple[Argument, ...]:
+    params = tuple(parameters)
+    try:
+        key = tuple(
+            (arg.name, arg.kind, get_unresolved(arg, "type_hint")) for arg in params
+        )
+        interned = _parameter_tuples.setdefault(key, params)
+    except TypeError:
+        # unhashable type hint
+        return params
+    _parameter_tuples.move_to_end(key)
+    if len(_parameter_tuples) > _MAX_PARAMETER_TUPLES:
+        _parameter_tuples.popitem(last=False)
+    return interned
+
+
+def clear_interned_parameters() -> None:
+    _parameter_tuples.clear()
+
+
 class NodeFunctionDict(TypedDict):
     func: str
     parameters: List[ArgumentDict]
-    return_value: str
+    return_value: EncodedType | int
 
 
-@dataclass
+@dataclass(frozen=True)
 class NodeFunction:
-    func: Callable
-    parameters: List[Argument]
-    return_value: Any
+    __slots__ = ("_func", "parameters", "_return_value")
+
+    func: Callable = LazyAttribute()
+    parameters: Tuple[Argument, ...]
+    return_value: Any = LazyAttribute()
 
     @classmethod
     def from_callable(cls, func: Callable) -> Self:
-        sig = inspect.signature(func, follow_wrapped=False)
-        hints = get_type_hints(func)
-        return cls(
-            func=func,
-            parameters=[
-                Argument(
-                    name=arg.name,
-                    kind=arg.kind,
-                    type_hint=hints.get(arg.name, Any),
-                )
-                for arg in sig.parameters.values()
-            ],
-            return_value=hints.get("return", Any),
-        )
+        with profiling.span("node_func.from_callable", func):
+            with profiling.span("node_func.introspection"):
+                sig, hints = introspection_cache.get(func)
+            return cls(
+                func=func,
+                parameters=intern_parameters(
+                    Argument(
+                        name=arg.name,
+                        kind=arg.kind,
+                        type_hint=hints.get(arg.name, Any),
+                    )
+                    for arg in sig.parameters.values()
+                ),
+                return_value=hints.get("return", Any),
+            )
+
+    @property
+    def fqn(self) -> str:
+        """Fully qualified name of the function, without importing it."""
+        return obj_to_fqn(get_unresolved(self, "func"))
 
     def to_dict(self) -> NodeFunctionDict:
-        return {
-            "func": obj_to_fqn(self.func),
-            "parameters": [arg.to_dict() for arg in self.parameters],
-            "return_value": obj_to_fqn(self.return_value),
-        }
+        with profiling.span("node_func.obj_to_fqn"):
+            return {
+                "func": self.fqn,
+                "parameters": [arg.to_dict() for arg in self.parameters],
+                "return_value": encode_type(get_unresolved(self, "return_value")),
+            }
 
     @classmethod
-    def from_dict(cls, dct: NodeFunctionDict) -> Self:
+    def from_dict(
+        cls, dct: NodeFunctionDict, lazy: bool = False, types: List[Any] | None = None
+    ) -> Self:
+        """If ``lazy``, the function and type hints are only imported when first
+        accessed. If ``types`` is given, type hints are indices into it."""
         return cls(
-            func=fqn_to_obj(dct["func"]),
-            parameters=[Argument.from_dict(arg) for arg in dct["parameters"]],
-            return_value=fqn_to_obj(dct["return_value"]),
+            func=fqn_to_lazy_obj(dct["func"], lazy),
+            parameters=intern_parameters(
+                Argument.from_dict(arg, lazy, types) for arg in dct["parameters"]
+            ),
+            return_value=(
+                decode_type(dct["return_value"], lazy)
+                if types is None
+                else types[dct["return_value"]]
+            ),
         )
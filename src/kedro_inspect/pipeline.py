@@ -1,38 +1,324 @@
 from __future__ import annotations
 
-from typing import List
+import hashlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
 
 from kedro.pipeline.pipeline import Pipeline as KedroPipeline
-from typing_extensions import Self, TypedDict
+from typing_extensions import NotRequired, Self, TypedDict
 
+from kedro_inspect.codec import Codec, get_codec
+from kedro_inspect.index import PipelineIndex
 from kedro_inspect.node import InspectedNode, InspectedNodeDict
+from kedro_inspect.serialisation import (
+    EncodedType,
+    LazyFQN,
+    decode_types,
+    get_unresolved,
+    hoist_types,
+    resolve_fqns,
+)
+from kedro_inspect.stats import merge_stats
+
+if TYPE_CHECKING:
+    from kedro.pipeline.node import Node as KedroNode
+
+    from kedro_inspect.cache import InspectionCache
+    from kedro_inspect.catalog import DatasetInfoDict
+    from kedro_inspect.stats import NodeStatsDict
 
 
 class InspectedPipelineDict(TypedDict):
+    # type hints of the nodes are indices into this table, if present
+    types: NotRequired[List[EncodedType]]
     nodes: List[InspectedNodeDict]
+    # catalog metadata by dataset name, if requested
+    datasets: NotRequired[Dict[str, DatasetInfoDict]]
+
+
+def same_kedro_node(cached: KedroNode, node: KedroNode) -> bool:
+    """Whether an inspection of ``cached`` is one of ``node``. Kedro nodes
+    compare by name and datasets only, not by function, tags or confirms."""
+    return (
+        cached.func is node.func
+        and cached.tags == node.tags
+        and cached.confirms == node.confirms
+    )
+
+
+def to_pipeline_dict(node_dicts: Iterable[InspectedNodeDict]) -> InspectedPipelineDict:
+    """Serialised pipeline of serialised nodes, storing each distinct type hint once."""
+    nodes, types = hoist_types(node_dicts)
+    return {"types": types, "nodes": nodes}
+
+
+class _NodeList(list):
+    """List of nodes that calls ``on_change`` after every mutation, so that
+    caches derived from the nodes are never stale."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, nodes: Iterable[InspectedNode], on_change: Callable[[], None]):
+        super().__init__(nodes)
+        self._on_change = on_change
+
+    def __reduce__(self) -> Tuple[type, Tuple[List[InspectedNode]]]:
+        return list, (list(self),)
+
+
+def _notifying(name: str) -> Callable:
+    method = getattr(list, name)
+
+    def mutate(self: _NodeList, *args: Any) -> Any:
+        result = method(self, *args)
+        self._on_change()
+        return result
+
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+):
+    setattr(_NodeList, _name, _notifying(_name))
 
 
 class InspectedPipeline:
     def __init__(self, nodes: List[InspectedNode]) -> None:
         self.nodes = nodes
 
-    def to_dict(self) -> InspectedPipelineDict:
-        return {"nodes": [n.to_dict() for n in self.nodes]}
+    @property
+    def nodes(self) -> List[InspectedNode]:
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes: Iterable[InspectedNode]) -> None:
+        self._nodes = _NodeList(nodes, self.invalidate_caches)
+        self.invalidate_caches()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"nodes": list(self._nodes)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.nodes = state["nodes"]
+
+    @property
+    def index(self) -> PipelineIndex:
+        """Dataset/dependency index, built on first use.
+
+        Assigning, adding, removing or replacing nodes rebuilds it; call
+        ``invalidate_caches`` after changing the inputs/outputs of a node in place.
+        """
+        if self._index is None:
+            self._index = PipelineIndex(list(self._nodes))
+        return self._index
+
+    @property
+    def fingerprint(self) -> str:
+        """Merkle-style hash of the node fingerprints, independent of node order."""
+        if self._fingerprint is None:
+            node_fingerprints = sorted(node.fingerprint for node in self._nodes)
+            self._fingerprint = hashlib.blake2b(
+                "".join(node_fingerprints).encode(), digest_size=16
+            ).hexdigest()
+        return self._fingerprint
+
+    def invalidate_caches(self) -> None:
+        """Drop the index and fingerprint, e.g. after editing nodes in place."""
+        self._index: PipelineIndex | None = None
+        self._fingerprint: str | None = None
+
+    # the slicing methods mirror those of Kedro pipelines, but are lookups in the
+    # index and return pipelines sharing the node objects, in their original order
+    def _subset(self, indices: Iterable[int]) -> Self:
+        return type(self)([self._nodes[idx] for idx in sorted(indices)])
+
+    def only_nodes_with_tags(self, *tags: str) -> Self:
+        """Nodes with any of ``tags``."""
+        return self._subset(self.index.with_tags(tags))
+
+    def only_nodes_with_namespaces(self, namespaces: List[str]) -> Self:
+        return self._subset(self.index.in_namespaces(namespaces))
+
+    def only_nodes(self, *names: str) -> Self:
+        return self._subset(self.index.named(names))
+
+    def from_nodes(self, *names: str) -> Self:
+        """The named nodes and all nodes depending on them."""
+        return self._subset(self.index.descendants(self.index.named(names)))
+
+    def to_outputs(self, *outputs: str) -> Self:
+        """The nodes needed to produce ``outputs``."""
+        return self._subset(self.index.producing(outputs))
+
+    def only_nodes_with_inputs(self, *inputs: str) -> Self:
+        return self._subset(self.index.consuming(inputs))
+
+    def filter(
+        self,
+        tags: Iterable[str] | None = None,
+        from_nodes: Iterable[str] | None = None,
+        to_outputs: Iterable[str] | None = None,
+        node_names: Iterable[str] | None = None,
+        node_namespaces: Iterable[str] | None = None,
+        with_inputs: Iterable[str] | None = None,
+    ) -> Self:
+        """Nodes selected by all of the given filters, like ``Pipeline.filter``."""
+        index = self.index
+        selections = []
+        if tags is not None:
+            selections.append(index.with_tags(tags))
+        if from_nodes is not None:
+            selections.append(index.descendants(index.named(from_nodes)))
+        if to_outputs is not None:
+            selections.append(index.producing(to_outputs))
+        if node_names is not None:
+            selections.append(index.named(node_names))
+        if node_namespaces is not None:
+            selections.append(index.in_namespaces(node_namespaces))
+        if with_inputs is not None:
+            selections.append(index.consuming(with_inputs))
+        if not selections:
+            return type(self)(list(self._nodes))
+        return self._subset(set(selections[0]).intersection(*selections[1:]))
+
+    def to_dict(
+        self, stats: Dict[str, NodeStatsDict] | None = None
+    ) -> InspectedPipelineDict:
+        return to_pipeline_dict(self.iter_dicts(stats))
+
+    def iter_dicts(
+        self, stats: Dict[str, NodeStatsDict] | None = None
+    ) -> Iterator[InspectedNodeDict]:
+        """Serialise one node at a time, with type hints inline.
+
+        ``stats`` are merged into the dicts of the nodes they were recorded for,
+        see ``stats.load_node_stats``.
+        """
+        node_dicts = (node.to_dict() for node in self.nodes)
+        if stats:
+            node_dicts = merge_stats(node_dicts, stats)
+        yield from node_dicts
+
+    @classmethod
+    def from_dict(cls, dct: InspectedPipelineDict, lazy: bool = False) -> Self:
+        """If ``lazy``, no project code is imported until functions or type hints
+        are accessed."""
+        table = dct.get("types")
+        types = None if table is None else decode_types(table, lazy)
+        return cls.from_node_dicts(dct["nodes"], lazy, types)
 
     @classmethod
-    def from_dict(cls, dct: InspectedPipelineDict) -> Self:
-        return cls(nodes=[InspectedNode.from_dict(node) for node in dct["nodes"]])
+    def from_node_dicts(
+        cls,
+        node_dicts: Iterable[InspectedNodeDict],
+        lazy: bool = False,
+        types: List[Any] | None = None,
+    ) -> Self:
+        """Nodes with type hints given inline, or as indices into ``types`` as
+        decoded by ``serialisation.decode_types``."""
+        return cls(
+            nodes=[InspectedNode.from_dict(node, lazy, types) for node in node_dicts]
+        )
+
+    def encode(self, codec: Codec | str = "json") -> bytes:
+        if isinstance(codec, str):
+            codec = get_codec(codec)
+        return codec.encode(self.to_dict())
+
+    @classmethod
+    def decode(
+        cls, data: bytes, codec: Codec | str = "json", lazy: bool = False
+    ) -> Self:
+        if isinstance(codec, str):
+            codec = get_codec(codec)
+        return cls.from_dict(codec.decode(data), lazy)
 
     def to_kedro_pipeline(self) -> KedroPipeline:
         return KedroPipeline(nodes=[node.to_kedro_node() for node in self.nodes])
 
+    def to_kedro_pipeline_bulk(
+        self, max_workers: int | None = None
+    ) -> Tuple[KedroPipeline, Dict[str, str]]:
+        """Rebuild the Kedro pipeline of a lazily loaded inspection.
+
+        The modules of all node functions are imported concurrently up front and
+        the Kedro pipeline is built once from the nodes whose function could be
+        resolved. Returns it together with the error of each unresolved FQN.
+        """
+        fqns: Dict[int, str] = {}
+        for node in self.nodes:
+            func = get_unresolved(node.function, "func")
+            if isinstance(func, LazyFQN):
+                fqns[id(node)] = func.fqn
+        _, failed = resolve_fqns(fqns.values(), max_workers)
+        nodes = [
+            node.to_kedro_node()
+            for node in self.nodes
+            if fqns.get(id(node)) not in failed
+        ]
+        return KedroPipeline(nodes=nodes), failed
+
     @classmethod
-    def from_kedro_pipeline(cls, pipeline: KedroPipeline) -> Self:
-        return cls(
-            nodes=[InspectedNode.from_kedro_node(node) for node in pipeline.nodes]
-        )
+    def from_kedro_pipeline(
+        cls,
+        pipeline: KedroPipeline,
+        node_cache: Dict[KedroNode, Tuple[KedroNode, InspectedNode]] | None = None,
+        disk_cache: InspectionCache | None = None,
+    ) -> Self:
+        return cls(nodes=list(cls.iter_kedro_nodes(pipeline, node_cache, disk_cache)))
+
+    @staticmethod
+    def iter_kedro_nodes(
+        pipeline: KedroPipeline,
+        node_cache: Dict[KedroNode, Tuple[KedroNode, InspectedNode]] | None = None,
+        disk_cache: InspectionCache | None = None,
+    ) -> Iterator[InspectedNode]:
+        """Inspect the nodes of ``pipeline`` one at a time.
+
+        ``node_cache`` can be shared between calls so that nodes common to
+        several pipelines are inspected only once, ``disk_cache`` reuses
+        inspections of unchanged nodes from previous runs. Cached inspections
+        are reused only for nodes with the same function, tags and confirms.
+        """
+        for node in pipeline.nodes:
+            entry = node_cache.get(node) if node_cache is not None else None
+            if entry is not None and same_kedro_node(entry[0], node):
+                yield entry[1]
+                continue
+            inspected = disk_cache.get(node) if disk_cache else None
+            if inspected is None:
+                inspected = InspectedNode.from_kedro_node(node)
+                if disk_cache:
+                    disk_cache.put(node, inspected)
+            if node_cache is not None:
+                node_cache[node] = (node, inspected)
+            yield inspected
 
     def __eq__(self, __value: object) -> bool:
         if not isinstance(__value, InspectedPipeline):
             return NotImplemented
-        return self.to_dict() == __value.to_dict()
+        return self.fingerprint == __value.fingerprint
+
+    def __hash__(self) -> int:
+        return hash(self.fingerprint)
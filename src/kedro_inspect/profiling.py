@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import heapq
+import os
+import threading
+from contextlib import nullcontext
+from time import perf_counter_ns
+from typing import Any, ContextManager, Dict, List, Tuple
+
+from typing_extensions import TypedDict
+
+_NULL_SPAN = nullcontext()
+
+
+class ChromeTraceEventDict(TypedDict):
+    name: str
+    ph: str
+    ts: float
+    dur: float
+    pid: int
+    tid: int
+    args: Dict[str, str]
+
+
+class PhaseStats:
+    __slots__ = ("calls", "total_ns", "self_ns")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_ns = 0
+        self.self_ns = 0
+
+
+class _Span:
+    __slots__ = ("profiler", "name", "item", "start", "child_ns")
+
+    def __init__(self, profiler: Profiler, name: str, item: Any) -> None:
+        self.profiler = profiler
+        self.name = name
+        self.item = item
+
+    def __enter__(self) -> _Span:
+        self.child_ns = 0
+        self.profiler._stack.append(self)
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        end = perf_counter_ns()
+        stack = self.profiler._stack
+        stack.pop()
+        duration = end - self.start
+        if stack:
+            stack[-1].child_ns += duration
+        self.profiler._record(self, duration)
+
+
+def label(item: Any) -> str:
+    """Human-readable name of a profiled node or function."""
+    qualname = getattr(item, "__qualname__", None)
+    if qualname is not None:
+        return f"{getattr(item, '__module__', None)}.{qualname}"
+    return str(getattr(item, "name", item))
+
+
+class Profiler:
+    """Collects the time spent in named spans, in total and excluding nested
+    spans. Spans given an ``item`` (a node or function) also count towards that
+    item, to find the slowest ones.
+
+    Not thread-safe: spans must be opened and closed on one thread.
+    """
+
+    def __init__(self, trace: bool = False) -> None:
+        self.phases: Dict[str, PhaseStats] = {}
+        self.items: Dict[Tuple[str, str], int] = {}
+        self.trace_events: List[ChromeTraceEventDict] | None = [] if trace else None
+        self._stack: List[_Span] = []
+
+    def span(self, name: str, item: Any = None) -> _Span:
+        return _Span(self, name, item)
+
+    def _record(self, span: _Span, duration: int) -> None:
+        stats = self.phases.get(span.name)
+        if stats is None:
+            stats = self.phases[span.name] = PhaseStats()
+        stats.calls += 1
+        stats.total_ns += duration
+        stats.self_ns += duration - span.child_ns
+        item_label = None if span.item is None else label(span.item)
+        if item_label is not None:
+            key = (span.name, item_label)
+            self.items[key] = self.items.get(key, 0) + duration
+        if self.trace_events is not None:
+            self.trace_events.append(
+                {
+                    "name": span.name,
+                    "ph": "X",
+                    "ts": span.start / 1000,
+                    "dur": duration / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "args": {} if item_label is None else {"item": item_label},
+                }
+            )
+
+    def slowest(self, name: str, n: int) -> List[Tuple[str, int]]:
+        """The ``n`` items with the most time in span ``name``, in nanoseconds."""
+        durations = (
+            (item, ns) for (span, item), ns in self.items.items() if span == name
+        )
+        return heapq.nlargest(n, durations, key=lambda pair: pair[1])
+
+    def report(self, top: int = 10) -> List[str]:
+        lines = [f"{'phase':<32} {'calls':>8} {'total ms':>12} {'self ms':>12}"]
+        for name, stats in sorted(
+            self.phases.items(), key=lambda kv: kv[1].total_ns, reverse=True
+        ):
+            lines.append(
+                f"{name:<32} {stats.calls:>8} {stats.total_ns / 1e6:>12.1f} "
+                f"{stats.self_ns / 1e6:>12.1f}"
+            )
+        for name in sorted({span for span, _ in self.items}):
+            lines.append(f"slowest in {name}:")
+            for item, ns in self.slowest(name, top):
+                lines.append(f"  {ns / 1e6:>10.2f} ms  {item}")
+        return lines
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """Trace in the Chrome trace event format, e.g. for chrome://tracing or
+        Perfetto. Requires ``trace=True``."""
+        if self.trace_events is None:
+            raise ValueError("Profiler was created without trace=True.")
+        return {"traceEvents": self.trace_events, "displayTimeUnit": "ms"}
+
+
+_profiler: Profiler | None = None
+
+
+def enable(trace: bool = False) -> Profiler:
+    """Start collecting spans into a new profiler and return it."""
+    global _profiler
+    _profiler = Profiler(trace)
+    return _profiler
+
+
+def disable() -> None:
+    global _profiler
+    _profiler = None
+
+
+def span(name: str, item: Any = None) -> ContextManager[Any]:
+    """Time the enclosed block if profiling is enabled; a shared no-op context
+    manager otherwise, so instrumentation costs one function call."""
+    if _profiler is None:
+        return _NULL_SPAN
+    return _profiler.span(name, item)
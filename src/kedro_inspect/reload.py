@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import importlib
+import inspect
+import sys
+from importlib.util import cache_from_source
+from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Set, Tuple
+
+
+class ModuleReloader:
+    """Reloads the modules of a project whose source files changed.
+
+    Only modules imported from files under ``source_dir`` are tracked. Modules
+    that import a changed module, or names from it, are reloaded after it, so
+    that they do not keep references to stale functions.
+    """
+
+    def __init__(self, source_dir: Path) -> None:
+        self.source_dir = Path(source_dir).resolve()
+        self._mtimes: Dict[str, int] = {}
+        # resolving module paths is slow, so it is done once per module object
+        self._is_project_module: Dict[str, Tuple[ModuleType, bool]] = {}
+        self.snapshot()
+
+    def project_modules(self) -> Dict[str, ModuleType]:
+        modules = {}
+        for name, module in list(sys.modules.items()):
+            known = self._is_project_module.get(name)
+            if known is None or known[0] is not module:
+                path = self._module_path(module)
+                in_project = path is not None and self.source_dir in path.parents
+                known = self._is_project_module[name] = (module, in_project)
+            if known[1]:
+                modules[name] = module
+        return modules
+
+    def snapshot(self) -> None:
+        """Start tracking project modules imported since the last snapshot."""
+        for name, module in self.project_modules().items():
+            if name not in self._mtimes:
+                mtime = self._mtime(module)
+                if mtime is not None:
+                    self._mtimes[name] = mtime
+
+    def changed(self) -> List[str]:
+        """Project modules whose file changed since they were last (re)loaded."""
+        return list(self.pending())
+
+    def pending(self) -> Dict[str, int]:
+        """Modification times of the files of changed modules, by module name."""
+        pending = {}
+        for name, module in self.project_modules().items():
+            mtime = self._mtime(module)
+            if mtime is not None and mtime != self._mtimes.get(name, mtime):
+                pending[name] = mtime
+        return pending
+
+    def reload_changed(self) -> Tuple[List[str], Dict[str, str]]:
+        """Reload changed modules and their dependents, in dependency order.
+
+        Returns the names of the reloaded modules and the errors of modules
+        that failed to reload, by module name. Failed modules are retried on the
+        next call.
+        """
+        changed = self.changed()
+        if not changed:
+            return [], {}
+        modules = self.project_modules()
+        dependencies = {
+            name: self._dependencies(module, modules)
+            for name, module in modules.items()
+        }
+        to_reload = self._with_dependents(changed, dependencies)
+
+        reloaded: List[str] = []
+        errors: Dict[str, str] = {}
+        importlib.invalidate_caches()
+        for name in self._dependency_order(to_reload, dependencies):
+            mtime = self._mtime(modules[name])
+            try:
+                self._reload(modules[name])
+            except Exception as exc:  # noqa: BLE001 - user code may raise anything
+                errors[name] = f"{type(exc).__name__}: {exc}"
+                continue
+            if mtime is not None:
+                self._mtimes[name] = mtime
+            reloaded.append(name)
+        self.snapshot()
+        return reloaded, errors
+
+    @staticmethod
+    def _module_path(module: ModuleType) -> Path | None:
+        file = getattr(module, "__file__", None)
+        return None if file is None else Path(file).resolve()
+
+    @classmethod
+    def _reload(cls, module: ModuleType) -> None:
+        path = cls._module_path(module)
+        if path is None or path.suffix != ".py" or not cls._bytecode_may_be_stale(path):
+            importlib.reload(module)
+            return
+        # .pyc files are validated by mtime in whole seconds and size, so a
+        # quick edit keeping the size would reload the stale bytecode; the
+        # source is executed in the module's namespace instead, as reload does
+        code = compile(path.read_bytes(), str(path), "exec", dont_inherit=True)
+        exec(code, vars(module))  # noqa: S102 - code of the project
+
+    @staticmethod
+    def _bytecode_may_be_stale(path: Path) -> bool:
+        """Whether the .pyc of a source file passes the import system's checks
+        even if it was compiled from an earlier version of the source."""
+        try:
+            with open(cache_from_source(str(path)), "rb") as f:
+                header = f.read(16)
+            stat = path.stat()
+        except (OSError, NotImplementedError):
+            return False
+        if len(header) < 16:
+            return False
+        flags = int.from_bytes(header[4:8], "little")
+        if flags & 0b1:
+            # hash-based, validated by content unless unchecked
+            return not flags & 0b10
+        return (
+            int.from_bytes(header[8:12], "little") == int(stat.st_mtime) & 0xFFFFFFFF
+            and int.from_bytes(header[12:16], "little") == stat.st_size & 0xFFFFFFFF
+        )
+
+    @classmethod
+    def _mtime(cls, module: ModuleType) -> int | None:
+        path = cls._module_path(module)
+        try:
+            return None if path is None else path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _dependencies(module: ModuleType, modules: Dict[str, ModuleType]) -> Set[str]:
+        deps = set()
+        for value in list(vars(module).values()):
+            if inspect.ismodule(value):
+                dep = value.__name__
+            else:
+                dep = getattr(value, "__module__", None)
+            if isinstance(dep, str) and dep in modules and dep != module.__name__:
+                deps.add(dep)
+        return deps
+
+    @staticmethod
+    def _with_dependents(
+        changed: List[str], dependencies: Dict[str, Set[str]]
+    ) -> Set[str]:
+        dependents: Dict[str, Set[str]] = {}
+        for name, deps in dependencies.items():
+            for dep in deps:
+                dependents.setdefault(dep, set()).add(name)
+        result = set(changed)
+        stack = list(changed)
+        while stack:
+            for dependent in dependents.get(stack.pop(), ()):
+                if dependent not in result:
+                    result.add(dependent)
+                    stack.append(dependent)
+        return result
+
+    @staticmethod
+    def _dependency_order(
+        names: Set[str], dependencies: Dict[str, Set[str]]
+    ) -> List[str]:
+        order: List[str] = []
+        visited: Set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            visited.add(name)
+            for dep in sorted(dependencies.get(name, ())):
+                if dep in names:
+                    visit(dep)
+            order.append(name)
+
+        for name in sorted(names):
+            visit(name)
+        return order
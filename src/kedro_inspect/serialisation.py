@@ -1,18 +1,347 @@
 from __future__ import annotations
 
+import collections.abc
+import importlib
+import json
 import pydoc
-from typing import TYPE_CHECKING
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    Iterable,
+    List,
+    NamedTuple,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import Literal, get_args, get_origin
 
 if TYPE_CHECKING:
-    from typing_extensions import Any
+    from kedro_inspect.node import InspectedNodeDict
+    from kedro_inspect.pipeline import InspectedPipelineDict
+
+
+class LazyFQN(NamedTuple):
+    """Placeholder for an object that has not been imported yet."""
+
+    fqn: str
+
+
+class LazyType(NamedTuple):
+    """Placeholder for a structured type hint that has not been decoded yet."""
+
+    encoded: str
+
+
+class UnresolvedAnnotation(NamedTuple):
+    """Type hint kept as written because it was not, or could not be, evaluated."""
+
+    annotation: str
+
+
+# FQNs never contain a colon, so this cannot clash with an importable name
+UNRESOLVED_PREFIX = "unresolved:"
 
 
 def obj_to_fqn(typ: Any) -> str:
+    if isinstance(typ, LazyFQN):
+        return typ.fqn
+    if isinstance(typ, UnresolvedAnnotation):
+        return f"{UNRESOLVED_PREFIX}{typ.annotation}"
     return f"{typ.__module__}.{typ.__qualname__}"
 
 
+@lru_cache(maxsize=None)
 def fqn_to_obj(fqn: str) -> Any:
+    if fqn.startswith(UNRESOLVED_PREFIX):
+        return UnresolvedAnnotation(fqn[len(UNRESOLVED_PREFIX) :])
     obj = pydoc.locate(fqn)
     if obj is None:
         raise ValueError(f"Could not locate object: {fqn}")
     return obj
+
+
+def _try_import(module: str) -> None:
+    try:
+        importlib.import_module(module)
+    except Exception:  # noqa: BLE001 - reported when the FQN is resolved
+        # not a module (e.g. the class of a method) or a broken one, the FQN is
+        # looked up serially afterwards either way
+        pass
+
+
+def resolve_fqns(
+    fqns: Iterable[str], max_workers: int | None = None
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """Resolve many FQNs at once, importing their modules concurrently.
+
+    The distinct modules of ``fqns`` that are not imported yet are imported by a
+    thread pool first, then every FQN is looked up through the cache of
+    ``fqn_to_obj``. Returns the resolved objects and an error message for each
+    FQN that could not be resolved, instead of stopping at the first failure.
+    """
+    distinct = list(dict.fromkeys(fqns))
+    modules = {
+        module
+        for module in (fqn.rpartition(".")[0] for fqn in distinct)
+        if module and module not in sys.modules
+    }
+    if len(modules) > 1 and max_workers != 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(pool.map(_try_import, modules))
+
+    resolved: Dict[str, Any] = {}
+    failed: Dict[str, str] = {}
+    for fqn in distinct:
+        try:
+            resolved[fqn] = fqn_to_obj(fqn)
+        except Exception as exc:  # noqa: BLE001 - import errors of project code
+            failed[fqn] = f"{type(exc).__name__}: {exc}"
+    return resolved, failed
+
+
+def fqn_to_lazy_obj(fqn: str, lazy: bool) -> Any:
+    if lazy and not fqn.startswith(UNRESOLVED_PREFIX):
+        return LazyFQN(fqn)
+    return fqn_to_obj(fqn)
+
+
+# JSON form of a type hint: an FQN for plain types, None for NoneType, "..." for
+# the ellipsis in ``Tuple[int, ...]`` and ``Callable[..., int]``, and a dict with
+# one of the keys "generic", "union", "literal", "callable" or "typevar" otherwise
+EncodedType = Union[str, None, Dict[str, Any]]
+
+_NoneType = type(None)
+_UNION_ORIGINS = {Union, getattr(types, "UnionType", Union)}
+_LITERAL_VALUE_TYPES = (str, int, bool, type(None))
+
+
+def _generic_fqn(typ: Any, origin: Any) -> str:
+    # typing aliases such as List are subscripted as typing.List, builtin
+    # generics (list[int]) and user-defined generic classes via their origin
+    name = getattr(typ, "_name", None)
+    if name and getattr(typ, "__module__", None) == "typing":
+        return f"typing.{name}"
+    return obj_to_fqn(origin)
+
+
+def _encode_type(typ: Any) -> EncodedType:
+    if typ is None or typ is _NoneType:
+        return None
+    if typ is Ellipsis:
+        return "..."
+    if isinstance(typ, LazyType):
+        return json.loads(typ.encoded)
+    if isinstance(typ, (LazyFQN, UnresolvedAnnotation)):
+        return obj_to_fqn(typ)
+    if isinstance(typ, ForwardRef):
+        return f"{UNRESOLVED_PREFIX}{typ.__forward_arg__}"
+    if isinstance(typ, TypeVar):
+        return {"typevar": typ.__name__}
+
+    origin = get_origin(typ)
+    args = get_args(typ)
+    if origin in _UNION_ORIGINS:
+        return {"union": [_encode_type(arg) for arg in args]}
+    if origin is Literal:
+        if all(isinstance(arg, _LITERAL_VALUE_TYPES) for arg in args):
+            return {"literal": list(args)}
+        return f"{UNRESOLVED_PREFIX}{typ!r}"
+    if origin is collections.abc.Callable and args:
+        params, ret = args
+        return {
+            "callable": (
+                "..."
+                if params is Ellipsis
+                else [_encode_type(param) for param in params]
+            ),
+            "return": _encode_type(ret),
+        }
+    if origin is not None:
+        fqn = _generic_fqn(typ, origin)
+        if not args:
+            return fqn
+        return {"generic": fqn, "args": [_encode_type(arg) for arg in args]}
+    try:
+        return obj_to_fqn(typ)
+    except AttributeError:
+        pass
+    name = getattr(typ, "_name", None)
+    if name and getattr(typ, "__module__", None) == "typing":
+        # special forms such as Any before Python 3.11
+        return f"typing.{name}"
+    return f"{UNRESOLVED_PREFIX}{typ!r}"
+
+
+_encode_type_cached = lru_cache(maxsize=4096)(_encode_type)
+
+
+def encode_type(typ: Any) -> EncodedType:
+    """JSON-serialisable form of a type hint, see ``EncodedType``.
+
+    Encodings of generic types are cached and shared, do not modify them.
+    """
+    if typ is None or isinstance(typ, (type, LazyFQN, UnresolvedAnnotation)):
+        return _encode_type(typ)
+    try:
+        return _encode_type_cached(typ)
+    except TypeError:
+        # unhashable, e.g. Literal of a list
+        return _encode_type(typ)
+
+
+def _decode_type(encoded: EncodedType) -> Any:
+    if encoded is None:
+        return _NoneType
+    if isinstance(encoded, str):
+        return Ellipsis if encoded == "..." else fqn_to_obj(encoded)
+    if "union" in encoded:
+        return Union[tuple(_decode_type(arg) for arg in encoded["union"])]
+    if "literal" in encoded:
+        return Literal[tuple(encoded["literal"])]
+    if "callable" in encoded:
+        params = encoded["callable"]
+        return Callable[
+            ... if params == "..." else [_decode_type(param) for param in params],
+            _decode_type(encoded["return"]),
+        ]
+    if "typevar" in encoded:
+        return TypeVar(encoded["typevar"])
+    origin = fqn_to_obj(encoded["generic"])
+    args = tuple(_decode_type(arg) for arg in encoded["args"])
+    return origin[args if len(args) > 1 else args[0]]
+
+
+@lru_cache(maxsize=4096)
+def _decode_type_cached(encoded: str) -> Any:
+    return _decode_type(json.loads(encoded))
+
+
+def decode_type(encoded: EncodedType, lazy: bool = False) -> Any:
+    """Inverse of ``encode_type``. If ``lazy``, nothing is imported until the
+    returned placeholder is resolved by a ``LazyAttribute``."""
+    if encoded is None or isinstance(encoded, str):
+        return _NoneType if encoded is None else fqn_to_lazy_obj(encoded, lazy)
+    canonical = json.dumps(encoded, sort_keys=True)
+    return LazyType(canonical) if lazy else _decode_type_cached(canonical)
+
+
+def decode_types(table: List[EncodedType], lazy: bool = False) -> List[Any]:
+    """Decode the type table of a serialised pipeline, each entry once, so that
+    nodes share the decoded hints by table index."""
+    return [decode_type(encoded, lazy) for encoded in table]
+
+
+def _type_key(encoded: EncodedType) -> str | None:
+    if encoded is None or isinstance(encoded, str):
+        return encoded
+    return json.dumps(encoded, sort_keys=True)
+
+
+def hoist_types(
+    node_dicts: Iterable[InspectedNodeDict],
+) -> Tuple[List[InspectedNodeDict], List[EncodedType]]:
+    """Move the type hints of serialised nodes into a shared table.
+
+    Returns copies of the nodes whose ``type_hint`` and ``return_value`` are
+    indices into the returned table, in which each distinct type appears once.
+    """
+    table: List[EncodedType] = []
+    indices: Dict[str | None, int] = {}
+
+    def index(encoded: EncodedType) -> int:
+        key = _type_key(encoded)
+        idx = indices.get(key)
+        if idx is None:
+            idx = indices[key] = len(table)
+            table.append(encoded)
+        return idx
+
+    hoisted: List[InspectedNodeDict] = []
+    for node in node_dicts:
+        function = node["function"]
+        hoisted.append(
+            {
+                **node,
+                "function": {
+                    **function,
+                    "parameters": [
+                        {**arg, "type_hint": index(arg["type_hint"])}
+                        for arg in function["parameters"]
+                    ],
+                    "return_value": index(function["return_value"]),
+                },
+            }
+        )
+    return hoisted, table
+
+
+def inline_types(dct: InspectedPipelineDict) -> List[InspectedNodeDict]:
+    """Nodes of a serialised pipeline with type hints looked up in its type table.
+
+    Pipelines written without a type table are returned as they are.
+    """
+    table = dct.get("types")
+    if table is None:
+        return dct["nodes"]
+    inlined: List[InspectedNodeDict] = []
+    for node in dct["nodes"]:
+        function = node["function"]
+        inlined.append(
+            {
+                **node,
+                "function": {
+                    **function,
+                    "parameters": [
+                        {**arg, "type_hint": table[arg["type_hint"]]}
+                        for arg in function["parameters"]
+                    ],
+                    "return_value": table[function["return_value"]],
+                },
+            }
+        )
+    return inlined
+
+
+class LazyAttribute:
+    """Dataclass field descriptor that resolves ``LazyFQN`` and ``LazyType`` values
+    on first access.
+
+    The stored value lives under ``_<name>``; use ``get_unresolved`` to read it
+    without triggering an import.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.private_name = f"_{name}"
+
+    def __get__(self, obj: object | None, objtype: type | None = None) -> Any:
+        if obj is None:
+            # no class-level default, so that dataclasses treat the field as required
+            raise AttributeError(self.name)
+        value = getattr(obj, self.private_name)
+        if isinstance(value, (LazyFQN, LazyType)):
+            value = (
+                fqn_to_obj(value.fqn)
+                if isinstance(value, LazyFQN)
+                else _decode_type_cached(value.encoded)
+            )
+            # bypasses frozen dataclasses: resolving does not change the value
+            object.__setattr__(obj, self.private_name, value)
+        return value
+
+    def __set__(self, obj: object, value: Any) -> None:
+        object.__setattr__(obj, self.private_name, value)
+
+
+def get_unresolved(obj: object, name: str) -> Any:
+    """Return the value behind a ``LazyAttribute`` without importing it."""
+    return getattr(obj, f"_{name}")
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import os
+import socketserver
+import sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Tuple
+from urllib.parse import unquote, urlsplit
+
+from kedro.framework.project import pipelines
+from kedro.framework.startup import bootstrap_project
+
+from kedro_inspect.caches import clear_caches
+from kedro_inspect.codec import get_codec
+from kedro_inspect.diff import node_key
+from kedro_inspect.index import strip_transcoding
+from kedro_inspect.node import InspectedNode
+from kedro_inspect.pipeline import (
+    InspectedPipeline,
+    same_kedro_node,
+    to_pipeline_dict,
+)
+from kedro_inspect.reload import ModuleReloader
+
+if TYPE_CHECKING:
+    from kedro.pipeline.node import Node as KedroNode
+
+    from kedro_inspect.node import InspectedNodeDict
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class _PipelineEntry(NamedTuple):
+    pipeline: InspectedPipeline
+    dicts: List[InspectedNodeDict]
+    names: List[str]
+    keys: Dict[str, int]
+
+
+class InspectionService:
+    """Answers inspection queries for a project that is bootstrapped once.
+
+    Inspections are kept in memory and reused across queries. Before every
+    query, project modules whose files changed are reloaded and the pipeline
+    registry is run again; nodes whose function, tags and confirms did not
+    change keep their previous inspection.
+
+    Queries, all answered with JSON:
+
+    - ``GET /pipelines``: names of the registered pipelines
+    - ``GET /pipelines/<name>``: inspection of a pipeline
+    - ``GET /pipelines/<name>/nodes/<node>``: one node, by namespace-qualified name
+    - ``GET /pipelines/<name>/datasets/<dataset>``: producer, consumers and
+      upstream/downstream nodes of a dataset
+    - ``GET /status`` and ``POST /reload``: reload state
+    """
+
+    def __init__(self, project_path: Path) -> None:
+        metadata = bootstrap_project(project_path)
+        self.registry_module = f"{metadata.package_name}.pipeline_registry"
+        self.reloader = ModuleReloader(metadata.source_dir)
+        self.reloads = 0
+        self.reload_errors: Dict[str, str] = {}
+        self._nodes: Dict[
+            KedroNode, Tuple[KedroNode, InspectedNode, InspectedNodeDict]
+        ] = {}
+        self._pipelines: Dict[str, _PipelineEntry] = {}
+        self._encoded: Dict[str, bytes] = {}
+        self._codec = get_codec("json")
+        self._load_registry()
+
+    def _load_registry(self) -> None:
+        list(pipelines)
+        self.reloader.snapshot()
+
+    def refresh(self) -> List[str]:
+        """Reload changed project modules and return their names."""
+        reloaded, self.reload_errors = self.reloader.reload_changed()
+        if reloaded:
+            self.reloads += 1
+            # cached annotations and types may refer to reloaded modules
+            clear_caches()
+            self._pipelines.clear()
+            self._encoded.clear()
+            pipelines.configure(self.registry_module)
+            self._load_registry()
+        return reloaded
+
+    def _inspect_node(self, node: KedroNode) -> Tuple[InspectedNode, InspectedNodeDict]:
+        entry = self._nodes.get(node)
+        if entry is None or not same_kedro_node(entry[0], node):
+            inspected = InspectedNode.from_kedro_node(node)
+            entry = self._nodes[node] = (node, inspected, inspected.to_dict())
+        return entry[1], entry[2]
+
+    def inspect(self, name: str) -> _PipelineEntry:
+        entry = self._pipelines.get(name)
+        if entry is None:
+            inspected = [self._inspect_node(node) for node in pipelines[name].nodes]
+            dicts = [dct for _, dct in inspected]
+            names = [node_key(dct) for dct in dicts]
+            entry = self._pipelines[name] = _PipelineEntry(
+                pipeline=InspectedPipeline([node for node, _ in inspected]),
+                dicts=dicts,
+                names=names,
+                keys={key: idx for idx, key in enumerate(names)},
+            )
+        return entry
+
+    def lineage(self, name: str, dataset: str) -> Dict[str, Any] | None:
+        entry = self.inspect(name)
+        index = entry.pipeline.index
+        dataset = strip_transcoding(dataset)
+        if dataset not in index.datasets:
+            return None
+
+        def to_keys(indices: List[int]) -> List[str]:
+            return [entry.names[idx] for idx in indices]
+
+        producer = index.producers.get(dataset)
+        return {
+            "dataset": dataset,
+            "producer": None if producer is None else entry.names[producer],
+            "consumers": to_keys(index.consumers.get(dataset, [])),
+            "upstream": to_keys(index.upstream([dataset])),
+            "downstream": to_keys(index.downstream([dataset])),
+        }
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "reloads": self.reloads,
+            "reload_errors": self.reload_errors,
+            "inspected_pipelines": sorted(self._pipelines),
+            "inspected_nodes": len(self._nodes),
+        }
+
+    def handle(self, method: str, path: str) -> Tuple[int, bytes]:
+        """Answer a query, returning an HTTP status code and a JSON body."""
+        try:
+            self.refresh()
+            if self.reload_errors:
+                return 500, self._error(
+                    "failed to reload modules", modules=self.reload_errors
+                )
+            return self._route(method, [unquote(part) for part in path.split("/")])
+        except Exception as exc:  # noqa: BLE001 - report errors in user code
+            return 500, self._error(f"{type(exc).__name__}: {exc}")
+
+    def _route(self, method: str, parts: List[str]) -> Tuple[int, bytes]:
+        parts = [part for part in parts if part]
+        if method == "POST" and parts == ["reload"]:
+            return 200, self._codec.encode(self.status())
+        if method != "GET":
+            return 405, self._error(f"method {method} not allowed")
+        if parts == ["status"]:
+            return 200, self._codec.encode(self.status())
+        if parts == ["pipelines"]:
+            return 200, self._codec.encode({"pipelines": list(pipelines)})
+        if len(parts) < 2 or parts[0] != "pipelines":
+            return 404, self._error("not found")
+
+        name = parts[1]
+        if name not in pipelines:
+            return 404, self._error(f"pipeline {name} not found")
+        if len(parts) == 2:
+            if name not in self._encoded:
+                self._encoded[name] = self._codec.encode(
+                    to_pipeline_dict(self.inspect(name).dicts)
+                )
+            return 200, self._encoded[name]
+        if len(parts) >= 4 and parts[2] == "nodes":
+            entry = self.inspect(name)
+            idx = entry.keys.get("/".join(parts[3:]))
+            if idx is None:
+                return 404, self._error(f"node {'/'.join(parts[3:])} not found")
+            return 200, self._codec.encode(entry.dicts[idx])
+        if len(parts) >= 4 and parts[2] == "datasets":
+            lineage = self.lineage(name, "/".join(parts[3:]))
+            if lineage is None:
+                return 404, self._error(f"dataset {'/'.join(parts[3:])} not found")
+            return 200, self._codec.encode(lineage)
+        return 404, self._error("not found")
+
+    def _error(self, message: str, **details: Any) -> bytes:
+        return self._codec.encode({"error": message, **details})
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: Any
+
+    def do_GET(self) -> None:
+        self._respond("GET")
+
+    def do_POST(self) -> None:
+        self._respond("POST")
+
+    def _respond(self, method: str) -> None:
+        status, body = self.server.service.handle(method, urlsplit(self.path).path)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self) -> str:
+        # Unix socket clients have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+if hasattr(socketserver, "UnixStreamServer"):
+
+    class UnixHTTPServer(socketserver.UnixStreamServer):
+        def server_bind(self) -> None:
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+            super().server_bind()
+
+        def server_close(self) -> None:
+            super().server_close()
+            if os.path.exists(self.server_address):
+                os.unlink(self.server_address)
+
+
+def make_server(
+    service: InspectionService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Path | None = None,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    """HTTP server for ``service`` on localhost, or on a Unix socket if
+    ``socket_path`` is given. Requests are handled one at a time."""
+    if socket_path is not None:
+        if not hasattr(socketserver, "UnixStreamServer"):
+            raise ValueError("Unix sockets are not supported on this platform.")
+        server: socketserver.BaseServer = UnixHTTPServer(str(socket_path), _Handler)
+    else:
+        server = HTTPServer((host, port), _Handler)
+    server.service = service  # type: ignore[attr-defined]
+    server.verbose = verbose  # type: ignore[attr-defined]
+    return server
+
+
+def serve(server: socketserver.BaseServer) -> None:
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("Shutting down.", file=sys.stderr)
+    finally:
+        server.server_close()
@@ -0,0 +1,1067 @@
+"""Inspect a Kedro project by parsing its source code instead of importing it.
+
+The static engine understands the common ways of building pipelines: ``node``,
+``pipeline``/``Pipeline`` (including namespacing and dataset mapping), ``+`` and
+``sum`` of pipelines, ``find_pipelines`` and plain helper functions such as
+``create_pipeline``. Anything it cannot follow is reported rather than guessed:
+affected nodes carry an ``unresolved`` list and other problems are collected in
+``StaticProject.warnings``.
+
+Type hints are resolved through the import statements of the module defining
+the function, so ``pd.DataFrame`` becomes ``pandas.DataFrame`` even though the
+dynamic inspection would report the defining module (``pandas.core.frame``).
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import hashlib
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from inspect import Parameter, Signature
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+from typing_extensions import NotRequired
+
+from kedro_inspect.node import InspectedNode, InspectedNodeDict
+from kedro_inspect.node_func import Argument
+from kedro_inspect.pipeline import InspectedPipelineDict
+from kedro_inspect.serialisation import UNRESOLVED_PREFIX, EncodedType, obj_to_fqn
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+ANY_FQN = obj_to_fqn(Any)
+UNRESOLVED_FQN = "<unresolved>"
+
+_NODE_FQNS = {"kedro.pipeline.node", "kedro.pipeline.node.node"}
+_PIPELINE_FQNS = {
+    "kedro.pipeline.pipeline",
+    "kedro.pipeline.Pipeline",
+    "kedro.pipeline.pipeline.pipeline",
+    "kedro.pipeline.pipeline.Pipeline",
+    "kedro.pipeline.modular_pipeline.pipeline",
+}
+_FIND_PIPELINES_FQNS = {"kedro.framework.project.find_pipelines"}
+_UNION_FQNS = {"typing.Union", "typing_extensions.Union"}
+_OPTIONAL_FQNS = {"typing.Optional", "typing_extensions.Optional"}
+_LITERAL_FQNS = {"typing.Literal", "typing_extensions.Literal"}
+_CALLABLE_FQNS = {"typing.Callable", "collections.abc.Callable"}
+_TRANSCODING_SEPARATOR = "@"
+_MAX_CALL_DEPTH = 32
+
+
+class StaticNodeDict(InspectedNodeDict):
+    unresolved: NotRequired[List[str]]
+
+
+class StaticInspectionError(Exception):
+    """Raised when a pipeline cannot be reconstructed from source code."""
+
+
+@dataclass
+class _Unknown:
+    reason: str
+
+
+@dataclass
+class _ModuleRef:
+    name: str
+
+
+@dataclass
+class _External:
+    """An object outside the project's source tree, known only by its FQN."""
+
+    fqn: str
+
+
+@dataclass
+class _FunctionRef:
+    fqn: str
+    module: _Module
+    definition: ast.FunctionDef | ast.AsyncFunctionDef
+
+
+@dataclass
+class _BoundMethod:
+    obj: Any
+    name: str
+
+
+@dataclass
+class _StaticNode:
+    func: Any
+    inputs: Any
+    outputs: Any
+    name: str | None
+    tags: Set[str]
+    confirms: Any
+    namespace: str | None
+    unresolved: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _StaticPipeline:
+    nodes: List[_StaticNode]
+
+
+@dataclass
+class _Return:
+    value: Any
+
+
+@dataclass
+class _Module:
+    name: str
+    path: Path
+    is_package: bool
+    tree: ast.Module
+    # name -> ("import", fqn) | ("def", FunctionDef) | ("class", ClassDef)
+    #   | ("assign", expr)
+    symbols: Dict[str, Tuple[str, Any]]
+
+    @property
+    def package(self) -> str:
+        return self.name if self.is_package else self.name.rpartition(".")[0]
+
+
+def _read_project_metadata(project_path: Path) -> Tuple[str, Path]:
+    pyproject = project_path / "pyproject.toml"
+    if not pyproject.is_file():
+        raise StaticInspectionError(f"Could not find {pyproject}.")
+    with pyproject.open("rb") as f:
+        metadata = tomllib.load(f).get("tool", {}).get("kedro", {})
+    if "package_name" not in metadata:
+        raise StaticInspectionError(
+            f"Missing [tool.kedro] package_name in {pyproject}."
+        )
+    source_dir = project_path / metadata.get("source_dir", "src")
+    return metadata["package_name"], source_dir
+
+
+def _collect_symbols(package: str, tree: ast.Module) -> Dict[str, Tuple[str, Any]]:
+    symbols: Dict[str, Tuple[str, Any]] = {}
+
+    def visit(stmts: List[ast.stmt]) -> None:
+        for stmt in stmts:
+            if isinstance(stmt, ast.Import):
+                for alias in stmt.names:
+                    if alias.asname:
+                        symbols[alias.asname] = ("import", alias.name)
+                    else:
+                        head = alias.name.partition(".")[0]
+                        symbols[head] = ("import", head)
+            elif isinstance(stmt, ast.ImportFrom):
+                base = _resolve_relative(stmt.module, stmt.level, package)
+                for alias in stmt.names:
+                    if alias.name == "*":
+                        continue
+                    symbols[alias.asname or alias.name] = (
+                        "import",
+                        f"{base}.{alias.name}" if base else alias.name,
+                    )
+            elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                symbols[stmt.name] = ("def", stmt)
+            elif isinstance(stmt, ast.ClassDef):
+                symbols[stmt.name] = ("class", stmt)
+            elif isinstance(stmt, (ast.Assign, ast.AnnAssign)) and stmt.value:
+                targets = (
+                    stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+                )
+                for target in targets:
+                    if isinstance(target, ast.Name):
+                        symbols[target.id] = ("assign", stmt.value)
+            elif isinstance(stmt, ast.If):
+                # mostly `if TYPE_CHECKING:` imports
+                visit(stmt.body)
+                visit(stmt.orelse)
+            elif isinstance(stmt, ast.Try):
+                visit(stmt.body)
+
+    visit(tree.body)
+    return symbols
+
+
+def _resolve_relative(module: str | None, level: int, package: str) -> str:
+    if level == 0:
+        return module or ""
+    parts = package.split(".")
+    base = ".".join(parts[: len(parts) - level + 1])
+    return f"{base}.{module}" if module else base
+
+
+def _dataset_mapping(names: Any) -> Dict[str, str]:
+    if names is None:
+        return {}
+    if isinstance(names, str):
+        return {names: names}
+    if isinstance(names, dict):
+        return dict(names)
+    return {name: name for name in names}
+
+
+def _param_mapping(names: Any) -> Dict[str, str]:
+    def normalise(name: str) -> str:
+        return name if name.startswith("params:") else f"params:{name}"
+
+    params = {}
+    for name, new_name in _dataset_mapping(names).items():
+        if name == "parameters":
+            params[name] = name
+        else:
+            params[normalise(name)] = normalise(new_name)
+    return params
+
+
+def _rename(
+    name: str, mapping: Dict[str, str], namespace: str | None, prefix: bool
+) -> str:
+    """Mirror of ``kedro.pipeline.Pipeline._rename``."""
+    base, _, suffix = name.partition(_TRANSCODING_SEPARATOR)
+    if name in mapping:
+        return mapping[name]
+    if name == "parameters":
+        return name
+    if suffix and base in mapping:
+        return f"{mapping[base]}{_TRANSCODING_SEPARATOR}{suffix}"
+    if prefix and namespace:
+        if name.startswith("params:"):
+            return f"params:{namespace}.{name[len('params:'):]}"
+        return f"{namespace}.{name}"
+    return name
+
+
+def _rename_datasets(
+    datasets: Any, mapping: Dict[str, str], namespace: str | None, prefix: bool
+) -> Any:
+    if isinstance(datasets, str):
+        return _rename(datasets, mapping, namespace, prefix)
+    if isinstance(datasets, list):
+        return [_rename(d, mapping, namespace, prefix) for d in datasets]
+    if isinstance(datasets, dict):
+        return {k: _rename(v, mapping, namespace, prefix) for k, v in datasets.items()}
+    return datasets
+
+
+def _is_datasets(value: Any) -> bool:
+    if value is None or isinstance(value, str):
+        return True
+    if isinstance(value, list):
+        return all(isinstance(v, str) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(v, str) for v in value.values())
+    return False
+
+
+class StaticProject:
+    """A Kedro project whose pipelines are reconstructed from its source code."""
+
+    def __init__(self, project_path: Path) -> None:
+        self.project_path = project_path
+        self.package_name, self.source_dir = _read_project_metadata(project_path)
+        self.warnings: List[str] = []
+        self._modules: Dict[str, _Module | None] = {}
+        self._module_values: Dict[Tuple[str, str], Any] = {}
+        self._depth = 0
+        self._pipelines: Dict[str, Any] | None = None
+
+    @property
+    def pipelines(self) -> Dict[str, Any]:
+        if self._pipelines is None:
+            self._pipelines = self._evaluate_registry()
+        return self._pipelines
+
+    def inspect(self, pipeline_name: str = "__default__") -> InspectedPipelineDict:
+        if pipeline_name not in self.pipelines:
+            raise ValueError(
+                f"Pipeline {pipeline_name} not found. "
+                f"Available pipelines: {list(self.pipelines)}"
+            )
+        pipe = self.pipelines[pipeline_name]
+        if not isinstance(pipe, _StaticPipeline):
+            raise StaticInspectionError(
+                f"Could not resolve pipeline {pipeline_name} statically: "
+                f"{getattr(pipe, 'reason', pipe)}"
+            )
+        return {"nodes": [self._node_to_dict(n) for n in self._toposort(pipe.nodes)]}
+
+    # --- modules -----------------------------------------------------------
+
+    def _load_module(self, name: str) -> _Module | None:
+        if name in self._modules:
+            return self._modules[name]
+        module = None
+        base = self.source_dir.joinpath(*name.split("."))
+        for path, is_package in (
+            (base / "__init__.py", True),
+            (base.with_suffix(".py"), False),
+        ):
+            if path.is_file():
+                tree = ast.parse(path.read_text(), filename=str(path))
+                package = name if is_package else name.rpartition(".")[0]
+                module = _Module(
+                    name=name,
+                    path=path,
+                    is_package=is_package,
+                    tree=tree,
+                    symbols=_collect_symbols(package, tree),
+                )
+                break
+        self._modules[name] = module
+        return module
+
+    def _resolve_fqn(self, fqn: str, seen: Set[str] | None = None) -> Any:
+        """Resolve a dotted name to a module, a project symbol or an external."""
+        seen = seen or set()
+        if fqn in seen:
+            return _Unknown(f"circular import of {fqn}")
+        seen.add(fqn)
+
+        if self._load_module(fqn) is not None:
+            return _ModuleRef(fqn)
+        module_name, _, attr = fqn.rpartition(".")
+        while module_name:
+            module = self._load_module(module_name)
+            if module is not None:
+                value = self._module_symbol(module, attr.split(".")[0], seen)
+                for part in attr.split(".")[1:]:
+                    value = self._getattr(value, part)
+                return value
+            module_name, _, head = module_name.rpartition(".")
+            attr = f"{head}.{attr}"
+        return _External(fqn)
+
+    def _module_symbol(
+        self, module: _Module, name: str, seen: Set[str] | None = None
+    ) -> Any:
+        key = (module.name, name)
+        if key in self._module_values:
+            return self._module_values[key]
+
+        if name not in module.symbols:
+            if module.is_package and self._load_module(f"{module.name}.{name}"):
+                return _ModuleRef(f"{module.name}.{name}")
+            if hasattr(builtins, name):
+                return _External(f"builtins.{name}")
+            return _Unknown(f"{name} is not defined in {module.name}")
+
+        kind, obj = module.symbols[name]
+        if kind == "import":
+            value = self._resolve_fqn(obj, seen)
+        elif kind == "def":
+            value = _FunctionRef(f"{module.name}.{name}", module, obj)
+        elif kind == "class":
+            value = _External(f"{module.name}.{name}")
+        else:
+            self._module_values[key] = _Unknown(f"recursive definition of {name}")
+            value = _Evaluator(self, module, {}).eval(obj)
+        self._module_values[key] = value
+        return value
+
+    def _getattr(self, value: Any, attr: str) -> Any:
+        if isinstance(value, _ModuleRef):
+            module = self._load_module(value.name)
+            assert module is not None
+            return self._module_symbol(module, attr)
+        if isinstance(value, _External):
+            return _External(f"{value.fqn}.{attr}")
+        if isinstance(value, _Unknown):
+            return value
+        return _BoundMethod(value, attr)
+
+    # --- pipelines ---------------------------------------------------------
+
+    def _evaluate_registry(self) -> Dict[str, Any]:
+        registry = self._load_module(f"{self.package_name}.pipeline_registry")
+        if registry is None:
+            raise StaticInspectionError(
+                f"Could not find {self.package_name}.pipeline_registry "
+                f"under {self.source_dir}."
+            )
+        func = self._module_symbol(registry, "register_pipelines")
+        if not isinstance(func, _FunctionRef):
+            raise StaticInspectionError("Could not find register_pipelines().")
+        result = self.call_function(func, [], {})
+        if not isinstance(result, dict):
+            raise StaticInspectionError(
+                "Could not resolve the pipeline registry statically: "
+                f"{getattr(result, 'reason', result)}"
+            )
+        return result
+
+    def find_pipelines(self) -> Dict[str, Any]:
+        """Mirror of ``kedro.framework.project.find_pipelines``."""
+        found: Dict[str, Any] = {}
+        simplified = self._load_module(f"{self.package_name}.pipeline")
+        if simplified is not None and "create_pipeline" in simplified.symbols:
+            found["__default__"] = self._create_pipeline(simplified)
+
+        pipelines_dir = self.source_dir / self.package_name / "pipelines"
+        if not pipelines_dir.is_dir():
+            return found
+        for pipeline_dir in sorted(pipelines_dir.iterdir()):
+            if pipeline_dir.name.startswith(("_", ".")) or not pipeline_dir.is_dir():
+                continue
+            module = self._load_module(
+                f"{self.package_name}.pipelines.{pipeline_dir.name}"
+            )
+            if module is None or "create_pipeline" not in module.symbols:
+                self.warnings.append(
+                    f"{pipeline_dir} does not expose a create_pipeline function."
+                )
+                continue
+            found[pipeline_dir.name] = self._create_pipeline(module)
+        return found
+
+    def _create_pipeline(self, module: _Module) -> Any:
+        func = self._module_symbol(module, "create_pipeline")
+        if not isinstance(func, _FunctionRef):
+            return _Unknown(f"{module.name}.create_pipeline is not a function")
+        return self.call_function(func, [], {})
+
+    def call_function(
+        self, func: _FunctionRef, args: List[Any], kwargs: Dict[str, Any]
+    ) -> Any:
+        if self._depth >= _MAX_CALL_DEPTH:
+            return _Unknown(f"call depth exceeded in {func.fqn}")
+        evaluator = _Evaluator(self, func.module, {})
+        try:
+            local_vars = evaluator.bind(func.definition, args, kwargs)
+        except TypeError as exc:
+            return _Unknown(f"cannot bind arguments of {func.fqn}: {exc}")
+        self._depth += 1
+        try:
+            result = _Evaluator(self, func.module, local_vars).run(func.definition.body)
+        finally:
+            self._depth -= 1
+        return result.value if isinstance(result, _Return) else result
+
+    def make_node(self, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        params = dict(zip(("func", "inputs", "outputs"), args))
+        params.update(kwargs)
+        if "func" not in params:
+            return _Unknown("node() called without a function")
+
+        unresolved = []
+        inputs = params.get("inputs")
+        outputs = params.get("outputs")
+        confirms = params.get("confirms")
+        if not _is_datasets(inputs):
+            unresolved.append("inputs")
+            inputs = None
+        if not _is_datasets(outputs):
+            unresolved.append("outputs")
+            outputs = None
+        if not _is_datasets(confirms):
+            unresolved.append("confirms")
+            confirms = None
+        name = params.get("name")
+        if name is not None and not isinstance(name, str):
+            unresolved.append("name")
+            name = None
+        namespace = params.get("namespace")
+        if namespace is not None and not isinstance(namespace, str):
+            unresolved.append("namespace")
+            namespace = None
+        tags = params.get("tags")
+        if not _is_datasets(tags) or isinstance(tags, dict):
+            unresolved.append("tags")
+            tags = None
+        return _StaticNode(
+            func=params["func"],
+            inputs=inputs,
+            outputs=outputs,
+            name=name,
+            tags=set(InspectedNode.dataset_names(tags)),
+            confirms=confirms,
+            namespace=namespace,
+            unresolved=unresolved,
+        )
+
+    def make_pipeline(self, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        params = dict(zip(("nodes",), args))
+        params.update(kwargs)
+        nodes = list(self._flatten(params.get("nodes", [])))
+
+        tags = set(InspectedNode.dataset_names(params.get("tags")))
+        namespace = params.get("namespace")
+        prefix = params.get("prefix_datasets_with_namespace", True)
+        mapping = {
+            **_dataset_mapping(params.get("inputs")),
+            **_dataset_mapping(params.get("outputs")),
+            **_param_mapping(params.get("parameters")),
+        }
+        if not (tags or namespace or mapping):
+            return _StaticPipeline(nodes)
+
+        new_nodes = []
+        for node in nodes:
+            new_namespace = node.namespace
+            if namespace:
+                new_namespace = (
+                    f"{namespace}.{node.namespace}" if node.namespace else namespace
+                )
+            new_nodes.append(
+                _StaticNode(
+                    func=node.func,
+                    inputs=_rename_datasets(node.inputs, mapping, namespace, prefix),
+                    outputs=_rename_datasets(node.outputs, mapping, namespace, prefix),
+                    name=node.name,
+                    tags=node.tags | tags,
+                    confirms=_rename_datasets(
+                        node.confirms, mapping, namespace, prefix
+                    ),
+                    namespace=new_namespace,
+                    unresolved=node.unresolved,
+                )
+            )
+        return _StaticPipeline(new_nodes)
+
+    def add_pipelines(self, *pipes: Any) -> Any:
+        nodes: List[_StaticNode] = []
+        seen = set()
+        for pipe in pipes:
+            if pipe == 0:
+                # start value of sum()
+                continue
+            for node in self._flatten(pipe):
+                key = (
+                    self._func_fqn(node.func),
+                    node.name,
+                    node.namespace,
+                    repr(node.inputs),
+                    repr(node.outputs),
+                )
+                if key not in seen:
+                    seen.add(key)
+                    nodes.append(node)
+        return _StaticPipeline(nodes)
+
+    def _flatten(self, value: Any) -> Iterator[_StaticNode]:
+        if isinstance(value, _StaticNode):
+            yield value
+        elif isinstance(value, _StaticPipeline):
+            yield from value.nodes
+        elif isinstance(value, (list, tuple, set)):
+            for item in value:
+                yield from self._flatten(item)
+        else:
+            self.warnings.append(
+                "Skipped pipeline element that could not be resolved statically: "
+                f"{getattr(value, 'reason', value)}"
+            )
+
+    # --- output ------------------------------------------------------------
+
+    @staticmethod
+    def _func_fqn(func: Any) -> str:
+        if isinstance(func, (_FunctionRef, _External)):
+            return func.fqn
+        return UNRESOLVED_FQN
+
+    def _full_name(self, node: _StaticNode) -> str:
+        name = node.name
+        if name is None:
+            fqn = self._func_fqn(node.func)
+            func_name = fqn.rpartition(".")[2]
+            inputs = InspectedNode.dataset_names(node.inputs)
+            outputs = InspectedNode.dataset_names(node.outputs)
+            key = f"{fqn}|{inputs}|{outputs}"
+            name = f"{func_name}__{hashlib.sha256(key.encode()).hexdigest()[:8]}"
+        return f"{node.namespace}.{name}" if node.namespace else name
+
+    def _toposort(self, nodes: List[_StaticNode]) -> List[_StaticNode]:
+        """Order nodes like ``kedro.pipeline.Pipeline.nodes``."""
+
+        def strip(name: str) -> str:
+            return name.partition(_TRANSCODING_SEPARATOR)[0]
+
+        producers = {
+            strip(out): idx
+            for idx, n in enumerate(nodes)
+            for out in InspectedNode.dataset_names(n.outputs)
+        }
+        children: Dict[int, Set[int]] = defaultdict(set)
+        n_parents = [0] * len(nodes)
+        for idx, node in enumerate(nodes):
+            parents = {
+                producers[strip(i)]
+                for i in InspectedNode.dataset_names(node.inputs)
+                if strip(i) in producers
+            }
+            parents.discard(idx)
+            n_parents[idx] = len(parents)
+            for parent in parents:
+                children[parent].add(idx)
+
+        names = [self._full_name(n) for n in nodes]
+        ready = [idx for idx, count in enumerate(n_parents) if count == 0]
+        ordered = []
+        while ready:
+            group = sorted(ready, key=lambda i: names[i])
+            ordered.extend(group)
+            ready = []
+            for idx in group:
+                for child in children[idx]:
+                    n_parents[child] -= 1
+                    if n_parents[child] == 0:
+                        ready.append(child)
+        if len(ordered) != len(nodes):
+            raise StaticInspectionError("Circular dependencies between nodes.")
+        return [nodes[idx] for idx in ordered]
+
+    def _node_to_dict(self, node: _StaticNode) -> StaticNodeDict:
+        unresolved = list(node.unresolved)
+        func = node.func
+        parameters = []
+        return_value = ANY_FQN
+        param_to_input: Dict[str, List[str]] = {}
+
+        if isinstance(func, _FunctionRef):
+            signature, hints = self._signature(func)
+            parameters = [
+                {
+                    "name": param.name,
+                    "kind": Argument.kind_to_str(param.kind),
+                    "type_hint": hints.get(param.name, ANY_FQN),
+                }
+                for param in signature.parameters.values()
+            ]
+            return_value = hints.get("return", ANY_FQN)
+            try:
+                bound = (
+                    signature.bind(**node.inputs)
+                    if isinstance(node.inputs, dict)
+                    else signature.bind(*InspectedNode.dataset_names(node.inputs))
+                )
+            except TypeError:
+                unresolved.append("param_to_input")
+            else:
+                param_to_input = InspectedNode.bound_datasets_to_param_to_input(bound)
+        else:
+            unresolved.append("function")
+
+        dct: StaticNodeDict = {
+            "name": node.name,
+            "tags": sorted(node.tags),
+            "confirms": InspectedNode.dataset_names(node.confirms),
+            "namespace": node.namespace,
+            "inputs": node.inputs,
+            "outputs": node.outputs,
+            "function": {
+                "func": self._func_fqn(func),
+                "parameters": parameters,
+                "return_value": return_value,
+            },
+            "param_to_input": dict(param_to_input),
+        }
+        if unresolved:
+            dct["unresolved"] = unresolved
+        return dct
+
+    def _signature(
+        self, func: _FunctionRef
+    ) -> Tuple[Signature, Dict[str, EncodedType]]:
+        args = func.definition.args
+        hints: Dict[str, EncodedType] = {}
+        params: List[Parameter] = []
+
+        positional = [*args.posonlyargs, *args.args]
+        defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+        for idx, (arg, default) in enumerate(zip(positional, defaults)):
+            kind = (
+                Parameter.POSITIONAL_ONLY
+                if idx < len(args.posonlyargs)
+                else Parameter.POSITIONAL_OR_KEYWORD
+            )
+            params.append(self._parameter(arg, kind, default, func.module, hints))
+        if args.vararg:
+            params.append(
+                self._parameter(
+                    args.vararg, Parameter.VAR_POSITIONAL, None, func.module, hints
+                )
+            )
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+            params.append(
+                self._parameter(
+                    arg, Parameter.KEYWORD_ONLY, default, func.module, hints
+                )
+            )
+        if args.kwarg:
+            params.append(
+                self._parameter(
+                    args.kwarg, Parameter.VAR_KEYWORD, None, func.module, hints
+                )
+            )
+        if func.definition.returns is not None:
+            hints["return"] = self._annotation_to_encoded(
+                func.definition.returns, func.module
+            )
+        return Signature(params), hints
+
+    def _parameter(
+        self,
+        arg: ast.arg,
+        kind: Any,
+        default: ast.expr | None,
+        module: _Module,
+        hints: Dict[str, EncodedType],
+    ) -> Parameter:
+        if arg.annotation is not None:
+            hints[arg.arg] = self._annotation_to_encoded(arg.annotation, module)
+        return Parameter(
+            arg.arg, kind, default=Parameter.empty if default is None else ...
+        )
+
+    def _annotation_to_encoded(
+        self, annotation: ast.expr, module: _Module
+    ) -> EncodedType:
+        """Encode an annotation as ``encode_type`` encodes the evaluated one."""
+        if isinstance(annotation, ast.Constant):
+            if annotation.value is None:
+                return None
+            if annotation.value is Ellipsis:
+                return "..."
+            if isinstance(annotation.value, str):
+                try:
+                    parsed = ast.parse(annotation.value, mode="eval").body
+                except SyntaxError:
+                    return f"{UNRESOLVED_PREFIX}{annotation.value}"
+                return self._annotation_to_encoded(parsed, module)
+
+        dotted = _dotted_name(annotation)
+        if dotted is not None:
+            return self._qualify(dotted, module)
+        if isinstance(annotation, ast.BinOp) and isinstance(annotation.op, ast.BitOr):
+            members = []
+            for side in (annotation.left, annotation.right):
+                encoded = self._annotation_to_encoded(side, module)
+                if isinstance(encoded, dict) and "union" in encoded:
+                    members.extend(encoded["union"])
+                else:
+                    members.append(encoded)
+            return {"union": members}
+        if isinstance(annotation, ast.Subscript):
+            origin = _dotted_name(annotation.value)
+            if origin is not None:
+                return self._subscript_to_encoded(
+                    self._qualify(origin, module), annotation.slice, module
+                )
+        return f"{UNRESOLVED_PREFIX}{ast.unparse(annotation)}"
+
+    def _subscript_to_encoded(
+        self, origin: str, index: ast.expr, module: _Module
+    ) -> EncodedType:
+        elts = index.elts if isinstance(index, ast.Tuple) else [index]
+        if origin in _LITERAL_FQNS:
+            if all(isinstance(elt, ast.Constant) for elt in elts):
+                return {"literal": [elt.value for elt in elts]}  # type: ignore[attr-defined]
+            return f"{UNRESOLVED_PREFIX}{origin}[{ast.unparse(index)}]"
+        if origin in _CALLABLE_FQNS and len(elts) == 2:
+            params, ret = elts
+            return {
+                "callable": (
+                    [self._annotation_to_encoded(elt, module) for elt in params.elts]
+                    if isinstance(params, ast.List)
+                    else self._annotation_to_encoded(params, module)
+                ),
+                "return": self._annotation_to_encoded(ret, module),
+            }
+        args = [self._annotation_to_encoded(elt, module) for elt in elts]
+        if origin in _UNION_FQNS:
+            return {"union": args}
+        if origin in _OPTIONAL_FQNS:
+            return {"union": [*args, None]}
+        return {"generic": origin, "args": args}
+
+    def _qualify(self, dotted: str, module: _Module) -> str:
+        head, _, rest = dotted.partition(".")
+        symbol = module.symbols.get(head)
+        if symbol is None:
+            if hasattr(builtins, head):
+                base = f"builtins.{head}"
+            else:
+                return dotted
+        elif symbol[0] == "import":
+            base = symbol[1]
+        elif symbol[0] == "class":
+            base = f"{module.name}.{head}"
+        else:
+            return dotted
+        return f"{base}.{rest}" if rest else base
+
+
+def _dotted_name(node: ast.expr) -> str | None:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted_name(node.value)
+        return f"{base}.{node.attr}" if base else None
+    return None
+
+
+class _Evaluator:
+    """Evaluates the subset of Python used to assemble pipelines."""
+
+    def __init__(
+        self, project: StaticProject, module: _Module, local_vars: Dict[str, Any]
+    ) -> None:
+        self.project = project
+        self.module = module
+        self.locals = local_vars
+
+    def bind(
+        self,
+        definition: ast.FunctionDef | ast.AsyncFunctionDef,
+        args: List[Any],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        a = definition.args
+        positional = [*a.posonlyargs, *a.args]
+        defaults = [None] * (len(positional) - len(a.defaults)) + list(a.defaults)
+        params = [
+            Parameter(
+                arg.arg,
+                Parameter.POSITIONAL_OR_KEYWORD,
+                default=Parameter.empty if d is None else self.eval(d),
+            )
+            for arg, d in zip(positional, defaults)
+        ]
+        if a.vararg:
+            params.append(Parameter(a.vararg.arg, Parameter.VAR_POSITIONAL))
+        params.extend(
+            Parameter(
+                arg.arg,
+                Parameter.KEYWORD_ONLY,
+                default=Parameter.empty if d is None else self.eval(d),
+            )
+            for arg, d in zip(a.kwonlyargs, a.kw_defaults)
+        )
+        if a.kwarg:
+            params.append(Parameter(a.kwarg.arg, Parameter.VAR_KEYWORD))
+        bound = Signature(params).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return {
+            name: list(value) if isinstance(value, tuple) else value
+            for name, value in bound.arguments.items()
+        }
+
+    def run(self, stmts: List[ast.stmt]) -> Any:
+        for stmt in stmts:
+            result = self.exec(stmt)
+            if isinstance(result, (_Return, _Unknown)):
+                return result
+        return None
+
+    def exec(self, stmt: ast.stmt) -> Any:
+        if isinstance(stmt, ast.Return):
+            return _Return(self.eval(stmt.value) if stmt.value else None)
+        if isinstance(stmt, (ast.Expr, ast.Pass)):
+            if isinstance(stmt, ast.Expr):
+                self.eval(stmt.value)
+            return None
+        if isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            if stmt.value is None:
+                return None
+            value = self.eval(stmt.value)
+            targets = stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+            for target in targets:
+                unknown = self.assign(target, value)
+                if unknown:
+                    return unknown
+            return None
+        if isinstance(stmt, ast.AugAssign) and isinstance(stmt.target, ast.Name):
+            if not isinstance(stmt.op, ast.Add):
+                return _Unknown(f"unsupported statement: {ast.unparse(stmt)}")
+            current = self.eval(stmt.target)
+            self.locals[stmt.target.id] = self.add(current, self.eval(stmt.value))
+            return None
+        if isinstance(stmt, (ast.Import, ast.ImportFrom)):
+            symbols = _collect_symbols(
+                self.module.package,
+                ast.Module(body=[stmt], type_ignores=[]),
+            )
+            for name, (_, fqn) in symbols.items():
+                self.locals[name] = self.project._resolve_fqn(fqn)
+            return None
+        if isinstance(stmt, ast.If):
+            test = self.eval(stmt.test)
+            if isinstance(test, (_Unknown, _External, _ModuleRef, _FunctionRef)):
+                return _Unknown(f"unsupported condition: {ast.unparse(stmt.test)}")
+            return self.run(stmt.body if test else stmt.orelse)
+        if isinstance(stmt, ast.For) and not stmt.orelse:
+            iterable = self.eval(stmt.iter)
+            if not isinstance(iterable, (list, dict, str)):
+                return _Unknown(f"unsupported loop: {ast.unparse(stmt.iter)}")
+            for item in iterable:
+                unknown = self.assign(stmt.target, item)
+                if unknown:
+                    return unknown
+                result = self.run(stmt.body)
+                if result is not None:
+                    return result
+            return None
+        return _Unknown(f"unsupported statement: {ast.unparse(stmt)}")
+
+    def assign(self, target: ast.expr, value: Any) -> _Unknown | None:
+        if isinstance(target, ast.Name):
+            self.locals[target.id] = value
+            return None
+        if isinstance(target, (ast.Tuple, ast.List)) and isinstance(
+            value, (list, tuple)
+        ):
+            if len(target.elts) != len(value):
+                return _Unknown(f"cannot unpack into {ast.unparse(target)}")
+            for elt, item in zip(target.elts, value):
+                unknown = self.assign(elt, item)
+                if unknown:
+                    return unknown
+            return None
+        if isinstance(target, ast.Subscript):
+            container = self.eval(target.value)
+            key = self.eval(target.slice)
+            if isinstance(container, dict) and isinstance(key, str):
+                container[key] = value
+                return None
+        return _Unknown(f"unsupported assignment to {ast.unparse(target)}")
+
+    def eval(self, expr: ast.expr) -> Any:
+        if isinstance(expr, ast.Constant):
+            return expr.value
+        if isinstance(expr, (ast.List, ast.Tuple, ast.Set)):
+            items: List[Any] = []
+            for elt in expr.elts:
+                if isinstance(elt, ast.Starred):
+                    value = self.eval(elt.value)
+                    if not isinstance(value, (list, tuple, set)):
+                        return _Unknown(f"cannot unpack {ast.unparse(elt)}")
+                    items.extend(value)
+                else:
+                    items.append(self.eval(elt))
+            return set(items) if isinstance(expr, ast.Set) else items
+        if isinstance(expr, ast.Dict):
+            dct: Dict[Any, Any] = {}
+            for key, value in zip(expr.keys, expr.values):
+                evaluated = self.eval(value)
+                if key is None:
+                    if not isinstance(evaluated, dict):
+                        return _Unknown(f"cannot unpack {ast.unparse(value)}")
+                    dct.update(evaluated)
+                else:
+                    dct[self.eval(key)] = evaluated
+            return dct
+        if isinstance(expr, ast.Name):
+            if expr.id in self.locals:
+                return self.locals[expr.id]
+            return self.project._module_symbol(self.module, expr.id)
+        if isinstance(expr, ast.Attribute):
+            return self.project._getattr(self.eval(expr.value), expr.attr)
+        if isinstance(expr, ast.Subscript):
+            container = self.eval(expr.value)
+            key = self.eval(expr.slice)
+            try:
+                return container[key]
+            except (KeyError, IndexError, TypeError):
+                return _Unknown(f"cannot evaluate {ast.unparse(expr)}")
+        if isinstance(expr, ast.BinOp) and isinstance(expr.op, ast.Add):
+            return self.add(self.eval(expr.left), self.eval(expr.right))
+        if isinstance(expr, ast.JoinedStr):
+            parts = []
+            for value in expr.values:
+                part = self.eval(value)
+                if not isinstance(part, str):
+                    return _Unknown(f"cannot evaluate {ast.unparse(expr)}")
+                parts.append(part)
+            return "".join(parts)
+        if isinstance(expr, ast.FormattedValue):
+            value = self.eval(expr.value)
+            if expr.format_spec is None and expr.conversion == -1:
+                if isinstance(value, (str, int, float)):
+                    return str(value)
+            return _Unknown(f"cannot format {ast.unparse(expr.value)}")
+        if isinstance(expr, ast.Call):
+            return self.call(expr)
+        return _Unknown(f"unsupported expression: {ast.unparse(expr)}")
+
+    def add(self, left: Any, right: Any) -> Any:
+        pipes = (_StaticPipeline, _StaticNode)
+        if isinstance(left, pipes) or isinstance(right, pipes):
+            return self.project.add_pipelines(left, right)
+        if isinstance(left, (_Unknown, _External)) or isinstance(
+            right, (_Unknown, _External)
+        ):
+            return _Unknown("cannot add unresolved values")
+        try:
+            return left + right
+        except TypeError:
+            return _Unknown("cannot add values of incompatible types")
+
+    def call(self, expr: ast.Call) -> Any:
+        func = self.eval(expr.func)
+        args: List[Any] = []
+        for arg in expr.args:
+            if isinstance(arg, ast.Starred):
+                value = self.eval(arg.value)
+                if not isinstance(value, (list, tuple)):
+                    return _Unknown(f"cannot unpack {ast.unparse(arg)}")
+                args.extend(value)
+            else:
+                args.append(self.eval(arg))
+        kwargs: Dict[str, Any] = {}
+        for keyword in expr.keywords:
+            value = self.eval(keyword.value)
+            if keyword.arg is None:
+                if not isinstance(value, dict):
+                    return _Unknown(f"cannot unpack {ast.unparse(keyword.value)}")
+                kwargs.update(value)
+            else:
+                kwargs[keyword.arg] = value
+
+        if isinstance(func, _FunctionRef):
+            return self.project.call_function(func, args, kwargs)
+        if isinstance(func, _External):
+            if func.fqn in _NODE_FQNS:
+                return self.project.make_node(args, kwargs)
+            if func.fqn in _PIPELINE_FQNS:
+                return self.project.make_pipeline(args, kwargs)
+            if func.fqn in _FIND_PIPELINES_FQNS:
+                return self.project.find_pipelines()
+            if func.fqn == "builtins.sum" and args:
+                start = args[1] if len(args) > 1 else kwargs.get("start", 0)
+                if isinstance(args[0], list):
+                    return self.project.add_pipelines(start, *args[0])
+            if func.fqn in ("builtins.list", "builtins.tuple") and len(args) == 1:
+                if isinstance(args[0], (list, dict)):
+                    return list(args[0])
+            if func.fqn == "builtins.dict":
+                return dict(*args, **kwargs)
+        if isinstance(func, _BoundMethod):
+            return self.call_method(func, args, kwargs)
+        if isinstance(func, _Unknown):
+            return func
+        return _Unknown(f"unsupported call: {ast.unparse(expr.func)}")
+
+    @staticmethod
+    def call_method(method: _BoundMethod, args: List[Any], kwargs: Dict) -> Any:
+        obj, name = method.obj, method.name
+        if isinstance(obj, dict) and name in ("values", "keys", "items", "get"):
+            result = getattr(obj, name)(*args, **kwargs)
+            return result if name == "get" else list(result)
+        if isinstance(obj, dict) and name == "update":
+            obj.update(*args, **kwargs)
+            return None
+        if isinstance(obj, list) and name in ("append", "extend"):
+            getattr(obj, name)(*args)
+            return None
+        if isinstance(obj, str) and name in ("format", "join", "replace", "lower"):
+            try:
+                return getattr(obj, name)(*args, **kwargs)
+            except TypeError:
+                pass
+        return _Unknown(f"unsupported method call: {name}")
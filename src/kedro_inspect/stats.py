@@ -0,0 +1,182 @@
+"""Runtime costs of nodes, as measured by ``hooks.NodeStatsHook``.
+
+Nodes are identified as by ``analysis.node_label``. A stats directory holds::
+
+    node_runs.ndjson  one line per node run not aggregated yet, appended to by
+                      every process running nodes
+    node_stats.json   stats by node, aggregated over all earlier runs
+
+Runs are aggregated at the end of each pipeline run; ``load_node_stats`` also
+includes runs that were not, e.g. after a crash.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List
+
+from typing_extensions import TypedDict
+
+from kedro_inspect.diff import node_key
+from kedro_inspect.files import write_atomic
+
+if TYPE_CHECKING:
+    from kedro_inspect.node import InspectedNodeDict
+
+DEFAULT_STATS_DIR = ".kedro_inspect_stats"
+_RUNS_FILE = "node_runs.ndjson"
+# runs being aggregated, so that runs appended meanwhile are kept
+_AGGREGATING_FILE = "node_runs.aggregating.ndjson"
+_STATS_FILE = "node_stats.json"
+
+
+class NodeRunDict(TypedDict):
+    node: str
+    # when the node finished, in seconds since the epoch
+    time: float
+    # wall time, None if the node failed
+    seconds: float | None
+    # bytes, see ``hooks.NodeStatsHook``; None if not measured
+    peak_memory: int | None
+    # in-memory size of each saved output in bytes, None if unknown
+    output_bytes: Dict[str, int | None]
+
+
+class NodeStatsDict(TypedDict):
+    runs: int
+    failures: int
+    # wall times of successful runs
+    mean_seconds: float | None
+    max_seconds: float | None
+    last_seconds: float | None
+    last_run: float
+    # maximum over all runs
+    peak_memory: int | None
+    # sizes of the outputs when they were last saved
+    output_bytes: Dict[str, int | None]
+
+
+def data_size(data: Any) -> int | None:
+    """In-memory size of common data types in bytes, without traversing
+    objects; None for other types."""
+    memory_usage = getattr(data, "memory_usage", None)
+    if callable(memory_usage):
+        # pandas, including the index
+        try:
+            usage = memory_usage(index=True)
+        except TypeError:
+            return None
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    nbytes = getattr(data, "nbytes", None)
+    if isinstance(nbytes, int):
+        # numpy, pyarrow, polars
+        return nbytes
+    if isinstance(data, (bytes, bytearray, str)):
+        return sys.getsizeof(data)
+    return None
+
+
+def add_run(stats: Dict[str, NodeStatsDict], run: NodeRunDict) -> None:
+    node_stats = stats.get(run["node"])
+    if node_stats is None:
+        node_stats = stats[run["node"]] = {
+            "runs": 0,
+            "failures": 0,
+            "mean_seconds": None,
+            "max_seconds": None,
+            "last_seconds": None,
+            "last_run": run["time"],
+            "peak_memory": None,
+            "output_bytes": {},
+        }
+    node_stats["runs"] += 1
+    node_stats["last_run"] = max(node_stats["last_run"], run["time"])
+    seconds = run["seconds"]
+    if seconds is None:
+        node_stats["failures"] += 1
+    else:
+        n_successes = node_stats["runs"] - node_stats["failures"]
+        mean = node_stats["mean_seconds"] or 0.0
+        node_stats["mean_seconds"] = mean + (seconds - mean) / n_successes
+        node_stats["max_seconds"] = max(node_stats["max_seconds"] or 0.0, seconds)
+        node_stats["last_seconds"] = seconds
+    if run["peak_memory"] is not None:
+        node_stats["peak_memory"] = max(
+            node_stats["peak_memory"] or 0, run["peak_memory"]
+        )
+    node_stats["output_bytes"].update(run["output_bytes"])
+
+
+def append_run(directory: Path, run: NodeRunDict) -> None:
+    """Append a run with a single write, so that processes appending at the same
+    time do not interleave their lines."""
+    fd = os.open(directory / _RUNS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+    try:
+        os.write(fd, (json.dumps(run) + "\n").encode())
+    finally:
+        os.close(fd)
+
+
+def _read_runs(path: Path) -> List[NodeRunDict]:
+    try:
+        content = path.read_text()
+    except FileNotFoundError:
+        return []
+    runs = []
+    # a partially written last line is dropped
+    for line in content.splitlines(keepends=True):
+        if line.endswith("\n"):
+            runs.append(json.loads(line))
+    return runs
+
+
+def _load(directory: Path, runs_files: Iterable[str]) -> Dict[str, NodeStatsDict]:
+    try:
+        stats = json.loads((directory / _STATS_FILE).read_text())
+    except FileNotFoundError:
+        stats = {}
+    for name in runs_files:
+        for run in _read_runs(directory / name):
+            add_run(stats, run)
+    return stats
+
+
+def load_node_stats(directory: Path) -> Dict[str, NodeStatsDict]:
+    """Stats by node, including runs that were not aggregated yet."""
+    return _load(directory, [_AGGREGATING_FILE, _RUNS_FILE])
+
+
+def aggregate_runs(directory: Path) -> Dict[str, NodeStatsDict]:
+    """Fold the appended runs into the stats file and return the stats.
+
+    There must be a single process aggregating at a time.
+    """
+    runs_path = directory / _RUNS_FILE
+    aggregating_path = directory / _AGGREGATING_FILE
+    if runs_path.exists() and not aggregating_path.exists():
+        os.replace(runs_path, aggregating_path)
+    stats = _load(directory, [_AGGREGATING_FILE])
+    write_atomic(directory / _STATS_FILE, json.dumps(stats).encode())
+    aggregating_path.unlink(missing_ok=True)
+    return stats
+
+
+def merge_stats(
+    node_dicts: Iterable[InspectedNodeDict], stats: Dict[str, NodeStatsDict]
+) -> Iterator[InspectedNodeDict]:
+    """Copies of the node dicts with the stats of each node that has any."""
+    for dct in node_dicts:
+        node_stats = stats.get(node_key(dct))
+        yield dct if node_stats is None else {**dct, "stats": node_stats}
+
+
+def stats_costs(stats: Dict[str, NodeStatsDict]) -> Dict[str, float]:
+    """Mean wall time by node, e.g. as costs for ``analysis.node_costs``."""
+    return {
+        node: node_stats["mean_seconds"]
+        for node, node_stats in stats.items()
+        if node_stats["mean_seconds"] is not None
+    }
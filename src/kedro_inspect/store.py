@@ -0,0 +1,385 @@
+"""Append-only store of pipeline inspections, e.g. one per commit.
+
+Nodes are stored once per distinct content and snapshots refer to them by
+record number, so the store only grows with actual changes. Records and
+snapshots are located through fixed-size, memory-mapped index files, so queries
+read only the snapshots and nodes they need. Node histories are chained per node
+key, so they are found without reading any snapshot::
+
+    records.dat    node dicts, JSON encoded, back to back
+    records.idx    per record: fingerprint, offset, length and node key id
+    keys.ndjson    node keys (see ``diff.node_key``), a record's key id is a line
+    snapshots.dat  per snapshot: its label followed by its record numbers
+    snapshots.idx  per snapshot: offset, label length, number of nodes and time
+    history.idx    per node key and snapshot it was added, changed or removed
+                   in: key id, snapshot, record number and previous entry
+
+Data is appended before the index entries pointing to it, so an interrupted
+write leaves at most unreferenced bytes behind. There must be a single writer.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Tuple,
+)
+
+from typing_extensions import Self, TypedDict
+
+from kedro_inspect.codec import get_codec
+from kedro_inspect.diff import node_key
+from kedro_inspect.node import fingerprint_node_dict
+from kedro_inspect.pipeline import InspectedPipeline
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from kedro_inspect.node import InspectedNodeDict
+
+# fingerprint, offset, length, key id
+_RECORD = struct.Struct("<16sQII")
+# offset, label length, number of nodes, creation time
+_SNAPSHOT = struct.Struct("<QIId")
+# record numbers of a snapshot, stored little-endian
+_RECORD_NUMBER = "I"
+# key id, snapshot, record number, previous entry of the key or -1
+_HISTORY = struct.Struct("<IIIi")
+# record number of a node removed in a snapshot
+_REMOVED = 0xFFFFFFFF
+
+
+class SnapshotDict(TypedDict):
+    id: int
+    label: str
+    created: float
+    n_nodes: int
+
+
+class NodeVersionDict(TypedDict):
+    snapshot: int
+    label: str
+    # None if the node was removed in this snapshot
+    fingerprint: str | None
+
+
+class _AppendOnlyFile:
+    """File that is only appended to and read through a memory map."""
+
+    def __init__(self, path: Path, entry_size: int = 1) -> None:
+        self._file = open(path, "a+b")
+        size = os.fstat(self._file.fileno()).st_size
+        if size % entry_size:
+            # drop a partially written entry
+            size -= size % entry_size
+            self._file.truncate(size)
+        self.size = size
+        self._map: mmap.mmap | None = None
+
+    def truncate(self, size: int) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.truncate(size)
+        self.size = size
+
+    def append(self, data: bytes) -> int:
+        offset = self.size
+        self._file.write(data)
+        self._file.flush()
+        self.size += len(data)
+        return offset
+
+    def read(self, offset: int, length: int) -> bytes:
+        if not length:
+            # empty files cannot be mapped
+            return b""
+        if self._map is None or len(self._map) < offset + length:
+            # remap after appends
+            if self._map is not None:
+                self._map.close()
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset : offset + length]
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+
+class _FixedIndex:
+    """Array of fixed-size ``struct`` entries in an ``_AppendOnlyFile``."""
+
+    def __init__(self, path: Path, entry: struct.Struct) -> None:
+        self.entry = entry
+        self.file = _AppendOnlyFile(path, entry.size)
+
+    def __len__(self) -> int:
+        return self.file.size // self.entry.size
+
+    def __getitem__(self, idx: int) -> Tuple:
+        if not 0 <= idx < len(self):
+            raise IndexError(idx)
+        return self.entry.unpack(self.file.read(idx * self.entry.size, self.entry.size))
+
+    def __iter__(self) -> Iterator[Tuple]:
+        if self.file.size:
+            yield from self.entry.iter_unpack(self.file.read(0, self.file.size))
+
+    def append(self, *values: object) -> int:
+        self.file.append(self.entry.pack(*values))
+        return len(self) - 1
+
+    def truncate(self, length: int) -> None:
+        self.file.truncate(length * self.entry.size)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class SnapshotStore:
+    """Append-only history of pipeline inspections in ``directory``."""
+
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self._codec = get_codec("json")
+        self._records = _FixedIndex(directory / "records.idx", _RECORD)
+        self._record_data = _AppendOnlyFile(directory / "records.dat")
+        self._snapshots = _FixedIndex(directory / "snapshots.idx", _SNAPSHOT)
+        self._snapshot_data = _AppendOnlyFile(directory / "snapshots.dat")
+        self._keys_path = directory / "keys.ndjson"
+        self._keys = self._load_keys()
+        self._keys_file = self._keys_path.open("a")
+
+        self._record_numbers: Dict[bytes, int] = {}
+        # key id of every record
+        self._record_keys = array("I")
+        for number, (digest, _, _, key_id) in enumerate(self._records):
+            self._record_numbers[digest] = number
+            self._record_keys.append(key_id)
+        # latest snapshot by label
+        self._labels: Dict[str, int] = {}
+        for idx, (offset, label_length, _, _) in enumerate(self._snapshots):
+            self._labels[self._snapshot_data.read(offset, label_length).decode()] = idx
+        self._history = self._open_history()
+
+    def _open_history(self) -> _FixedIndex:
+        path = self.directory / "history.idx"
+        # latest history entry by key id
+        self._heads: Dict[int, int] = {}
+        # record number by key id of the nodes in the latest snapshot
+        self._live: Dict[int, int] = {}
+        if not path.exists():
+            # stores written before the history index existed
+            tmp_path = path.with_name(f".{path.name}.tmp")
+            tmp_path.unlink(missing_ok=True)
+            history = _FixedIndex(tmp_path, _HISTORY)
+            for idx in range(len(self)):
+                self._add_history(history, idx, self._snapshot_records(idx))
+            history.close()
+            os.replace(tmp_path, path)
+            self._heads.clear()
+            self._live.clear()
+
+        history = _FixedIndex(path, _HISTORY)
+        n_entries = 0
+        for entry, (key_id, idx, number, _) in enumerate(history):
+            if idx >= len(self):
+                # entries of a snapshot that was not written
+                break
+            self._heads[key_id] = entry
+            if number == _REMOVED:
+                self._live.pop(key_id, None)
+            else:
+                self._live[key_id] = number
+            n_entries = entry + 1
+        if n_entries < len(history):
+            history.truncate(n_entries)
+        return history
+
+    def _add_history(self, history: _FixedIndex, idx: int, numbers: array) -> None:
+        """Append the history entries of the keys that snapshot ``idx`` adds,
+        changes or removes."""
+        latest: Dict[int, int] = {}
+        for number in numbers:
+            key_id = self._record_keys[number]
+            # the first record of a key if several nodes share it
+            if number < latest.get(key_id, _REMOVED):
+                latest[key_id] = number
+        changes = [
+            (key_id, number)
+            for key_id, number in latest.items()
+            if self._live.get(key_id) != number
+        ]
+        changes += [(key_id, _REMOVED) for key_id in self._live if key_id not in latest]
+        for key_id, number in changes:
+            self._heads[key_id] = history.append(
+                key_id, idx, number, self._heads.get(key_id, -1)
+            )
+            if number == _REMOVED:
+                del self._live[key_id]
+            else:
+                self._live[key_id] = number
+
+    def _load_keys(self) -> Dict[str, int]:
+        try:
+            content = self._keys_path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        # drop a partially written key
+        complete = content[: content.rfind(b"\n") + 1]
+        if len(complete) != len(content):
+            with self._keys_path.open("r+b") as f:
+                f.truncate(len(complete))
+        lines = complete.decode().splitlines()
+        return {json.loads(line): key_id for key_id, line in enumerate(lines)}
+
+    def _key_id(self, key: str) -> int:
+        if key not in self._keys:
+            self._keys_file.write(json.dumps(key) + "\n")
+            self._keys_file.flush()
+            self._keys[key] = len(self._keys)
+        return self._keys[key]
+
+    def _add_record(self, dct: InspectedNodeDict) -> int:
+        digest = bytes.fromhex(fingerprint_node_dict(dct))
+        number = self._record_numbers.get(digest)
+        if number is None:
+            key_id = self._key_id(node_key(dct))
+            data = self._codec.encode(dct)
+            offset = self._record_data.append(data)
+            number = self._records.append(digest, offset, len(data), key_id)
+            self._record_numbers[digest] = number
+            self._record_keys.append(key_id)
+        return number
+
+    def add(self, pipeline: InspectedPipeline, label: str) -> int:
+        """Append a snapshot of ``pipeline`` and return its id.
+
+        Only nodes not stored by an earlier snapshot are written.
+        """
+        numbers = array(_RECORD_NUMBER, map(self._add_record, pipeline.iter_dicts()))
+        # the history entries refer to the snapshot before it is appended, they
+        # are dropped when the store is opened again if appending fails
+        self._add_history(self._history, len(self), numbers)
+        if sys.byteorder == "big":
+            numbers.byteswap()
+        encoded_label = label.encode()
+        offset = self._snapshot_data.append(encoded_label + numbers.tobytes())
+        idx = self._snapshots.append(
+            offset, len(encoded_label), len(numbers), time.time()
+        )
+        self._labels[label] = idx
+        return idx
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    @property
+    def n_records(self) -> int:
+        return len(self._records)
+
+    def snapshot(self, snapshot: int | str) -> SnapshotDict:
+        """Metadata of a snapshot given by id or label; the latest snapshot with
+        a label if several share it."""
+        idx = self._resolve(snapshot)
+        offset, label_length, n_nodes, created = self._snapshots[idx]
+        label = self._snapshot_data.read(offset, label_length).decode()
+        return {"id": idx, "label": label, "created": created, "n_nodes": n_nodes}
+
+    def snapshots(self) -> List[SnapshotDict]:
+        return [self.snapshot(idx) for idx in range(len(self))]
+
+    def _resolve(self, snapshot: int | str) -> int:
+        if isinstance(snapshot, int):
+            if not 0 <= snapshot < len(self):
+                raise KeyError(f"No snapshot with id {snapshot}.")
+            return snapshot
+        if snapshot not in self._labels:
+            raise KeyError(f"No snapshot labelled {snapshot!r}.")
+        return self._labels[snapshot]
+
+    def _snapshot_records(self, idx: int) -> array:
+        offset, label_length, n_nodes, _ = self._snapshots[idx]
+        numbers = array(_RECORD_NUMBER)
+        numbers.frombytes(
+            self._snapshot_data.read(offset + label_length, n_nodes * numbers.itemsize)
+        )
+        if sys.byteorder == "big":
+            numbers.byteswap()
+        return numbers
+
+    def _read_record(self, number: int) -> InspectedNodeDict:
+        _, offset, length, _ = self._records[number]
+        return self._codec.decode(self._record_data.read(offset, length))
+
+    def load_dicts(self, snapshot: int | str) -> Iterator[InspectedNodeDict]:
+        """Decode the nodes of one snapshot, in their original order."""
+        for number in self._snapshot_records(self._resolve(snapshot)):
+            yield self._read_record(number)
+
+    def load(self, snapshot: int | str, lazy: bool = True) -> InspectedPipeline:
+        return InspectedPipeline.from_node_dicts(self.load_dicts(snapshot), lazy)
+
+    def _key_history(self, key: str) -> Iterator[Tuple[int, int]]:
+        """Snapshot and record number of the history entries of a key, latest
+        first."""
+        key_id = self._keys.get(key)
+        entry = -1 if key_id is None else self._heads.get(key_id, -1)
+        while entry >= 0:
+            _, idx, number, entry = self._history[entry]
+            yield idx, number
+
+    def node(self, snapshot: int | str, key: str) -> InspectedNodeDict | None:
+        """Decode a single node of a snapshot, identified as by ``diff.node_key``."""
+        idx = self._resolve(snapshot)
+        for changed, number in self._key_history(key):
+            if changed <= idx:
+                return None if number == _REMOVED else self._read_record(number)
+        return None
+
+    def node_history(self, key: str) -> List[NodeVersionDict]:
+        """Snapshots in which the node identified by ``key`` was added, changed
+        or removed, without decoding any node."""
+        history: List[NodeVersionDict] = [
+            {
+                "snapshot": idx,
+                "label": self.snapshot(idx)["label"],
+                "fingerprint": (
+                    None if number == _REMOVED else self._records[number][0].hex()
+                ),
+            }
+            for idx, number in self._key_history(key)
+        ]
+        return history[::-1]
+
+    def close(self) -> None:
+        self._records.close()
+        self._record_data.close()
+        self._snapshots.close()
+        self._snapshot_data.close()
+        self._history.close()
+        self._keys_file.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import collections.abc
+import types
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    ForwardRef,
+    List,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from typing_extensions import (
+    Literal,
+    TypedDict,
+    get_args,
+    get_origin,
+    get_type_hints,
+    is_typeddict,
+)
+
+from kedro_inspect.analysis import node_label
+from kedro_inspect.index import strip_transcoding
+from kedro_inspect.serialisation import LazyFQN, UnresolvedAnnotation, obj_to_fqn
+
+if TYPE_CHECKING:
+    from kedro_inspect.node import FrozenDatasets
+    from kedro_inspect.pipeline import InspectedPipeline
+
+_UNION_ORIGINS = {Union, getattr(types, "UnionType", Union)}
+# PEP 484 numeric tower: int is acceptable where float or complex is expected
+_NUMERIC_PROMOTIONS = {(int, float), (int, complex), (float, complex)}
+
+
+class TypeMismatchDict(TypedDict):
+    dataset: str
+    producer: str
+    consumer: str
+    parameter: str
+    provided: str
+    expected: str
+
+
+def format_type(typ: Any) -> str:
+    if isinstance(typ, (type, LazyFQN)):
+        return obj_to_fqn(typ)
+    if isinstance(typ, UnresolvedAnnotation):
+        return typ.annotation
+    return repr(typ)
+
+
+def _is_unknown(typ: Any) -> bool:
+    return (
+        typ is Any
+        or typ is object
+        or isinstance(typ, (LazyFQN, UnresolvedAnnotation, str, ForwardRef, TypeVar))
+    )
+
+
+def _unwrap_new_type(typ: Any) -> Any:
+    while hasattr(typ, "__supertype__"):
+        typ = typ.__supertype__
+    return typ
+
+
+def _compatible_args(provided: Tuple[Any, ...], expected: Tuple[Any, ...]) -> bool:
+    if not provided or not expected:
+        return True
+    if len(expected) == 2 and expected[1] is Ellipsis:
+        # Tuple[X, ...]
+        return all(
+            is_compatible(arg, expected[0]) for arg in provided if arg is not ...
+        )
+    if len(provided) != len(expected):
+        return True
+    return all(is_compatible(p, e) for p, e in zip(provided, expected))
+
+
+def _check(provided: Any, expected: Any) -> bool:
+    if provided is expected or _is_unknown(provided) or _is_unknown(expected):
+        return True
+    provided = _unwrap_new_type(provided)
+    expected = _unwrap_new_type(expected)
+    p_origin = get_origin(provided)
+    e_origin = get_origin(expected)
+
+    if p_origin in _UNION_ORIGINS:
+        return all(is_compatible(arg, expected) for arg in get_args(provided))
+    if e_origin in _UNION_ORIGINS:
+        return any(is_compatible(provided, arg) for arg in get_args(expected))
+    if p_origin is Literal:
+        if e_origin is Literal:
+            return set(get_args(provided)) <= set(get_args(expected))
+        return all(is_compatible(type(value), expected) for value in get_args(provided))
+    if e_origin is Literal:
+        # a value of the provided type may be one of the literals
+        return any(is_compatible(type(value), provided) for value in get_args(expected))
+
+    p_cls = p_origin or provided
+    e_cls = e_origin or expected
+    if not isinstance(p_cls, type) or not isinstance(e_cls, type):
+        return True
+    try:
+        if not issubclass(p_cls, e_cls):
+            return any(
+                issubclass(p_cls, narrow) and e_cls is wide
+                for narrow, wide in _NUMERIC_PROMOTIONS
+            )
+    except TypeError:
+        # e.g. protocols that are not runtime checkable
+        return True
+    if e_cls is collections.abc.Callable:
+        return True
+    return _compatible_args(get_args(provided), get_args(expected))
+
+
+# bounded, since a long-running server sees the types of every reloaded module
+@lru_cache(maxsize=4096)
+def _is_compatible_cached(provided: Any, expected: Any) -> bool:
+    return _check(provided, expected)
+
+
+def is_compatible(provided: Any, expected: Any) -> bool:
+    """Whether a value of type ``provided`` can be passed where ``expected`` is
+    declared. Lenient: types that cannot be compared, such as unresolved forward
+    references and type variables, are compatible with anything.
+
+    Results are memoised, so checking many edges between the same types is cheap.
+    """
+    try:
+        return _is_compatible_cached(provided, expected)
+    except TypeError:
+        # unhashable type hint
+        return _check(provided, expected)
+
+
+def _element_type(container: Any, key: str | int) -> Any:
+    origin = get_origin(container)
+    args = get_args(container)
+    if isinstance(key, str):
+        if is_typeddict(container):
+            try:
+                return get_type_hints(container).get(key, Any)
+            except Exception:  # noqa: BLE001 - unresolvable field annotations
+                return Any
+        if isinstance(origin, type) and issubclass(origin, Mapping) and len(args) == 2:
+            return args[1]
+        return Any
+    if origin is tuple and args:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return args[0]
+        return args[key] if key < len(args) else Any
+    if (
+        isinstance(origin, type)
+        and issubclass(origin, collections.abc.Sequence)
+        and len(args) == 1
+    ):
+        return args[0]
+    return Any
+
+
+def output_types(return_type: Any, outputs: FrozenDatasets) -> Dict[str, Any]:
+    """Type of each output dataset, taken from a node's return type annotation.
+
+    List outputs are matched with the elements of a tuple or sequence type and
+    dict outputs with the values of a TypedDict or mapping type.
+    """
+    if outputs is None:
+        return {}
+    if isinstance(outputs, str):
+        return {outputs: return_type}
+    if isinstance(outputs, Mapping):
+        return {ds: _element_type(return_type, key) for key, ds in outputs.items()}
+    return {ds: _element_type(return_type, idx) for idx, ds in enumerate(outputs)}
+
+
+def _resolved(get: Callable[[], Any]) -> Any:
+    try:
+        return get()
+    except ValueError:
+        # lazily loaded type hint that cannot be imported
+        return Any
+
+
+def check_types(pipeline: InspectedPipeline) -> List[TypeMismatchDict]:
+    """Compare the return type of each dataset's producer with the type hints of
+    the parameters it is passed to.
+
+    Datasets bound to ``*args`` or ``**kwargs`` are compared with the annotation
+    of the variadic parameter. Edges whose producer and consumer use different
+    transcodings of a dataset are skipped.
+    """
+    nodes = pipeline.nodes
+    index = pipeline.index
+    outputs: Dict[int, Dict[str, Any]] = {}
+    param_hints: Dict[int, Dict[str, Any]] = {}
+    mismatches: List[TypeMismatchDict] = []
+
+    for consumer in nodes:
+        # parameter tuples are shared between functions with the same signature
+        params = consumer.function.parameters
+        hints = param_hints.get(id(params))
+        if hints is None:
+            hints = param_hints[id(params)] = {
+                arg.name: _resolved(lambda: arg.type_hint) for arg in params
+            }
+        for param, datasets in consumer.param_to_input.items():
+            expected = hints.get(param, Any)
+            if _is_unknown(expected):
+                continue
+            for dataset in datasets:
+                idx = index.producers.get(strip_transcoding(dataset))
+                if idx is None:
+                    continue
+                if idx not in outputs:
+                    producer = nodes[idx]
+                    outputs[idx] = output_types(
+                        _resolved(lambda: producer.function.return_value),
+                        producer.outputs,
+                    )
+                provided = outputs[idx].get(dataset, Any)
+                if not is_compatible(provided, expected):
+                    mismatches.append(
+                        {
+                            "dataset": dataset,
+                            "producer": node_label(nodes[idx]),
+                            "consumer": node_label(consumer),
+                            "parameter": param,
+                            "provided": format_type(provided),
+                            "expected": format_type(expected),
+                        }
+                    )
+    return mismatches
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+from kedro_inspect.files import write_atomic
+
+if TYPE_CHECKING:
+    from kedro_inspect.node import InspectedNodeDict
+    from kedro_inspect.pipeline import InspectedPipeline
+    from kedro_inspect.server import InspectionService
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_DEBOUNCE = 0.2
+
+
+class Watcher:
+    """Keeps an output file up to date with the inspection of a project.
+
+    The files of the project's modules are polled, so no OS-specific file
+    notifications are needed. Changed modules are reloaded once their files have
+    not changed for ``debounce`` seconds, ``service`` then re-inspects only the
+    nodes whose function, tags or confirms changed, and the output is replaced
+    atomically if its content differs.
+    """
+
+    def __init__(
+        self,
+        service: InspectionService,
+        names: List[str],
+        output: Path,
+        encode: Callable[[Dict[str, List[InspectedNodeDict]]], bytes],
+        select: Callable[[InspectedPipeline], InspectedPipeline] | None = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ) -> None:
+        self.service = service
+        self.names = names
+        self.output = output
+        self.encode = encode
+        self.select = select
+        self.debounce = debounce
+        self._written: bytes | None = None
+        self._pending: Dict[str, int] = {}
+        self._pending_since = 0.0
+        self._failed: Dict[str, int] = {}
+
+    def inspect(self) -> Dict[str, List[InspectedNodeDict]]:
+        results = {}
+        for name in self.names:
+            entry = self.service.inspect(name)
+            if self.select is None:
+                results[name] = entry.dicts
+                continue
+            dicts = {
+                id(node): dct for node, dct in zip(entry.pipeline.nodes, entry.dicts)
+            }
+            results[name] = [
+                dicts[id(node)] for node in self.select(entry.pipeline).nodes
+            ]
+        return results
+
+    def write(self) -> bool:
+        """Write the output if it changed, return whether it did."""
+        encoded = self.encode(self.inspect())
+        if encoded == self._written:
+            return False
+        write_atomic(self.output, encoded)
+        self._written = encoded
+        return True
+
+    def poll(self) -> List[str]:
+        """Check the project for changes once and return status messages."""
+        pending = self.service.reloader.pending()
+        now = time.monotonic()
+        if pending != self._pending:
+            # wait for the files to settle, editors may write several times
+            self._pending, self._pending_since = pending, now
+            return []
+        if not pending or pending == self._failed:
+            return []
+        if now - self._pending_since < self.debounce:
+            return []
+
+        try:
+            reloaded = self.service.refresh()
+            if self.service.reload_errors:
+                # retried once the failing files change again
+                self._failed = pending
+                return [
+                    f"could not reload {module}: {error}"
+                    for module, error in self.service.reload_errors.items()
+                ]
+            self._failed = {}
+            written = self.write()
+        except Exception as exc:  # noqa: BLE001 - errors in the project's code
+            self._failed = pending
+            return [f"could not inspect the project: {type(exc).__name__}: {exc}"]
+        modules = ", ".join(reloaded)
+        if not written:
+            return [f"reloaded {modules}, the inspection did not change"]
+        return [f"reloaded {modules}, wrote {self.output}"]
+
+    def run(
+        self, interval: float = DEFAULT_INTERVAL, stop: threading.Event | None = None
+    ) -> None:
+        """Poll every ``interval`` seconds until ``stop`` is set."""
+        stop = stop or threading.Event()
+        timeout = interval
+        while not stop.wait(timeout):
+            for message in self.poll():
+                print(message, file=sys.stderr)
+            settling = self._pending and self._pending != self._failed
+            # check again as soon as pending changes may have settled
+            timeout = min(interval, self.debounce) if settling else interval
@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterator
+
+import pytest
+from kedro import __version__ as kedro_version
+
+
+@pytest.fixture
+def make_project(tmp_path: Path) -> Iterator[Callable[[str, Dict[str, str]], Path]]:
+    """Writes a Kedro project with a package of the given name and files, given
+    by path relative to the package. The package's modules are unloaded again
+    after the test."""
+    packages = []
+
+    def make(package_name: str, files: Dict[str, str]) -> Path:
+        packages.append(package_name)
+        (tmp_path / "pyproject.toml").write_text(
+            f'[tool.kedro]\npackage_name = "{package_name}"\n'
+            f'project_name = "{package_name}"\n'
+            f'kedro_init_version = "{kedro_version}"\n'
+        )
+        package = tmp_path / "src" / package_name
+        package.mkdir(parents=True)
+        files = {"__init__.py": "", "settings.py": "", **files}
+        for name, content in files.items():
+            path = package / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        return tmp_path
+
+    try:
+        yield make
+    finally:
+        for name in [m for m in sys.modules if m.split(".")[0] in packages]:
+            del sys.modules[name]
+        src = str(tmp_path / "src")
+        while src in sys.path:
+            sys.path.remove(src)
@@ -0,0 +1,127 @@
+import pytest
+from kedro.pipeline import Pipeline, node
+from typing_extensions import Any
+
+from kedro_inspect.analysis import (
+    analyze_pipeline,
+    estimate_makespan,
+    node_costs,
+    node_label,
+    summarise_analysis,
+)
+from kedro_inspect.diff import node_key
+from kedro_inspect.pipeline import InspectedPipeline
+
+
+def identity(x) -> Any:
+    return x
+
+
+def concat(*parts) -> Any:
+    return parts
+
+
+@pytest.fixture
+def pipe() -> InspectedPipeline:
+    return InspectedPipeline.from_kedro_pipeline(
+        Pipeline(
+            [
+                node(identity, "raw", "clean", name="clean", tags=["cost_2"]),
+                node(identity, "clean", "model", name="train", namespace="ds"),
+                node(identity, "clean", "stats", name="describe"),
+                node(concat, ["model", "stats"], "report", name="report"),
+                node(identity, "other", "unrelated", name="unrelated"),
+            ]
+        )
+    )
+
+
+def costs_by_name(pipe: InspectedPipeline, costs: list) -> dict:
+    return {node.full_name: cost for node, cost in zip(pipe.nodes, costs)}
+
+
+def test_node_costs(pipe: InspectedPipeline) -> None:
+    costs = node_costs(pipe, {"ds.train": 3, "unrelated": 4})
+    assert costs_by_name(pipe, costs) == {
+        "clean": 2.0,
+        "ds.train": 3.0,
+        "describe": 1.0,
+        "report": 1.0,
+        "unrelated": 4.0,
+    }
+    costs = node_costs(pipe, {"clean": 5}, tag_prefix=None, default=0)
+    assert costs_by_name(pipe, costs)["clean"] == 5.0
+    assert sum(costs) == 5.0
+
+    pipe.nodes[0].tags = {"cost_high"}
+    with pytest.raises(ValueError, match="invalid cost tag 'cost_high'"):
+        node_costs(pipe)
+    with pytest.raises(ValueError, match="negative cost"):
+        node_costs(pipe, {name: -1 for name in pipe.index.names})
+
+
+def test_node_label_of_unnamed_nodes() -> None:
+    pipe = InspectedPipeline.from_kedro_pipeline(
+        Pipeline(
+            [
+                node(identity, "raw", "clean"),
+                node(identity, {"x": "clean"}, ["a", "b"], namespace="ds"),
+                node(identity, "clean", "named", name="named"),
+            ]
+        )
+    )
+    labels = [node_label(node) for node in pipe.nodes]
+
+    assert labels == [node_key(node.to_dict()) for node in pipe.nodes]
+    assert f"{__name__}.identity([raw]) -> [clean]" in labels
+
+
+def test_analyze_pipeline(pipe: InspectedPipeline) -> None:
+    costs = node_costs(pipe, {"ds.train": 3, "unrelated": 4})
+    analysis = analyze_pipeline(pipe, costs, workers=[1, 2, 8], include_levels=True)
+
+    assert analysis["n_nodes"] == 5
+    assert analysis["n_dependencies"] == 4
+    assert analysis["level_widths"] == [2, 2, 1]
+    assert analysis["max_width"] == 2
+    assert [sorted(level) for level in analysis["levels"]] == [
+        ["clean", "unrelated"],
+        ["describe", "ds.train"],
+        ["report"],
+    ]
+    assert analysis["total_cost"] == 11
+    assert analysis["critical_path"] == ["clean", "ds.train", "report"]
+    assert analysis["critical_path_cost"] == 6
+    assert analysis["parallelism"] == 11 / 6
+    assert [
+        (s["workers"], s["makespan"], s["lower_bound"]) for s in analysis["schedules"]
+    ] == [(1, 11, 11), (2, 6, 6), (8, 6, 6)]
+    assert analysis["schedules"][1]["efficiency"] == 11 / 12
+    assert (
+        summarise_analysis(analysis)[3] == "critical path: clean -> ds.train -> report"
+    )
+
+
+def test_makespan_prefers_the_critical_path() -> None:
+    pipe = InspectedPipeline.from_kedro_pipeline(
+        Pipeline(
+            [
+                node(identity, "a", "short", name="short"),
+                node(identity, "b", "long", name="long"),
+                node(identity, "long", "tail", name="tail"),
+            ]
+        )
+    )
+    costs = node_costs(pipe, {"short": 2, "long": 2, "tail": 2})
+    # running the short node first would take 6
+    assert estimate_makespan(pipe.index, costs, 2) == 4
+    assert estimate_makespan(pipe.index, costs, 1) == 6
+    with pytest.raises(ValueError, match="at least 1"):
+        estimate_makespan(pipe.index, costs, 0)
+
+
+def test_analyze_empty_pipeline() -> None:
+    analysis = analyze_pipeline(InspectedPipeline([]), workers=[4])
+    assert analysis["critical_path"] == []
+    assert analysis["max_width"] == 0
+    assert analysis["schedules"][0]["makespan"] == 0
@@ -0,0 +1,87 @@
+from pathlib import Path
+
+from kedro import __version__ as kedro_version
+
+from kedro_inspect.batch import expand_projects, iter_batch, make_report
+
+PACKAGE = "batch_proj"
+
+REGISTRY = """
+from kedro.pipeline import node, pipeline
+
+
+def {func}(data: int) -> int:
+    return data
+
+
+def register_pipelines():
+    return {{"__default__": pipeline([node({func}, "raw", "out", name="{func}")])}}
+"""
+
+
+def write_project(root: Path, func: str) -> Path:
+    # all projects share the package name, which only works in separate processes
+    root.mkdir()
+    (root / "pyproject.toml").write_text(
+        f'[tool.kedro]\npackage_name = "{PACKAGE}"\nproject_name = "{root.name}"\n'
+        f'kedro_init_version = "{kedro_version}"\n'
+    )
+    package = root / "src" / PACKAGE
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "settings.py").write_text("")
+    (package / "pipeline_registry.py").write_text(REGISTRY.format(func=func))
+    return root
+
+
+def test_expand_projects(tmp_path: Path) -> None:
+    first = write_project(tmp_path / "first", "clean")
+    second = write_project(tmp_path / "second", "train")
+    (tmp_path / "not_a_project").mkdir()
+
+    assert expand_projects([f"{tmp_path}/*", str(first)]) == [first, second]
+    assert expand_projects([str(tmp_path / "missing")]) == [tmp_path / "missing"]
+
+
+def test_iter_batch(tmp_path: Path) -> None:
+    first = write_project(tmp_path / "first", "clean")
+    second = write_project(tmp_path / "second", "train")
+    broken = write_project(tmp_path / "broken", "fit")
+    (broken / "src" / PACKAGE / "pipeline_registry.py").write_text("raise ImportError")
+
+    results = list(
+        iter_batch([first, second, broken], jobs=2, pipeline_names=["__default__"])
+    )
+    report = make_report(results, 1.0)
+
+    assert [result["project"] for result in report["projects"]] == [
+        str(broken),
+        str(first),
+        str(second),
+    ]
+    assert report["n_failed"] == 1
+    failed, first_result, second_result = report["projects"]
+    assert "ImportError" in failed["error"]
+    assert failed["pipelines"] == {}
+    assert first_result["error"] is None
+    ((node,),) = [p["nodes"] for p in first_result["pipelines"].values()]
+    assert node["function"]["func"] == f"{PACKAGE}.pipeline_registry.clean"
+    ((node,),) = [p["nodes"] for p in second_result["pipelines"].values()]
+    assert node["function"]["func"] == f"{PACKAGE}.pipeline_registry.train"
+    assert all(result["seconds"] > 0 for result in results)
+
+
+def test_iter_batch_reports_crashed_workers(tmp_path: Path) -> None:
+    project = write_project(tmp_path / "project", "clean")
+    crashed = write_project(tmp_path / "crashed", "fit")
+    (crashed / "src" / PACKAGE / "pipeline_registry.py").write_text(
+        "import os\n\nos._exit(1)\n"
+    )
+
+    results = {
+        result["project"]: result for result in iter_batch([crashed, project], jobs=1)
+    }
+
+    assert "BrokenProcessPool" in results[str(crashed)]["error"]
+    assert results[str(crashed)]["pipelines"] == {}
+    assert results[str(project)]["error"] is None
@@ -0,0 +1,78 @@
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from kedro.pipeline import Pipeline, node
+
+from kedro_inspect.cache import InspectionCache
+from kedro_inspect.pipeline import InspectedPipeline
+
+MODULE = """
+def identity(x: int) -> int:
+    return x
+"""
+
+
+@pytest.fixture
+def funcs_module(tmp_path: Path):
+    (tmp_path / "cached_funcs.py").write_text(MODULE)
+    sys.path.insert(0, str(tmp_path))
+    try:
+        yield importlib.import_module("cached_funcs")
+    finally:
+        sys.path.remove(str(tmp_path))
+        del sys.modules["cached_funcs"]
+
+
+def make_pipeline(module) -> Pipeline:
+    return Pipeline(
+        [
+            node(module.identity, "a", "b", name="first"),
+            node(module.identity, "b", "c", name="second"),
+        ]
+    )
+
+
+def test_cache_reuses_unchanged_nodes(funcs_module, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    pipe = make_pipeline(funcs_module)
+
+    cache = InspectionCache(cache_dir)
+    expected = InspectedPipeline.from_kedro_pipeline(pipe, disk_cache=cache)
+    cache.save()
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    cache = InspectionCache(cache_dir)
+    cached = InspectedPipeline.from_kedro_pipeline(pipe, disk_cache=cache)
+    assert (cache.hits, cache.misses) == (2, 0)
+    assert cached == expected
+    assert cached.nodes[0].function.func is funcs_module.identity
+
+
+def test_cache_invalidates_changed_nodes(funcs_module, tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    cache = InspectionCache(cache_dir)
+    InspectedPipeline.from_kedro_pipeline(make_pipeline(funcs_module), disk_cache=cache)
+    cache.save()
+
+    cache = InspectionCache(cache_dir)
+    pipe = Pipeline(
+        [
+            node(funcs_module.identity, "a", "b", name="first"),
+            node(funcs_module.identity, "b", "c", name="renamed"),
+        ]
+    )
+    InspectedPipeline.from_kedro_pipeline(pipe, disk_cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    (tmp_path / "cached_funcs.py").write_text(MODULE + "\n# edited\n")
+    cache = InspectionCache(cache_dir)
+    InspectedPipeline.from_kedro_pipeline(pipe, disk_cache=cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+
+def test_cache_ignores_corrupt_file(tmp_path: Path) -> None:
+    (tmp_path / "nodes.json").write_text("not json")
+    cache = InspectionCache(tmp_path)
+    assert cache.get(node(len, "a", "b")) is None
@@ -0,0 +1,92 @@
+from pathlib import Path
+
+from kedro.io import AbstractDataset
+
+from kedro_inspect.catalog import CatalogInspector, load_catalog_config
+
+
+class ExplodingDataset(AbstractDataset):
+    def __init__(self, **kwargs) -> None:
+        raise AssertionError("datasets must not be instantiated")
+
+    def load(self):  # pragma: no cover
+        pass
+
+    def save(self, data) -> None:  # pragma: no cover
+        pass
+
+    def _describe(self) -> dict:  # pragma: no cover
+        return {}
+
+
+CONFIG = {
+    "_anchor": {"type": "ignored"},
+    "cars": {
+        "type": f"{__name__}.ExplodingDataset",
+        "filepath": "data/01_raw/cars.csv",
+        "credentials": "s3",
+        "load_args": {"sep": ","},
+        "metadata": {"kedro-viz": {"layer": "raw"}},
+    },
+    "{name}_model": {
+        "type": "MemoryDataset",
+        "filepath": "data/06_models/{name}.pkl",
+        "credentials": {"secret": "value"},
+    },
+    "table@pandas": {"type": "missing.Dataset"},
+}
+
+
+def test_catalog_inspector() -> None:
+    infos = CatalogInspector(CONFIG).inspect(
+        ["cars", "rf_model", "other", "table@pandas", "params:alpha", "cars"]
+    )
+
+    assert list(infos) == ["cars", "other", "params:alpha", "rf_model", "table@pandas"]
+    assert infos["cars"] == {
+        "source": "catalog",
+        "type": f"{__name__}.ExplodingDataset",
+        "class_fqn": f"{__name__}.ExplodingDataset",
+        "filepath": "data/01_raw/cars.csv",
+        "layer": "raw",
+        "params": {"credentials": "s3", "load_args": {"sep": ","}},
+    }
+    assert infos["rf_model"] == {
+        "source": "pattern",
+        "type": "MemoryDataset",
+        "class_fqn": "kedro.io.memory_dataset.MemoryDataset",
+        "filepath": "data/06_models/rf.pkl",
+        "layer": None,
+        "params": {"credentials": None},
+    }
+    assert infos["other"]["source"] == "default"
+    assert infos["other"]["type"] == "kedro.io.MemoryDataset"
+    assert infos["params:alpha"]["source"] == "parameters"
+    assert infos["table@pandas"]["class_fqn"] is None
+
+
+def test_class_lookup_can_be_skipped() -> None:
+    infos = CatalogInspector(CONFIG, resolve_classes=False).inspect(["cars"])
+    assert infos["cars"]["class_fqn"] is None
+
+
+def test_load_catalog_config(tmp_path: Path) -> None:
+    assert load_catalog_config(tmp_path) == {}
+
+    (tmp_path / "conf" / "base").mkdir(parents=True)
+    (tmp_path / "conf" / "local").mkdir()
+    (tmp_path / "conf" / "prod").mkdir()
+    (tmp_path / "conf" / "base" / "catalog.yml").write_text(
+        "_csv: &csv\n  type: pandas.CSVDataset\n"
+        "cars:\n  <<: *csv\n  filepath: data/cars.csv\n"
+    )
+    (tmp_path / "conf" / "prod" / "catalog.yml").write_text(
+        "cars:\n  type: pandas.CSVDataset\n  filepath: s3://bucket/cars.csv\n"
+    )
+
+    assert load_catalog_config(tmp_path) == {
+        "cars": {"type": "pandas.CSVDataset", "filepath": "data/cars.csv"}
+    }
+    assert load_catalog_config(tmp_path, "prod")["cars"]["filepath"] == (
+        "s3://bucket/cars.csv"
+    )
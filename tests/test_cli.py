@@ -0,0 +1,440 @@
+import gc
+import json
+import os
+import pstats
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from kedro.framework.startup import bootstrap_project
+
+from kedro_inspect import cli, profiling
+from kedro_inspect.cli import main
+from kedro_inspect.node import InspectedNode
+from kedro_inspect.server import serve
+from kedro_inspect.stats import append_run
+from kedro_inspect.watch import Watcher
+
+PACKAGE = "cli_proj"
+
+NODES = """
+from typing import List
+
+
+def clean(raw: int) -> int:
+    return raw
+
+
+def split(clean: int) -> List[int]:
+    return [clean]
+
+
+def report(train: List[int]) -> None:
+    return None
+"""
+
+REGISTRY = """
+from kedro.pipeline import node, pipeline
+
+from cli_proj.nodes import clean, report, split
+
+
+def register_pipelines():
+    prep = pipeline([node(clean, "raw", "clean", name="clean", tags=["prep"])])
+    model = pipeline(
+        [
+            node(split, "clean", "train", name="split", namespace="model"),
+            node(report, "train", None, name="report", namespace="model"),
+        ]
+    )
+    # a list is passed where an int is expected
+    mismatched = pipeline(
+        [
+            node(split, "raw", "numbers", name="numbers"),
+            node(clean, "numbers", "count", name="count"),
+        ]
+    )
+    return {
+        "__default__": prep + model,
+        "prep": prep,
+        "model": model,
+        "mismatched": mismatched,
+    }
+"""
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    return make_project(PACKAGE, {"nodes.py": NODES, "pipeline_registry.py": REGISTRY})
+
+
+def node_names(dct: dict) -> list:
+    return [node["name"] for node in dct["nodes"]]
+
+
+def run_of(node: str, seconds: float) -> dict:
+    return {
+        "node": node,
+        "time": 1.0,
+        "seconds": seconds,
+        "peak_memory": None,
+        "output_bytes": {},
+    }
+
+
+def test_all_pipelines_to_one_document(project: Path, tmp_path: Path) -> None:
+    output = tmp_path / "out.json"
+    assert main([str(project), "--all", "-o", str(output)]) == 0
+
+    dct = json.loads(output.read_text())
+    assert sorted(dct) == ["__default__", "mismatched", "model", "prep"]
+    assert node_names(dct["prep"]) == ["clean"]
+    assert len(dct["__default__"]["nodes"]) == 3
+
+
+def test_output_dir(project: Path, tmp_path: Path) -> None:
+    output_dir = tmp_path / "out"
+    args = [str(project), "-p", "prep", "-p", "model", "--output-dir", str(output_dir)]
+    assert main(args) == 0
+
+    assert sorted(p.name for p in output_dir.iterdir()) == ["model.json", "prep.json"]
+    model = json.loads((output_dir / "model.json").read_text())
+    assert node_names(model) == ["split", "report"]
+    assert {node["namespace"] for node in model["nodes"]} == {"model"}
+
+
+def test_output_dir_checks_all_paths_before_writing(
+    project: Path, tmp_path: Path
+) -> None:
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    (output_dir / "prep.json").write_text("{}")
+
+    with pytest.raises(ValueError, match="prep.json"):
+        main([str(project), "--all", "--output-dir", str(output_dir)])
+    assert [p.name for p in output_dir.iterdir()] == ["prep.json"]
+
+
+def test_ndjson_output(project: Path, tmp_path: Path) -> None:
+    output = tmp_path / "out.ndjson"
+    assert (
+        main([str(project), "-p", "model", "--format", "ndjson", "-o", str(output)])
+        == 0
+    )
+    lines = output.read_text().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["split", "report"]
+
+    output_dir = tmp_path / "out"
+    args = [
+        str(project),
+        "--all",
+        "--format",
+        "ndjson",
+        "--output-dir",
+        str(output_dir),
+    ]
+    assert main(args) == 0
+    assert len((output_dir / "__default__.ndjson").read_text().splitlines()) == 3
+
+    with pytest.raises(ValueError, match="needs --output-dir"):
+        main([str(project), "--all", "--format", "ndjson", "-o", str(tmp_path / "x")])
+
+
+def test_diff(
+    project: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    old = tmp_path / "old.json"
+    assert main([str(project), "-o", str(old)]) == 0
+    dct = json.loads(old.read_text())
+    # the compact format is read as well
+    unchanged = tmp_path / "unchanged.kic"
+    assert main([str(project), "--format", "compact", "-o", str(unchanged)]) == 0
+    new = tmp_path / "new.json"
+    dct["nodes"] = dct["nodes"][1:]
+    dct["nodes"][0]["tags"] = ["changed"]
+    new.write_text(json.dumps(dct))
+    capsys.readouterr()
+
+    assert main(["diff", str(old), str(unchanged)]) == 0
+    assert json.loads(capsys.readouterr().out)["removed_nodes"] == []
+
+    assert main(["diff", "--summary", str(old), str(new)]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "- node clean",
+        "~ node model.split: tags",
+        "- dataset raw",
+    ]
+
+
+def test_profile(
+    project: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    trace, stats = tmp_path / "trace.json", tmp_path / "profile.prof"
+    args = [str(project), "-o", str(tmp_path / "out.json"), "--profile"]
+    args += ["--profile-trace", str(trace), "--profile-cprofile", str(stats)]
+    assert main(args) == 0
+
+    report = capsys.readouterr().err
+    assert "cli.main" in report and "cli.bootstrap_project" in report
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert "cli.write_output" in {event["name"] for event in events}
+    assert pstats.Stats(str(stats)).total_calls > 0
+    # profiling is disabled again
+    assert profiling._profiler is None
+
+
+def test_check_types(
+    project: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    args = [str(project), "--check-types", "-o"]
+    assert main([*args, str(tmp_path / "default.json")]) == 0
+    assert "TYPE MISMATCH" not in capsys.readouterr().err
+
+    assert main([*args, str(tmp_path / "mismatched.json"), "-p", "mismatched"]) == 1
+    (line,) = [
+        line
+        for line in capsys.readouterr().err.splitlines()
+        if line.startswith("TYPE MISMATCH")
+    ]
+    assert "dataset 'numbers'" in line and "node 'count'" in line
+
+
+@pytest.mark.parametrize(
+    "selection, expected",
+    [
+        (["--tags", "prep"], ["clean"]),
+        (["--namespaces", "model"], ["split", "report"]),
+        (["--nodes", "clean,model.report"], ["clean", "report"]),
+        (["--from-nodes", "model.split"], ["split", "report"]),
+        (["--to-outputs", "train"], ["clean", "split"]),
+        (["--with-inputs", "clean"], ["split"]),
+        (["--namespaces", "model", "--with-inputs", "train"], ["report"]),
+        (["--static", "--tags", "prep"], ["clean"]),
+    ],
+)
+def test_node_selection(
+    project: Path, tmp_path: Path, selection: list, expected: list
+) -> None:
+    output = tmp_path / "out.json"
+    assert main([str(project), "-o", str(output), *selection]) == 0
+    assert node_names(json.loads(output.read_text())) == expected
+
+
+def test_catalog(project: Path, tmp_path: Path) -> None:
+    conf = project / "conf"
+    for env in ["base", "local", "prod"]:
+        (conf / env).mkdir(parents=True)
+    (conf / "base" / "catalog.yml").write_text(
+        "raw:\n  type: MemoryDataset\n"
+        "clean:\n  type: pickle.PickleDataset\n  filepath: data/clean.pkl\n"
+    )
+    (conf / "prod" / "catalog.yml").write_text(
+        "clean:\n  type: pickle.PickleDataset\n  filepath: s3://bucket/clean.pkl\n"
+    )
+
+    output = tmp_path / "out.json"
+    assert main([str(project), "-p", "prep", "--catalog", "-o", str(output)]) == 0
+    datasets = json.loads(output.read_text())["datasets"]
+    assert sorted(datasets) == ["clean", "raw"]
+    assert datasets["raw"]["source"] == "catalog"
+    assert datasets["clean"]["filepath"] == "data/clean.pkl"
+
+    output = tmp_path / "prod.json"
+    args = [str(project), "-p", "prep", "--catalog", "--env", "prod", "--static"]
+    assert main([*args, "-o", str(output)]) == 0
+    datasets = json.loads(output.read_text())["datasets"]
+    assert datasets["clean"]["filepath"] == "s3://bucket/clean.pkl"
+
+    with pytest.raises(ValueError, match="--catalog"):
+        main([str(project), "--catalog", "--format", "ndjson"])
+
+
+def test_analyze(
+    project: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    inspection = tmp_path / "out.json"
+    assert main([str(project), "-o", str(inspection)]) == 0
+    costs = tmp_path / "costs.yml"
+    costs.write_text("clean: 2\nmodel.split: 3\nmissing: 1\n")
+    stats_dir = tmp_path / "stats"
+    stats_dir.mkdir()
+    append_run(stats_dir, run_of("model.report", 0.5))
+    # costs from the file take precedence over stats
+    append_run(stats_dir, run_of("clean", 10.0))
+    capsys.readouterr()
+
+    args = ["analyze", str(inspection), "--costs", str(costs), "--stats"]
+    assert main([*args, str(stats_dir), "-w", "1,2", "--levels"]) == 0
+    captured = capsys.readouterr()
+    assert "unknown nodes: ['missing']" in captured.err
+    analysis = json.loads(captured.out)
+    assert analysis["critical_path"] == ["clean", "model.split", "model.report"]
+    assert analysis["critical_path_cost"] == analysis["total_cost"] == 5.5
+    assert analysis["levels"] == [["clean"], ["model.split"], ["model.report"]]
+    assert [s["workers"] for s in analysis["schedules"]] == [1, 2]
+
+    assert main(["analyze", str(inspection), "--summary"]) == 0
+    assert "critical path: clean -> model.split -> model.report" in (
+        capsys.readouterr().out
+    )
+    with pytest.raises(ValueError, match="--workers"):
+        main(["analyze", str(inspection), "-w", "0"])
+
+
+@pytest.mark.parametrize("static", [False, True])
+def test_stats(project: Path, tmp_path: Path, static: bool) -> None:
+    stats_dir = tmp_path / "stats"
+    stats_dir.mkdir()
+    append_run(stats_dir, run_of("model.split", 2.0))
+    append_run(stats_dir, run_of("model.split", 4.0))
+
+    output = tmp_path / "out.json"
+    args = [str(project), "--stats", str(stats_dir), "-o", str(output)]
+    assert main(args + (["--static"] if static else [])) == 0
+    clean, split, _ = json.loads(output.read_text())["nodes"]
+    assert "stats" not in clean
+    assert split["stats"]["runs"] == 2
+    assert split["stats"]["mean_seconds"] == 3.0
+
+    with pytest.raises(ValueError, match="Stats directory"):
+        main([str(project), "--stats", str(tmp_path / "missing")])
+
+
+def test_batch(
+    project: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    report_path = tmp_path / "report.json"
+    missing = tmp_path / "missing"
+    args = ["batch", str(project), str(missing), "--all", "-j", "2"]
+    assert main([*args, "-o", str(report_path)]) == 1
+
+    report = json.loads(report_path.read_text())
+    assert report["n_failed"] == 1
+    ok, failed = report["projects"]
+    assert ok["project"] == str(project) and ok["error"] is None
+    assert sorted(ok["pipelines"]) == ["__default__", "mismatched", "model", "prep"]
+    assert failed["project"] == str(missing) and "not a directory" in failed["error"]
+    assert "[2/2]" in capsys.readouterr().err
+
+    with pytest.raises(ValueError, match="--jobs"):
+        main(["batch", str(project), "-j", "0"])
+    with pytest.raises(ValueError, match="No Kedro projects"):
+        main(["batch", str(tmp_path / "*" / "nothing")])
+
+
+def test_serve(project: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    servers = []
+
+    def record(server) -> None:
+        servers.append(server)
+        serve(server)
+
+    monkeypatch.setattr(cli, "serve", record)
+    thread = threading.Thread(
+        target=main, args=(["serve", str(project), "--port", "0"],), daemon=True
+    )
+    thread.start()
+    deadline = time.monotonic() + 30
+    while not servers and time.monotonic() < deadline:
+        time.sleep(0.01)
+    (server,) = servers
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/pipelines/prep"
+        with urllib.request.urlopen(url) as response:
+            assert node_names(json.loads(response.read())) == ["clean"]
+    finally:
+        server.shutdown()
+        thread.join()
+
+    with pytest.raises(ValueError, match="not a directory"):
+        main(["serve", str(project / "missing")])
+
+
+def test_watch(
+    project: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    output = tmp_path / "out.json"
+    # --watch may replace an existing output
+    output.write_text("{}")
+    nodes = project / "src" / PACKAGE / "nodes.py"
+
+    def run_once(watcher: Watcher, interval: float) -> None:
+        assert node_names(json.loads(output.read_text())) == ["clean"]
+        nodes.write_text(NODES.replace("(raw: int) -> int", "(raw: int) -> str"))
+        stat = nodes.stat()
+        os.utime(nodes, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        # the first poll notices the change, the next one reloads
+        assert watcher.poll() == []
+        (message,) = watcher.poll()
+        assert message.endswith(f"wrote {output}")
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(Watcher, "run", run_once)
+    args = [str(project), "--watch", "--watch-debounce", "0", "--tags", "prep"]
+    assert main([*args, "-p", "prep", "-o", str(output)]) == 0
+
+    assert "Stopped watching." in capsys.readouterr().err
+    assert "builtins.str" in json.loads(output.read_text())["types"]
+
+    with pytest.raises(ValueError, match="--watch needs --output"):
+        main([str(project), "--watch"])
+
+
+VARIANTS_REGISTRY = """
+from kedro.pipeline import node, pipeline
+
+
+def f(x):
+    return x
+
+
+def g(x):
+    return x
+
+
+def register_pipelines():
+    base = pipeline([node(f, "x", "y", name="n")])
+    return {
+        "__default__": base,
+        "a": pipeline(base, tags=["a"]),
+        "b": pipeline(base, tags=["b"]),
+        "c": pipeline([node(g, "x", "y", name="n")]),
+    }
+"""
+
+
+def test_pipelines_with_node_variants(
+    make_project: Callable[..., Path], tmp_path: Path
+) -> None:
+    project = make_project("variants_proj", {"pipeline_registry.py": VARIANTS_REGISTRY})
+    output = tmp_path / "out.json"
+    assert (
+        main([str(project), "--all", "--no-cache", "--check-types", "-o", str(output)])
+        == 0
+    )
+
+    (a,), (b,), (c,) = [
+        json.loads(output.read_text())[name]["nodes"] for name in ["a", "b", "c"]
+    ]
+    assert a["tags"] == ["a"] and b["tags"] == ["b"]
+    assert c["function"]["func"] == "variants_proj.pipeline_registry.g"
+
+
+def test_single_pipeline_is_streamed(project: Path) -> None:
+    def n_alive() -> int:
+        gc.collect()
+        return sum(type(obj) is InspectedNode for obj in gc.get_objects())
+
+    bootstrap_project(project)
+    before = n_alive()
+    ((_, dicts),) = cli.inspect_pipelines(["__default__"])
+    for count, _ in enumerate(dicts, 1):
+        # at most the node being written is alive
+        assert n_alive() - before <= 1
+    assert count == 3
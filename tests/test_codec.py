@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from kedro.pipeline import Pipeline, node
+
+from kedro_inspect.codec import CompactCodec, JsonCodec, get_codec
+from kedro_inspect.pipeline import InspectedPipeline
+
+
+def clean_table(table: int, schema: str) -> int:
+    return table
+
+
+def make_pipeline(n_nodes: int) -> InspectedPipeline:
+    nodes = [
+        node(
+            clean_table,
+            {"table": f"raw_table_{i}", "schema": "params:schema"},
+            f"clean_table_{i}",
+            name=f"clean_{i}",
+            namespace="cleaning",
+            tags=["cleaning"],
+        )
+        for i in range(n_nodes)
+    ]
+    return InspectedPipeline.from_kedro_pipeline(Pipeline(nodes))
+
+
+def available_json_backends():
+    backends = ["json"]
+    for backend in ("orjson", "msgspec"):
+        try:
+            JsonCodec(backend=backend)
+        except ImportError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+@pytest.mark.parametrize("backend", available_json_backends())
+def test_json_codec_roundtrip(backend: str) -> None:
+    pipe = make_pipeline(10)
+    codec = JsonCodec(backend=backend)
+    data = pipe.encode(codec)
+
+    assert json.loads(data) == pipe.to_dict()
+    assert InspectedPipeline.decode(data, codec) == pipe
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_json_backends_produce_identical_output(indent: int | None) -> None:
+    dct = {
+        **make_pipeline(3).to_dict(),
+        "values": [0.1, 1e-05, 2.5e-07, 1e15, 1e16, -1.5e300, 0.0, -0.0, 100.0],
+        "strings": ["ü\u2028", "\x01", '"1e-05"', ""],
+        "empty": [{}, []],
+    }
+    outputs = {
+        backend: JsonCodec(indent, backend).encode(dct)
+        for backend in available_json_backends()
+        if not (backend == "orjson" and indent == 4)
+    }
+
+    assert len(set(outputs.values())) == 1, outputs
+    assert json.loads(outputs["json"]) == dct
+    assert get_codec("json", indent).encode(dct) == outputs["json"]
+
+
+def test_json_codec_rejects_unsupported_indent() -> None:
+    with pytest.raises(ValueError, match="must be at least 1"):
+        JsonCodec(indent=0, backend="json")
+    if "orjson" in available_json_backends():
+        with pytest.raises(ValueError, match="orjson does not support"):
+            JsonCodec(indent=4, backend="orjson")
+
+
+def test_compact_codec_roundtrip() -> None:
+    pipe = make_pipeline(10)
+    data = pipe.encode("compact")
+
+    assert data.startswith(b"KIC")
+    assert InspectedPipeline.decode(data, "compact", lazy=True) == pipe
+
+
+@pytest.mark.parametrize(
+    "value",
+    [None, True, False, 0, -1, 2**40, -(2**40), 1.5, "", "ü", [], {}, [{"a": [1]}]],
+)
+def test_compact_codec_values(value) -> None:
+    codec = CompactCodec()
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_compact_codec_rejects_other_data() -> None:
+    with pytest.raises(ValueError, match="Not a compact"):
+        CompactCodec().decode(b"{}")
+
+
+def test_unknown_codec() -> None:
+    with pytest.raises(ValueError, match="Unknown codec"):
+        get_codec("xml")
+
+
+def test_compact_codec_is_smaller_than_json() -> None:
+    """Compact output interns repeated strings and is much smaller than JSON."""
+    dct = make_pipeline(1000).to_dict()
+    sizes = {}
+    for name, codec in [
+        *((b, JsonCodec(backend=b)) for b in available_json_backends()),
+        ("compact", CompactCodec()),
+    ]:
+        data = codec.encode(dct)
+        assert codec.decode(data) == dct
+        sizes[name] = len(data)
+    assert sizes["compact"] < sizes["json"] / 3
+
+
+@pytest.mark.parametrize(
+    "value",
+    [0, -1, 2**63 - 1, -(2**63), 2**63, 2**64, -(2**63) - 1, -(2**64), 10**40],
+)
+def test_compact_codec_round_trips_large_ints(value: int) -> None:
+    codec = CompactCodec()
+    assert codec.decode(codec.encode([value])) == [value]
@@ -0,0 +1,64 @@
+from kedro.pipeline import Pipeline, node
+from typing_extensions import Any
+
+from kedro_inspect.diff import diff_pipelines, is_empty, summarise
+from kedro_inspect.pipeline import InspectedPipeline
+
+
+def identity(x) -> Any:
+    return x
+
+
+def double(x: int) -> int:
+    return 2 * x
+
+
+def inspect(*nodes) -> dict:
+    return InspectedPipeline.from_kedro_pipeline(Pipeline(nodes)).to_dict()
+
+
+def test_identical_pipelines() -> None:
+    old = inspect(node(identity, "a", "b", name="n1", tags=["x", "y"]))
+    new = inspect(node(identity, "a", "b", name="n1", tags=["y", "x"]))
+
+    assert is_empty(diff_pipelines(old, new))
+
+
+def test_diff_reports_nodes_and_datasets() -> None:
+    old = inspect(
+        node(identity, "a", "b", name="kept"),
+        node(identity, "b", "c", name="changed"),
+        node(identity, "c", "d", name="removed"),
+    )
+    new = inspect(
+        node(identity, "a", "b", name="kept"),
+        node(double, "b", "c", name="changed", tags="new_tag"),
+        node(identity, "c", "e", name="added", namespace="ns"),
+    )
+    diff = diff_pipelines(old, new)
+
+    assert diff["added_nodes"] == ["ns.added"]
+    assert diff["removed_nodes"] == ["removed"]
+    (change,) = diff["changed_nodes"]
+    assert change["node"] == "changed"
+    assert set(change["fields"]) == {
+        "tags",
+        "function.func",
+        "function.parameters",
+        "function.return_value",
+    }
+    assert change["fields"]["tags"] == {"old": [], "new": ["new_tag"]}
+    assert diff["added_datasets"] == ["e"]
+    assert diff["removed_datasets"] == ["d"]
+    assert "~ node changed: tags, function.func, function.parameters, " in "\n".join(
+        summarise(diff)
+    )
+
+
+def test_unnamed_nodes_are_matched_by_definition() -> None:
+    old = inspect(node(identity, "a", "b"))
+    new = inspect(node(identity, "a", "c"))
+    diff = diff_pipelines(old, new)
+
+    assert diff["added_nodes"] == ["test_diff.identity([a]) -> [c]"]
+    assert diff["removed_nodes"] == ["test_diff.identity([a]) -> [b]"]
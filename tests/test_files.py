@@ -0,0 +1,11 @@
+from pathlib import Path
+
+from kedro_inspect.files import write_atomic
+
+
+def test_write_atomic(tmp_path: Path) -> None:
+    path = tmp_path / "out.json"
+    write_atomic(path, b"old")
+    write_atomic(path, b"new")
+    assert path.read_bytes() == b"new"
+    assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+import pytest
+from kedro.framework.hooks import _create_hook_manager
+from kedro.io import DataCatalog, MemoryDataset
+from kedro.pipeline import Pipeline, node
+from kedro.runner import SequentialRunner
+
+from kedro_inspect.hooks import NodeStatsHook
+from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect.stats import load_node_stats
+
+
+def make(n: int) -> bytes:
+    return b"x" * n
+
+
+def consume(data: bytes) -> None:
+    return None
+
+
+def fail(data: bytes) -> None:
+    raise RuntimeError("boom")
+
+
+def run(pipeline: Pipeline, hook: NodeStatsHook) -> None:
+    hook_manager = _create_hook_manager()
+    hook_manager.register(hook)
+    catalog = DataCatalog({"n": MemoryDataset(1000)})
+    try:
+        SequentialRunner().run(pipeline, catalog, hook_manager)
+    finally:
+        # called by the session in Kedro projects
+        hook_manager.hook.after_pipeline_run(
+            run_params={}, run_result={}, pipeline=pipeline, catalog=catalog
+        )
+
+
+@pytest.mark.parametrize("trace_memory", [False, True])
+def test_node_stats_hook(tmp_path: Path, trace_memory: bool) -> None:
+    pipeline = Pipeline(
+        [
+            node(make, "n", "data", name="make", namespace="ns"),
+            node(consume, "data", None),
+        ]
+    )
+    hook = NodeStatsHook(tmp_path, trace_memory)
+    run(pipeline, hook)
+    run(pipeline, hook)
+
+    stats = load_node_stats(tmp_path)
+    assert [p.name for p in tmp_path.iterdir()] == ["node_stats.json"]
+    make_stats = stats["ns.make"]
+    assert make_stats["runs"] == 2
+    assert make_stats["failures"] == 0
+    assert 0 < make_stats["mean_seconds"] <= make_stats["max_seconds"]
+    assert make_stats["peak_memory"] >= 0
+    assert make_stats["output_bytes"] == {"data": sys.getsizeof(make(1000))}
+
+    # unnamed nodes are identified as in inspections
+    inspected = InspectedPipeline.from_kedro_pipeline(pipeline)
+    node_dicts = inspected.to_dict(stats)["nodes"]
+    assert [dct["stats"]["runs"] for dct in node_dicts] == [2, 2]
+    assert "stats" not in inspected.to_dict()["nodes"][0]
+
+
+def test_node_stats_hook_records_failures(tmp_path: Path) -> None:
+    pipeline = Pipeline(
+        [node(make, "n", "data", name="make"), node(fail, "data", None, name="fail")]
+    )
+    with pytest.raises(RuntimeError, match="boom"):
+        run(pipeline, NodeStatsHook(tmp_path))
+
+    stats = load_node_stats(tmp_path)
+    assert stats["make"]["failures"] == 0
+    assert stats["fail"]["runs"] == stats["fail"]["failures"] == 1
+    assert stats["fail"]["mean_seconds"] is None
@@ -0,0 +1,147 @@
+import pytest
+from kedro.pipeline import Pipeline, node
+from typing_extensions import Any
+
+from kedro_inspect.node import InspectedNode
+from kedro_inspect.pipeline import InspectedPipeline
+
+
+def identity(x) -> Any:
+    return x
+
+
+def concat(*parts) -> Any:
+    return parts
+
+
+@pytest.fixture
+def pipe() -> InspectedPipeline:
+    return InspectedPipeline.from_kedro_pipeline(
+        Pipeline(
+            [
+                node(identity, "raw", "clean@pandas", name="clean"),
+                node(identity, "clean@spark", "features", name="featurise"),
+                node(concat, ["clean@pandas", "features"], "table", name="combine"),
+                node(identity, "other", "unrelated", name="unrelated"),
+            ]
+        )
+    )
+
+
+def names(pipe: InspectedPipeline, indices) -> list:
+    return [pipe.nodes[idx].name for idx in indices]
+
+
+def test_producers_and_consumers(pipe: InspectedPipeline) -> None:
+    index = pipe.index
+
+    assert index.producer("clean@spark").name == "clean"
+    assert index.producer("raw") is None
+    assert [n.name for n in index.consumers_of("clean")] == ["featurise", "combine"]
+    assert index.free_inputs == {"raw", "other"}
+    assert index.terminal_outputs == {"table", "unrelated"}
+
+
+def test_layers_and_traversal(pipe: InspectedPipeline) -> None:
+    index = pipe.index
+
+    assert [names(pipe, layer) for layer in index.layers] == [
+        ["clean", "unrelated"],
+        ["featurise"],
+        ["combine"],
+    ]
+    assert names(pipe, index.topological_order) == [
+        "clean",
+        "unrelated",
+        "featurise",
+        "combine",
+    ]
+    assert names(pipe, index.downstream(["raw"])) == ["clean", "featurise", "combine"]
+    assert names(pipe, index.upstream(["table"])) == ["clean", "featurise", "combine"]
+
+
+def test_index_is_cached_and_invalidated(pipe: InspectedPipeline) -> None:
+    index = pipe.index
+    assert pipe.index is index
+
+    pipe.nodes = pipe.nodes[:1]
+    assert pipe.index is not index
+    assert pipe.index.datasets == {"raw", "clean"}
+
+    pipe.nodes[0].outputs = "renamed"
+    pipe.invalidate_caches()
+    assert pipe.index.datasets == {"raw", "renamed"}
+
+
+def test_index_follows_node_list_mutations(pipe: InspectedPipeline) -> None:
+    index = pipe.index
+    replacement = InspectedNode.from_kedro_node(
+        node(identity, "raw", "cleaned", name="clean")
+    )
+    pipe.nodes[0] = replacement
+    assert pipe.index is not index
+    assert pipe.index.producer("cleaned") is replacement
+    assert pipe.index.producer("clean") is None
+
+    pipe.nodes.append(
+        InspectedNode.from_kedro_node(node(identity, "cleaned", "extra", name="x"))
+    )
+    assert pipe.index.producer("extra").name == "x"
+    assert names(pipe, pipe.index.downstream(["raw"])) == ["clean", "x"]
+
+    del pipe.nodes[-1]
+    assert pipe.index.producer("extra") is None
+
+
+@pytest.fixture
+def tagged() -> InspectedPipeline:
+    return InspectedPipeline.from_kedro_pipeline(
+        Pipeline(
+            [
+                node(identity, "raw", "clean@pandas", name="clean", tags=["prep"]),
+                node(
+                    identity,
+                    "clean@spark",
+                    "features",
+                    name="featurise",
+                    namespace="ds.features",
+                    tags=["prep", "ml"],
+                ),
+                node(
+                    concat,
+                    ["clean@pandas", "features"],
+                    "table",
+                    name="combine",
+                    namespace="ds",
+                ),
+                node(identity, "other", "unrelated"),
+            ]
+        )
+    )
+
+
+def test_tag_namespace_and_name_lookups(tagged: InspectedPipeline) -> None:
+    index = tagged.index
+
+    assert names(tagged, index.with_tags(["ml", "prep"])) == ["clean", "featurise"]
+    assert index.with_tags(["missing"]) == []
+    assert names(tagged, index.in_namespaces(["ds"])) == ["featurise", "combine"]
+    assert names(tagged, index.in_namespaces(["ds.features"])) == ["featurise"]
+    assert list(index.names) == ["clean", "ds.features.featurise", "ds.combine"]
+    assert names(tagged, index.named(["ds.combine"])) == ["combine"]
+    with pytest.raises(ValueError, match="namespaces"):
+        index.in_namespaces(["features"])
+    with pytest.raises(ValueError, match="named"):
+        index.named(["combine"])
+
+
+def test_dataset_lookups(tagged: InspectedPipeline) -> None:
+    index = tagged.index
+
+    assert names(tagged, index.consuming(["clean"])) == ["featurise", "combine"]
+    assert names(tagged, index.consuming(["clean@spark"])) == ["featurise"]
+    assert names(tagged, index.producing(["features"])) == ["clean", "featurise"]
+    with pytest.raises(ValueError):
+        index.consuming(["table"])
+    with pytest.raises(ValueError):
+        index.producing(["raw"])
@@ -0,0 +1,136 @@
+import gc
+import inspect
+from functools import partial
+from typing import List
+
+from kedro.pipeline import Pipeline, node
+from typing_extensions import Any
+
+from kedro_inspect.introspection import (
+    AnnotationResolver,
+    IntrospectionCache,
+    introspection_cache,
+)
+from kedro_inspect.node_func import NodeFunction
+from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect.serialisation import UnresolvedAnnotation
+
+
+def identity(x: int) -> Any:
+    return x
+
+
+def test_cache_hits_and_misses() -> None:
+    cache = IntrospectionCache()
+    first = cache.get(identity)
+    second = cache.get(identity)
+
+    assert first is second
+    assert first.signature == inspect.signature(identity)
+    assert first.type_hints == {"x": int, "return": Any}
+    assert cache.info().hits == 1
+    assert cache.info().misses == 1
+
+
+def test_cache_is_bounded() -> None:
+    cache = IntrospectionCache(maxsize=2)
+    funcs = [lambda a: a, lambda b: b, lambda c: c]
+    for func in funcs:
+        cache.get(func)
+
+    assert len(cache) == 2
+    cache.get(funcs[0])
+    assert cache.info().misses == 4
+
+
+def test_cache_evicts_collected_functions() -> None:
+    cache = IntrospectionCache()
+
+    def make_func():
+        def func(y: str) -> str:
+            return y
+
+        return func
+
+    func = make_func()
+    cache.get(func)
+    assert len(cache) == 1
+
+    del func
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_cache_holds_non_weakrefable_callables() -> None:
+    cache = IntrospectionCache()
+    cache.get(len)
+    cache.get(len)
+
+    assert cache.info().hits == 1
+
+
+def test_shared_function_is_introspected_once() -> None:
+    def shared(x: int) -> int:
+        return x
+
+    pipe = Pipeline(
+        [node(shared, f"in{i}", f"out{i}", name=f"node{i}") for i in range(10)]
+    )
+    before = introspection_cache.info()
+    InspectedPipeline.from_kedro_pipeline(pipe)
+    after = introspection_cache.info()
+
+    assert after.misses - before.misses == 1
+    assert after.hits - before.hits == 19
+
+
+def with_string_hints(x: "int", y: "DoesNotExist") -> "List[int]":  # noqa: F821
+    return [x]
+
+
+class Model:
+    def __init__(self, alpha: "float") -> None:
+        self.alpha = alpha
+
+
+def test_resolver_falls_back_to_annotation_string() -> None:
+    resolver = AnnotationResolver()
+    hints = resolver.type_hints(with_string_hints)
+
+    assert hints == {
+        "x": int,
+        "y": UnresolvedAnnotation("DoesNotExist"),
+        "return": List[int],
+    }
+    assert list(resolver.failures) == [(__name__, "DoesNotExist")]
+
+    func = NodeFunction.from_callable(with_string_hints)
+    dct = func.to_dict()
+    assert dct["parameters"][1]["type_hint"] == "unresolved:DoesNotExist"
+    for lazy in [False, True]:
+        restored = NodeFunction.from_dict(dct, lazy)
+        assert restored.parameters[1].type_hint == UnresolvedAnnotation("DoesNotExist")
+
+
+def test_resolver_caches_per_namespace() -> None:
+    resolver = AnnotationResolver()
+    resolver.type_hints(with_string_hints)
+    globalns, evaluated = resolver._namespaces[id(globals())]
+
+    assert globalns is globals()
+    assert set(evaluated) == {"int", "DoesNotExist", "List[int]"}
+
+
+def test_resolver_without_evaluation() -> None:
+    hints = AnnotationResolver(evaluate=False).type_hints(with_string_hints)
+
+    assert hints["x"] == UnresolvedAnnotation("int")
+    assert hints["return"] == UnresolvedAnnotation("List[int]")
+
+
+def test_resolver_classes_and_partials() -> None:
+    resolver = AnnotationResolver()
+
+    assert resolver.type_hints(Model) == {"alpha": float, "return": Model}
+    assert resolver.type_hints(partial(identity, 1)) == {"x": int, "return": Any}
+    assert resolver.type_hints(len) == {}
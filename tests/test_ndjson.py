@@ -0,0 +1,40 @@
+import io
+
+from kedro.pipeline import Pipeline, node
+from typing_extensions import Any
+
+from kedro_inspect.ndjson import dump_ndjson, iter_ndjson, load_ndjson
+from kedro_inspect.pipeline import InspectedPipeline
+
+
+def identity(x) -> Any:
+    return x
+
+
+def test_ndjson_roundtrip() -> None:
+    pipe = Pipeline(
+        [
+            node(identity, "a", "b", name="first"),
+            node(identity, {"x": "b"}, ["c"], name="second"),
+        ]
+    )
+    inspected = InspectedPipeline.from_kedro_pipeline(pipe)
+
+    buffer = io.StringIO()
+    assert dump_ndjson(inspected.iter_dicts(), buffer) == 2
+    assert len(buffer.getvalue().splitlines()) == 2
+
+    buffer.seek(0)
+    assert list(iter_ndjson(buffer)) == list(inspected.iter_dicts())
+
+    buffer.seek(0)
+    nodes = list(load_ndjson(buffer, lazy=True))
+    assert InspectedPipeline(nodes) == inspected
+
+
+def test_iter_kedro_nodes_is_lazy() -> None:
+    pipe = Pipeline([node(identity, "a", "b"), node(identity, "b", "c")])
+    nodes = InspectedPipeline.iter_kedro_nodes(pipe)
+
+    assert next(nodes).inputs == "a"
+    assert next(nodes).inputs == "b"
@@ -1,5 +1,6 @@
 import json
 
+import pytest
 from kedro.pipeline import node
 from typing_extensions import Any
 
@@ -19,12 +20,12 @@ def test_inspected_node() -> None:
 
     assert inspected_node.name is None
     assert inspected_node.tags == set()
-    assert inspected_node.confirms == []
+    assert inspected_node.confirms == ()
     assert inspected_node.namespace is None
-    assert inspected_node.inputs == ["a"]
-    assert inspected_node.outputs == ["b"]
+    assert inspected_node.inputs == ("a",)
+    assert inspected_node.outputs == ("b",)
     assert isinstance(inspected_node.function, NodeFunction)
-    assert inspected_node.param_to_input == {"x": ["a"]}
+    assert inspected_node.param_to_input == {"x": ("a",)}
 
     kedro_node = inspected_node.to_kedro_node()
     assert kedro_node == orig_node
@@ -45,3 +46,44 @@ def test_inspected_node() -> None:
     assert inspected_node_from_dict.to_dict() == inspected_node_dict
 
     assert json.loads(json.dumps(inspected_node_dict)) == inspected_node_dict
+
+
+def test_inspected_node_fingerprint() -> None:
+    node1 = InspectedNode.from_kedro_node(node(identity, "a", "b", tags=["x", "y"]))
+    node2 = InspectedNode.from_kedro_node(node(identity, "a", "b", tags=["y", "x"]))
+
+    assert node1.fingerprint == node2.fingerprint
+    assert len({node1, node2}) == 1
+
+    node2.outputs = "c"
+    assert node1.fingerprint != node2.fingerprint
+    assert node1 != node2
+
+
+def test_inspected_node_is_compact() -> None:
+    nodes = [
+        InspectedNode.from_kedro_node(node(identity, f"in_{i}", f"out_{i}"))
+        for i in range(2)
+    ]
+
+    assert not hasattr(nodes[0], "__dict__")
+    assert nodes[0].function.parameters is nodes[1].function.parameters
+    assert nodes[0].inputs[0] is InspectedNode.from_dict(nodes[0].to_dict()).inputs[0]
+    assert isinstance(nodes[0].tags, frozenset)
+
+
+def test_inspected_node_fingerprint_cannot_go_stale() -> None:
+    inspected = InspectedNode.from_kedro_node(node(identity, "a", "b", confirms="a"))
+    fingerprint = inspected.fingerprint
+
+    with pytest.raises(AttributeError):
+        inspected.confirms.append("b")  # type: ignore[attr-defined]
+    with pytest.raises(TypeError):
+        inspected.param_to_input["y"] = ["b"]  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        inspected.param_to_input["x"].append("b")  # type: ignore[attr-defined]
+    assert inspected.fingerprint == fingerprint
+
+    inspected.confirms = ["b"]
+    assert inspected.confirms == ("b",)
+    assert inspected.fingerprint != fingerprint
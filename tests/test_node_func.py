@@ -1,6 +1,9 @@
 from inspect import Parameter
 
-from kedro_inspect.node_func import Argument, NodeFunction
+import pytest
+
+from kedro_inspect import node_func
+from kedro_inspect.node_func import Argument, NodeFunction, intern_parameters
 
 
 def dummy_func_w_all_param_types(
@@ -188,3 +191,52 @@ def test_func_from_dict() -> None:
     assert kwargs.type_hint is int
 
     assert node_func.return_value is int
+
+
+def test_func_from_dict_lazy() -> None:
+    node_func_dict = {
+        "func": "not_a_module.some_func",
+        "parameters": [
+            {"name": "x", "kind": "POSITIONAL_OR_KEYWORD", "type_hint": "builtins.int"}
+        ],
+        "return_value": "not_a_module.SomeType",
+    }
+
+    node_func = NodeFunction.from_dict(node_func_dict, lazy=True)
+    assert node_func.to_dict() == node_func_dict
+    assert node_func.parameters[0].type_hint is int
+
+    with pytest.raises(ValueError, match="not_a_module.some_func"):
+        node_func.func
+
+
+def test_argument_requires_type_hint() -> None:
+    with pytest.raises(TypeError):
+        Argument(name="foo", kind=Parameter.POSITIONAL_ONLY)
+
+
+def test_intern_parameters_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(node_func, "_MAX_PARAMETER_TUPLES", 2)
+    node_func.clear_interned_parameters()
+    args = [
+        Argument(name=f"a{i}", kind=Parameter.POSITIONAL_ONLY, type_hint=int)
+        for i in range(3)
+    ]
+    first = intern_parameters([args[0]])
+    assert (
+        intern_parameters(
+            [Argument(name="a0", kind=Parameter.POSITIONAL_ONLY, type_hint=int)]
+        )
+        is first
+    )
+    intern_parameters([args[1]])
+    # the first signature was used more recently than the second
+    intern_parameters([args[0]])
+    intern_parameters([args[2]])
+
+    assert len(node_func._parameter_tuples) == 2
+    assert intern_parameters([args[0]]) is first
+    node_func.clear_interned_parameters()
+    assert not node_func._parameter_tuples
@@ -1,8 +1,17 @@
-from kedro.pipeline import Pipeline, node
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+from kedro.pipeline import Pipeline, node, pipeline
 from typing_extensions import Any
 
+from kedro_inspect import serialisation
 from kedro_inspect.node import InspectedNode
 from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect.serialisation import get_unresolved, inline_types
 
 
 def identity(x) -> Any:
@@ -24,12 +33,198 @@ def test_inspected_pipeline() -> None:
         assert orig_node == kedro_node
 
     inspected_pipe_dict = inspected_pipeline.to_dict()
-    assert inspected_pipe_dict == {
-        "nodes": [
-            inspected_pipeline.nodes[0].to_dict(),
-            inspected_pipeline.nodes[1].to_dict(),
-        ]
-    }
+    assert inspected_pipe_dict["types"] == ["typing.Any"]
+    assert inspected_pipe_dict["nodes"][0]["function"]["return_value"] == 0
+    assert inline_types(inspected_pipe_dict) == [
+        inspected_pipeline.nodes[0].to_dict(),
+        inspected_pipeline.nodes[1].to_dict(),
+    ]
 
     inspected_pipe_from_dict = InspectedPipeline.from_dict(inspected_pipe_dict)
     assert inspected_pipe_from_dict.to_dict() == inspected_pipe_dict
+
+    lazy_pipe = InspectedPipeline.from_dict(inspected_pipe_dict, lazy=True)
+    assert lazy_pipe.to_dict() == inspected_pipe_dict
+    assert lazy_pipe.nodes[0].function.func is identity
+
+
+def test_from_kedro_pipeline_shares_nodes() -> None:
+    node1 = node(identity, inputs="data", outputs="result", name="node1")
+    node2 = node(identity, inputs="result", outputs="output", name="node2")
+    node_cache = {}
+
+    full = InspectedPipeline.from_kedro_pipeline(Pipeline([node1, node2]), node_cache)
+    partial = InspectedPipeline.from_kedro_pipeline(Pipeline([node2]), node_cache)
+
+    assert len(node_cache) == 2
+    assert partial.nodes[0] is full.nodes[1]
+
+
+def other(x) -> Any:
+    return x
+
+
+def test_from_kedro_pipeline_does_not_share_variants() -> None:
+    base = pipeline([node(identity, "data", "result", name="node1")])
+    node_cache = {}
+
+    # kedro nodes with other tags or functions compare equal
+    first = InspectedPipeline.from_kedro_pipeline(
+        pipeline(base, tags=["a"]), node_cache
+    )
+    second = InspectedPipeline.from_kedro_pipeline(
+        pipeline(base, tags=["b"]), node_cache
+    )
+    third = InspectedPipeline.from_kedro_pipeline(
+        Pipeline([node(other, "data", "result", name="node1")]), node_cache
+    )
+
+    assert first.nodes[0].tags == {"a"}
+    assert second.nodes[0].tags == {"b"}
+    assert third.nodes[0].function.func is other
+
+
+def test_pipeline_fingerprint() -> None:
+    node1 = node(identity, inputs="data", outputs="result", name="node1")
+    node2 = node(identity, inputs="result", outputs="output", name="node2")
+    pipe = InspectedPipeline.from_kedro_pipeline(Pipeline([node1, node2]))
+    reordered = InspectedPipeline(list(reversed(pipe.nodes)))
+
+    assert pipe.fingerprint == reordered.fingerprint
+    assert pipe == reordered
+    assert hash(pipe) == hash(reordered)
+
+    reordered.nodes = reordered.nodes[:1]
+    assert pipe != reordered
+
+
+def test_pipeline_fingerprint_follows_replaced_nodes() -> None:
+    node1 = node(identity, inputs="data", outputs="result", name="node1")
+    node2 = node(identity, inputs="result", outputs="output", name="node2")
+    pipe = InspectedPipeline.from_kedro_pipeline(Pipeline([node1, node2]))
+    other = InspectedPipeline(list(pipe.nodes))
+    assert pipe == other
+
+    other.nodes[1] = InspectedNode.from_kedro_node(
+        node(identity, inputs="result", outputs="changed", name="node2")
+    )
+    assert pipe != other
+    assert pipe.fingerprint != other.fingerprint
+
+    other.nodes[1] = pipe.nodes[1]
+    assert pipe == other
+
+
+def test_to_kedro_pipeline_bulk() -> None:
+    node1 = node(identity, inputs="data", outputs="result", name="node1")
+    node2 = node(identity, inputs="result", outputs="output", name="node2")
+    dct = InspectedPipeline.from_kedro_pipeline(Pipeline([node1, node2])).to_dict()
+    dct["nodes"][1]["function"]["func"] = "missing_module_abc.identity"
+
+    lazy_pipe = InspectedPipeline.from_dict(dct, lazy=True)
+    kedro_pipeline, failed = lazy_pipe.to_kedro_pipeline_bulk(max_workers=2)
+
+    assert kedro_pipeline.nodes == [node1]
+    assert list(failed) == ["missing_module_abc.identity"]
+
+
+def test_slicing_shares_nodes() -> None:
+    pipe = InspectedPipeline.from_kedro_pipeline(
+        Pipeline(
+            [
+                node(identity, "a", "b", name="n1", tags=["t1"]),
+                node(identity, "b", "c", name="n2", namespace="ns", tags=["t2"]),
+                node(identity, "c", "d", name="n3", namespace="ns.sub"),
+                node(identity, "x", "y", name="n4", tags=["t1"]),
+            ]
+        )
+    )
+
+    def names(sliced: InspectedPipeline) -> set:
+        return {node.name for node in sliced.nodes}
+
+    tagged = pipe.only_nodes_with_tags("t1")
+    assert names(tagged) == {"n1", "n4"}
+    assert all(node in map(id, pipe.nodes) for node in map(id, tagged.nodes))
+    assert names(pipe.only_nodes_with_namespaces(["ns"])) == {"n2", "n3"}
+    assert names(pipe.only_nodes("ns.n2", "n1")) == {"n1", "n2"}
+    assert names(pipe.from_nodes("ns.n2")) == {"n2", "n3"}
+    assert names(pipe.to_outputs("c")) == {"n1", "n2"}
+    assert names(pipe.only_nodes_with_inputs("b", "x")) == {"n2", "n4"}
+
+    assert names(pipe.filter(tags=["t1"], to_outputs=["d"])) == {"n1"}
+    assert names(pipe.filter(node_namespaces=["ns"], with_inputs=["c"])) == {"n3"}
+    assert pipe.filter().nodes == pipe.nodes
+
+    kedro_pipe = pipe.to_kedro_pipeline()
+    assert {n.name for n in kedro_pipe.from_nodes("ns.n2").nodes} == {
+        n.full_name for n in pipe.from_nodes("ns.n2").nodes
+    }
+
+
+def first_list(x: List[int]) -> List[int]:
+    return x
+
+
+def second_list(y: List[int]) -> int:
+    return len(y)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_from_dict_shares_decoded_types(lazy: bool) -> None:
+    dct = InspectedPipeline.from_kedro_pipeline(
+        Pipeline([node(first_list, "a", "b"), node(second_list, "b", "c")])
+    ).to_dict()
+    first, second = InspectedPipeline.from_dict(dct, lazy).nodes
+
+    # each entry of the type table is decoded once
+    hint = get_unresolved(first.function.parameters[0], "type_hint")
+    assert get_unresolved(second.function.parameters[0], "type_hint") is hint
+    assert get_unresolved(first.function, "return_value") is hint
+    assert second.function.parameters[0].type_hint == List[int]
+
+
+SLOW_MODULE = """
+import time
+from typing import List
+
+# an expensive import, e.g. of a large library
+time.sleep(0.3)
+
+
+class Table:
+    pass
+
+
+def load(x: List[Table]) -> Table:
+    return x[0]
+"""
+
+
+def test_lazy_from_dict_imports_nothing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "slow_nodes.py").write_text(SLOW_MODULE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    slow_nodes = importlib.import_module("slow_nodes")
+    dct = InspectedPipeline.from_kedro_pipeline(
+        Pipeline([node(slow_nodes.load, "a", "b")])
+    ).to_dict()
+    del sys.modules["slow_nodes"]
+    serialisation.fqn_to_obj.cache_clear()
+    serialisation._decode_type_cached.cache_clear()
+
+    start = time.perf_counter()
+    (lazy,) = InspectedPipeline.from_dict(dct, lazy=True).nodes
+    lazy_seconds = time.perf_counter() - start
+    assert "slow_nodes" not in sys.modules
+
+    start = time.perf_counter()
+    (eager,) = InspectedPipeline.from_dict(dct).nodes
+    eager_seconds = time.perf_counter() - start
+    assert "slow_nodes" in sys.modules
+    assert lazy_seconds < 0.3 <= eager_seconds
+
+    # the module is imported once it is needed
+    assert lazy.function.return_value is sys.modules["slow_nodes"].Table
+    del sys.modules["slow_nodes"]
@@ -0,0 +1,49 @@
+import pytest
+from kedro.pipeline import node
+
+from kedro_inspect import profiling
+from kedro_inspect.node import InspectedNode
+
+
+def identity(x: int) -> int:
+    return x
+
+
+@pytest.fixture
+def profiler():
+    try:
+        yield profiling.enable(trace=True)
+    finally:
+        profiling.disable()
+
+
+def test_span_is_noop_when_disabled() -> None:
+    assert profiling.span("a") is profiling.span("b")
+
+
+def test_profiler_collects_phases(profiler: profiling.Profiler) -> None:
+    for name in ["first", "second"]:
+        InspectedNode.from_kedro_node(node(identity, "a", "b", name=name))
+
+    phases = profiler.phases
+    assert phases["node.from_kedro_node"].calls == 2
+    assert phases["node_func.from_callable"].calls == 2
+    outer = phases["node.from_kedro_node"]
+    assert outer.self_ns <= outer.total_ns
+    assert outer.total_ns >= phases["node_func.from_callable"].total_ns
+
+    slowest = profiler.slowest("node.from_kedro_node", 1)
+    assert len(slowest) == 1 and slowest[0][0] in {"first", "second"}
+    assert [item for item, _ in profiler.slowest("node_func.from_callable", 5)] == [
+        f"{__name__}.identity"
+    ]
+    assert any(line.startswith("node.from_kedro_node") for line in profiler.report())
+
+    events = profiler.chrome_trace()["traceEvents"]
+    assert len(events) == sum(stats.calls for stats in phases.values())
+    assert {event["ph"] for event in events} == {"X"}
+
+
+def test_chrome_trace_requires_trace() -> None:
+    with pytest.raises(ValueError):
+        profiling.Profiler().chrome_trace()
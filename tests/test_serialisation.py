@@ -0,0 +1,124 @@
+import csv
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+import pytest
+from kedro.pipeline import Pipeline, node
+from typing_extensions import Literal
+
+from kedro_inspect.node_func import NodeFunction
+from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect.serialisation import (
+    LazyType,
+    UnresolvedAnnotation,
+    decode_type,
+    encode_type,
+    hoist_types,
+    inline_types,
+    resolve_fqns,
+)
+
+
+class Model:
+    pass
+
+
+@pytest.mark.parametrize(
+    "typ, encoded",
+    [
+        (int, "builtins.int"),
+        (Any, "typing.Any"),
+        (type(None), None),
+        (Model, f"{__name__}.Model"),
+        (List, "typing.List"),
+        (List[int], {"generic": "typing.List", "args": ["builtins.int"]}),
+        (list[int], {"generic": "builtins.list", "args": ["builtins.int"]}),
+        (
+            Dict[str, List[Model]],
+            {
+                "generic": "typing.Dict",
+                "args": [
+                    "builtins.str",
+                    {"generic": "typing.List", "args": [f"{__name__}.Model"]},
+                ],
+            },
+        ),
+        (
+            Tuple[int, ...],
+            {"generic": "typing.Tuple", "args": ["builtins.int", "..."]},
+        ),
+        (Optional[int], {"union": ["builtins.int", None]}),
+        (Union[int, str], {"union": ["builtins.int", "builtins.str"]}),
+        (Literal["a", 1], {"literal": ["a", 1]}),
+        (
+            Callable[[int], str],
+            {"callable": ["builtins.int"], "return": "builtins.str"},
+        ),
+        (Callable[..., str], {"callable": "...", "return": "builtins.str"}),
+        (UnresolvedAnnotation("Foo[Bar]"), "unresolved:Foo[Bar]"),
+    ],
+)
+def test_type_roundtrip(typ: Any, encoded: Any) -> None:
+    assert encode_type(typ) == encoded
+    assert decode_type(encoded) == typ
+
+
+def test_typevar_roundtrip() -> None:
+    decoded = decode_type(encode_type(TypeVar("T")))
+    assert isinstance(decoded, TypeVar) and decoded.__name__ == "T"
+
+
+def returns_nested(x: Optional[List[int]]) -> Dict[str, Tuple[int, ...]]:
+    return {}
+
+
+def returns_none(x: int) -> None:
+    return None
+
+
+def test_lazy_structured_hints() -> None:
+    dct = NodeFunction.from_callable(returns_nested).to_dict()
+    lazy = NodeFunction.from_dict(dct, lazy=True)
+
+    assert isinstance(lazy._return_value, LazyType)
+    assert lazy.to_dict() == dct
+    assert lazy.return_value == Dict[str, Tuple[int, ...]]
+    assert lazy.parameters[0].type_hint == Optional[List[int]]
+
+
+def test_type_table() -> None:
+    pipe = InspectedPipeline.from_kedro_pipeline(
+        Pipeline(
+            [node(returns_nested, "a", f"b{i}", name=f"nested{i}") for i in range(3)]
+            + [node(returns_none, "b0", None, name="none")]
+        )
+    )
+    node_dicts = list(pipe.iter_dicts())
+    hoisted, table = hoist_types(node_dicts)
+
+    assert len(table) == 4
+    assert {node["function"]["return_value"] for node in hoisted[:3]} == {
+        table.index(encode_type(Dict[str, Tuple[int, ...]]))
+    }
+    assert inline_types({"types": table, "nodes": hoisted}) == node_dicts
+    assert inline_types({"nodes": node_dicts}) == node_dicts
+    assert InspectedPipeline.from_dict(pipe.to_dict()) == pipe
+
+
+def test_resolve_fqns_reports_all_failures() -> None:
+    fqns = [
+        "json.dumps",
+        "json.dumps",
+        "csv.reader",
+        f"{__name__}.Model",
+        "missing_module_abc.func",
+        "json.missing",
+    ]
+    resolved, failed = resolve_fqns(fqns, max_workers=4)
+
+    assert resolved == {
+        "json.dumps": json.dumps,
+        "csv.reader": csv.reader,
+        f"{__name__}.Model": Model,
+    }
+    assert set(failed) == {"missing_module_abc.func", "json.missing"}
@@ -0,0 +1,130 @@
+import json
+import os
+import py_compile
+import threading
+import urllib.request
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from kedro_inspect import typecheck
+from kedro_inspect.serialisation import fqn_to_obj
+from kedro_inspect.server import InspectionService, make_server
+
+PACKAGE = "served_proj"
+
+NODES = """
+def split(data: int) -> int:
+    return data
+
+
+def report(train: int, test: int) -> None:
+    return None
+"""
+
+REGISTRY = """
+from kedro.pipeline import node, pipeline
+
+from served_proj.nodes import report, split
+
+
+def register_pipelines():
+    pipe = pipeline(
+        [
+            node(split, "raw", "train@pandas", name="split_train"),
+            node(split, "raw", "test", name="split_test"),
+            node(report, ["train@spark", "test"], None, name="report", namespace="ns"),
+        ]
+    )
+    return {"__default__": pipe}
+"""
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    return make_project(PACKAGE, {"nodes.py": NODES, "pipeline_registry.py": REGISTRY})
+
+
+def get(service: InspectionService, path: str):
+    status, body = service.handle("GET", path)
+    return status, json.loads(body)
+
+
+def test_service_queries(project: Path) -> None:
+    service = InspectionService(project)
+
+    assert get(service, "/pipelines") == (200, {"pipelines": ["__default__"]})
+    status, dct = get(service, "/pipelines/__default__")
+    assert status == 200 and len(dct["nodes"]) == 3
+
+    status, node = get(service, "/pipelines/__default__/nodes/ns.report")
+    assert status == 200
+    assert node["function"]["func"] == f"{PACKAGE}.nodes.report"
+
+    status, lineage = get(service, "/pipelines/__default__/datasets/train@pandas")
+    assert status == 200
+    assert lineage == {
+        "dataset": "train",
+        "producer": "split_train",
+        "consumers": ["ns.report"],
+        "upstream": ["split_train"],
+        "downstream": ["ns.report"],
+    }
+
+    assert get(service, "/pipelines/missing")[0] == 404
+    assert get(service, "/pipelines/__default__/nodes/missing")[0] == 404
+    assert service.handle("DELETE", "/pipelines")[0] == 405
+
+
+def test_service_reloads_changed_modules(project: Path) -> None:
+    service = InspectionService(project)
+    _, before = get(service, "/pipelines/__default__/nodes/split_train")
+    assert before["function"]["return_value"] == "builtins.int"
+
+    (project / "src" / PACKAGE / "nodes.py").write_text(
+        NODES.replace("-> int", "-> float")
+    )
+    _, after = get(service, "/pipelines/__default__/nodes/split_train")
+    assert after["function"]["return_value"] == "builtins.float"
+    status = get(service, "/status")[1]
+    assert status["reloads"] == 1 and status["reload_errors"] == {}
+
+    (project / "src" / PACKAGE / "nodes.py").write_text("def split(:\n")
+    status, error = get(service, "/pipelines")
+    assert status == 500 and f"{PACKAGE}.nodes" in error["modules"]
+
+
+def test_service_reloads_quick_edits_and_clears_caches(project: Path) -> None:
+    nodes = project / "src" / PACKAGE / "nodes.py"
+    # an edit within the same second that keeps the size of the file
+    second = 1_000_000_000
+    os.utime(nodes, (second, second))
+    bytecode = Path(py_compile.compile(str(nodes)))
+    service = InspectionService(project)
+    _, before = get(service, "/pipelines/__default__/nodes/split_train")
+    assert before["function"]["return_value"] == "builtins.int"
+
+    fqn_to_obj("builtins.int")
+    typecheck.is_compatible(int, float)
+    nodes.write_text(NODES.replace("-> int", "-> str"))
+    os.utime(nodes, ns=(second * 10**9 + 1, second * 10**9 + 1))
+    assert f"{PACKAGE}.nodes" in service.refresh()
+    assert fqn_to_obj.cache_info().currsize == 0
+    assert typecheck._is_compatible_cached.cache_info().currsize == 0
+    _, after = get(service, "/pipelines/__default__/nodes/split_train")
+    assert after["function"]["return_value"] == "builtins.str"
+    assert bytecode.exists()
+
+
+def test_http_server(project: Path) -> None:
+    server = make_server(InspectionService(project), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/pipelines"
+        with urllib.request.urlopen(url) as response:
+            assert json.loads(response.read()) == {"pipelines": ["__default__"]}
+    finally:
+        server.shutdown()
+        server.server_close()
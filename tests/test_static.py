@@ -0,0 +1,165 @@
+import importlib
+import sys
+from pathlib import Path
+from textwrap import dedent
+from typing import Callable, Dict
+
+import pytest
+
+from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect.static import StaticInspectionError, StaticProject
+
+NODES = """
+from __future__ import annotations
+
+from typing import Dict, List
+
+
+def split(data: List[int], ratio: float = 0.5) -> Dict[str, List[int]]:
+    return {"train": data, "test": data}
+
+
+def combine(*parts: List[int]) -> List[int]:
+    return [x for part in parts for x in part]
+
+
+def report(train: List[int], test, **extra: str) -> None:
+    return None
+"""
+
+PIPELINE = """
+from kedro.pipeline import node, pipeline
+
+from .nodes import combine, report, split
+
+
+def create_pipeline(**kwargs):
+    base = pipeline(
+        [
+            node(split, ["raw", "params:ratio"], {"train": "train", "test": "test"},
+                 name="split", tags="split"),
+            node(combine, ["train", "test"], "combined", name="combine"),
+        ]
+    )
+    ns = "modelling"
+    return base + pipeline(
+        [node(report, {"train": "train", "test": "test"}, None, name="report")],
+        namespace=ns,
+        inputs={"train"},
+        tags=["reporting"],
+    )
+"""
+
+EXPLICIT_REGISTRY = """
+from static_proj.pipelines import dp
+
+
+def register_pipelines():
+    dp_pipe = dp.create_pipeline()
+    return {"__default__": dp_pipe, "dp": dp_pipe}
+"""
+
+FIND_REGISTRY = """
+from kedro.framework.project import find_pipelines
+
+
+def register_pipelines():
+    pipelines = find_pipelines()
+    pipelines["__default__"] = sum(pipelines.values())
+    return pipelines
+"""
+
+
+def project_files(registry: str) -> Dict[str, str]:
+    return {
+        "pipeline_registry.py": dedent(registry),
+        "pipelines/__init__.py": "",
+        "pipelines/dp/__init__.py": "from .pipeline import create_pipeline\n",
+        "pipelines/dp/nodes.py": dedent(NODES),
+        "pipelines/dp/pipeline.py": dedent(PIPELINE),
+    }
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    return make_project("static_proj", project_files(EXPLICIT_REGISTRY))
+
+
+def normalise(dct: dict) -> dict:
+    for node in dct["nodes"]:
+        node["tags"] = sorted(node["tags"])
+    return dct
+
+
+def test_static_matches_dynamic(project: Path) -> None:
+    static = StaticProject(project).inspect("dp")
+
+    # the fixture removes the path and unloads the package afterwards
+    sys.path.insert(0, str(project / "src"))
+    registry = importlib.import_module("static_proj.pipeline_registry")
+    pipe = registry.register_pipelines()["dp"]
+    dynamic = {"nodes": list(InspectedPipeline.from_kedro_pipeline(pipe).iter_dicts())}
+
+    assert normalise(static) == normalise(dynamic)
+
+
+def test_static_type_hints(project: Path) -> None:
+    nodes = StaticProject(project).inspect("dp")["nodes"]
+    split = next(n for n in nodes if n["name"] == "split")
+    report = next(n for n in nodes if n["name"] == "report")
+
+    assert split["function"]["func"] == "static_proj.pipelines.dp.nodes.split"
+    assert split["function"]["parameters"] == [
+        {
+            "name": "data",
+            "kind": "POSITIONAL_OR_KEYWORD",
+            "type_hint": {"generic": "typing.List", "args": ["builtins.int"]},
+        },
+        {
+            "name": "ratio",
+            "kind": "POSITIONAL_OR_KEYWORD",
+            "type_hint": "builtins.float",
+        },
+    ]
+    assert report["namespace"] == "modelling"
+    assert report["inputs"] == {"train": "train", "test": "modelling.test"}
+    assert report["tags"] == ["reporting"]
+    assert report["function"]["parameters"][1]["type_hint"] == "typing.Any"
+    assert report["function"]["return_value"] is None
+    assert "unresolved" not in report
+
+
+def test_static_find_pipelines(
+    make_project: Callable[..., Path],
+) -> None:
+    project = StaticProject(make_project("static_proj", project_files(FIND_REGISTRY)))
+
+    assert set(project.pipelines) == {"dp", "__default__"}
+    assert project.inspect("__default__") == project.inspect("dp")
+    assert project.warnings == []
+
+
+def test_static_flags_unresolved_nodes(project: Path) -> None:
+    pipeline_py = project / "src" / "static_proj" / "pipelines" / "dp" / "pipeline.py"
+    pipeline_py.write_text(dedent("""
+            from kedro.pipeline import node, pipeline
+            from pandas import concat
+
+
+            def create_pipeline(**kwargs):
+                return pipeline([node(concat, ["a", "b"], "c", name="concat")])
+            """))
+    (node,) = StaticProject(project).inspect("dp")["nodes"]
+
+    assert node["function"]["func"] == "pandas.concat"
+    assert node["unresolved"] == ["function"]
+
+
+def test_static_unknown_pipeline(project: Path) -> None:
+    with pytest.raises(ValueError, match="not found"):
+        StaticProject(project).inspect("missing")
+
+
+def test_static_requires_kedro_metadata(tmp_path: Path) -> None:
+    with pytest.raises(StaticInspectionError):
+        StaticProject(tmp_path)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+from kedro_inspect.stats import (
+    aggregate_runs,
+    append_run,
+    data_size,
+    load_node_stats,
+    stats_costs,
+)
+
+
+class Array:
+    nbytes = 800
+
+
+class Frame:
+    def memory_usage(self, index: bool) -> "Usage":
+        return Usage()
+
+
+class Usage:
+    def sum(self) -> int:
+        return 1200
+
+
+def test_data_size() -> None:
+    assert data_size(Array()) == 800
+    assert data_size(Frame()) == 1200
+    assert data_size(b"abc") == sys.getsizeof(b"abc")
+    assert data_size([1, 2, 3]) is None
+
+
+def run(node: str, seconds: float | None, memory: int | None = None) -> dict:
+    return {
+        "node": node,
+        "time": 1.0,
+        "seconds": seconds,
+        "peak_memory": memory,
+        "output_bytes": {"out": 10},
+    }
+
+
+def test_aggregate_runs(tmp_path: Path) -> None:
+    append_run(tmp_path, run("a", 1.0, 100))
+    append_run(tmp_path, run("a", 3.0, 50))
+    append_run(tmp_path, run("b", None))
+    assert load_node_stats(tmp_path)["a"]["mean_seconds"] == 2.0
+
+    stats = aggregate_runs(tmp_path)
+    assert [p.name for p in tmp_path.iterdir()] == ["node_stats.json"]
+    assert stats["a"] == {
+        "runs": 2,
+        "failures": 0,
+        "mean_seconds": 2.0,
+        "max_seconds": 3.0,
+        "last_seconds": 3.0,
+        "last_run": 1.0,
+        "peak_memory": 100,
+        "output_bytes": {"out": 10},
+    }
+    assert stats["b"]["failures"] == 1
+
+    append_run(tmp_path, run("b", 4.0))
+    # a partially written run is ignored
+    with (tmp_path / "node_runs.ndjson").open("a") as f:
+        f.write(json.dumps(run("b", 100.0))[:20])
+    stats = load_node_stats(tmp_path)
+    assert stats["b"]["runs"] == 2
+    assert stats["b"]["mean_seconds"] == 4.0
+    assert aggregate_runs(tmp_path) == stats
+    assert stats_costs(stats) == {"a": 2.0, "b": 4.0}
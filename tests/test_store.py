@@ -0,0 +1,105 @@
+from pathlib import Path
+
+from kedro.pipeline import Pipeline, node
+from typing_extensions import Any
+
+from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect.store import _HISTORY, SnapshotStore
+
+
+def identity(x) -> Any:
+    return x
+
+
+def typed(x: int) -> int:
+    return x
+
+
+def make_pipeline(second_func=identity, third: bool = True) -> InspectedPipeline:
+    nodes = [
+        node(identity, "a", "b", name="first"),
+        node(second_func, "b", "c", name="second", namespace="ns"),
+    ]
+    if third:
+        nodes.append(node(identity, "c", "d", name="third"))
+    return InspectedPipeline.from_kedro_pipeline(Pipeline(nodes))
+
+
+def test_store_deduplicates_and_persists(tmp_path: Path) -> None:
+    first, second = make_pipeline(), make_pipeline(typed)
+    with SnapshotStore(tmp_path) as store:
+        assert store.add(first, "v1") == 0
+        assert store.add(first, "v1-again") == 1
+        assert store.add(second, "v2") == 2
+        # only the changed node is stored again
+        assert store.n_records == 4
+
+    with SnapshotStore(tmp_path) as store:
+        assert [s["label"] for s in store.snapshots()] == ["v1", "v1-again", "v2"]
+        assert store.snapshot("v2")["n_nodes"] == 3
+        assert store.load("v1") == first
+        assert list(store.load_dicts(2)) == list(second.iter_dicts())
+        assert store.load("v2", lazy=False).nodes[1].function.func is typed
+
+        store.add(make_pipeline(third=False), "v3")
+        assert len(store) == 4 and store.n_records == 4
+
+
+def test_node_queries(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path) as store:
+        store.add(make_pipeline(), "v1")
+        store.add(make_pipeline(), "v2")
+        store.add(make_pipeline(typed), "v3")
+        store.add(make_pipeline(typed, third=False), "v4")
+        store.add(make_pipeline(typed), "v5")
+
+        dct = store.node("v3", "ns.second")
+        assert dct["function"]["func"] == f"{__name__}.typed"
+        assert store.node("v4", "third") is None
+        assert store.node("v4", "missing") is None
+
+        history = store.node_history("ns.second")
+        assert [(h["label"], h["snapshot"]) for h in history] == [("v1", 0), ("v3", 2)]
+        assert history[0]["fingerprint"] != history[1]["fingerprint"]
+        assert [
+            (h["label"], h["fingerprint"] is None) for h in store.node_history("third")
+        ] == [("v1", False), ("v4", True), ("v5", False)]
+        assert store.node_history("missing") == []
+
+
+def test_history_index(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path) as store:
+        store.add(make_pipeline(), "v1")
+        store.add(make_pipeline(typed, third=False), "v2")
+        history = store.node_history("third")
+    # one entry per added, changed or removed node
+    assert (tmp_path / "history.idx").stat().st_size == 5 * _HISTORY.size
+
+    # stores written without a history index are migrated
+    (tmp_path / "history.idx").unlink()
+    with SnapshotStore(tmp_path) as store:
+        assert store.node_history("third") == history
+        assert store.node("v2", "ns.second")["function"]["func"].endswith("typed")
+
+    # entries of a snapshot that was not written are dropped
+    with (tmp_path / "history.idx").open("ab") as f:
+        f.write(_HISTORY.pack(0, 2, 0, -1))
+    with SnapshotStore(tmp_path) as store:
+        assert [h["label"] for h in store.node_history("first")] == ["v1"]
+        assert (tmp_path / "history.idx").stat().st_size == 5 * _HISTORY.size
+        store.add(make_pipeline(), "v3")
+        assert [h["label"] for h in store.node_history("third")] == ["v1", "v2", "v3"]
+
+
+def test_partial_writes_are_ignored(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path) as store:
+        store.add(make_pipeline(), "v1")
+    with (tmp_path / "snapshots.idx").open("ab") as f:
+        f.write(b"\x01\x02\x03")
+    with (tmp_path / "keys.ndjson").open("a") as f:
+        f.write('"partial')
+
+    with SnapshotStore(tmp_path) as store:
+        assert len(store) == 1
+        store.add(make_pipeline(typed), "v2")
+        assert store.node("v2", "ns.second")["function"]["func"].endswith("typed")
@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import pytest
+from kedro.pipeline import Pipeline, node
+from typing_extensions import Literal, TypedDict
+
+from kedro_inspect.pipeline import InspectedPipeline
+from kedro_inspect.typecheck import check_types, is_compatible, output_types
+
+T = TypeVar("T")
+
+
+class Split(TypedDict):
+    train: List[int]
+    test: List[int]
+
+
+@pytest.mark.parametrize(
+    "provided, expected, compatible",
+    [
+        (int, int, True),
+        (bool, int, True),
+        (int, float, True),
+        (float, int, False),
+        (str, int, False),
+        (Any, int, True),
+        (int, T, True),
+        (int, Optional[int], True),
+        (Optional[int], int, False),
+        (Union[int, bool], float, True),
+        (List[int], Sequence[float], True),
+        (List[str], List[int], False),
+        (Dict[str, int], Dict[str, int], True),
+        (Tuple[int, int], Tuple[int, ...], True),
+        (Tuple[int, str], Tuple[int, ...], False),
+        (Literal["a"], str, True),
+        (Literal["a"], Literal["a", "b"], True),
+        (Literal["c"], Literal["a", "b"], False),
+        ("ForwardRef", int, True),
+    ],
+)
+def test_is_compatible(provided: Any, expected: Any, compatible: bool) -> None:
+    assert is_compatible(provided, expected) is compatible
+
+
+def test_output_types() -> None:
+    assert output_types(int, "a") == {"a": int}
+    assert output_types(Tuple[int, str], ("a", "b")) == {"a": int, "b": str}
+    assert output_types(List[int], ("a", "b")) == {"a": int, "b": int}
+    assert output_types(Split, {"train": "tr", "test": "te"}) == {
+        "tr": List[int],
+        "te": List[int],
+    }
+    assert output_types(Any, ("a",)) == {"a": Any}
+    assert output_types(None, None) == {}
+
+
+def split(data: List[int]) -> Split:
+    return {"train": data, "test": data}
+
+
+def pair(data: List[int]) -> Tuple[int, str]:
+    return 0, ""
+
+
+def combine(*parts: List[int]) -> List[int]:
+    return [x for part in parts for x in part]
+
+
+def count(n: int, label: str, **extra: str) -> int:
+    return n
+
+
+def test_check_types() -> None:
+    pipeline = InspectedPipeline.from_kedro_pipeline(
+        Pipeline(
+            [
+                node(split, "raw", {"train": "train", "test": "test@pandas"}),
+                node(pair, "raw", ["n", "label"]),
+                node(combine, ["train", "test@pandas"], "combined"),
+                node(count, {"n": "label", "label": "n", "x": "n"}, "counted"),
+                # different transcoding of the producer's output is not checked
+                node(count, ["test@spark", "label"], "other"),
+            ]
+        )
+    )
+    mismatches = check_types(pipeline)
+
+    assert [(m["dataset"], m["parameter"]) for m in mismatches] == [
+        ("label", "n"),
+        ("n", "label"),
+        ("n", "extra"),
+    ]
+    assert mismatches[0]["provided"] == "builtins.str"
+    assert mismatches[0]["expected"] == "builtins.int"
+    assert mismatches[0]["producer"].startswith("test_typecheck.pair(")
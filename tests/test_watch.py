@@ -0,0 +1,108 @@
+import json
+import os
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from kedro_inspect.pipeline import to_pipeline_dict
+from kedro_inspect.server import InspectionService
+from kedro_inspect.watch import Watcher
+
+PACKAGE = "watched_proj"
+
+NODES = """
+def clean(data: int) -> int:
+    return data
+
+
+def report(data: int) -> None:
+    return None
+"""
+
+REGISTRY = """
+from kedro.pipeline import node, pipeline
+
+from watched_proj.nodes import clean, report
+
+
+def register_pipelines():
+    pipe = pipeline(
+        [
+            node(clean, "raw", "clean", name="clean", tags=["prep"]),
+            node(report, "clean", None, name="report"),
+        ]
+    )
+    return {"__default__": pipe}
+"""
+
+
+@pytest.fixture
+def project(make_project: Callable[..., Path]) -> Path:
+    return make_project(PACKAGE, {"nodes.py": NODES, "pipeline_registry.py": REGISTRY})
+
+
+def edit(path: Path, content: str) -> None:
+    path.write_text(content)
+    # make sure the modification time changes even on coarse clocks
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def encode(results) -> bytes:
+    return json.dumps(to_pipeline_dict(results["__default__"])).encode()
+
+
+def read(path: Path) -> dict:
+    return json.loads(path.read_bytes())
+
+
+def test_watcher_rewrites_output(project: Path, tmp_path: Path) -> None:
+    output = tmp_path / "inspection.json"
+    service = InspectionService(project)
+    watcher = Watcher(service, ["__default__"], output, encode, debounce=0)
+    assert watcher.write()
+    assert read(output)["types"] == ["builtins.int", None]
+    assert watcher.poll() == []
+
+    report_before = service.inspect("__default__").pipeline.nodes[1]
+    edit(project / "src" / PACKAGE / "nodes.py", NODES.replace("-> int", "-> float"))
+    # the first poll notices the change, the next one reloads once it settled
+    assert watcher.poll() == []
+    (message,) = watcher.poll()
+    assert message.startswith(f"reloaded {PACKAGE}.nodes, ")
+    assert message.endswith(f"wrote {output}")
+    assert "builtins.float" in read(output)["types"]
+    assert service.inspect("__default__").pipeline.nodes[1] == report_before
+
+    edit(project / "src" / PACKAGE / "nodes.py", "def clean(:\n")
+    watcher.poll()
+    (message,) = watcher.poll()
+    assert message.startswith(f"could not reload {PACKAGE}.nodes")
+    # failures are not retried until the file changes again
+    assert watcher.poll() == []
+    assert "builtins.float" in read(output)["types"]
+
+    edit(project / "src" / PACKAGE / "nodes.py", NODES)
+    watcher.poll()
+    assert watcher.poll()[0].endswith(f"wrote {output}")
+    assert "builtins.float" not in read(output)["types"]
+
+
+def test_watcher_debounces_and_selects(project: Path, tmp_path: Path) -> None:
+    output = tmp_path / "inspection.json"
+    watcher = Watcher(
+        InspectionService(project),
+        ["__default__"],
+        output,
+        encode,
+        select=lambda pipeline: pipeline.only_nodes_with_tags("prep"),
+        debounce=60,
+    )
+    watcher.write()
+    assert [node["name"] for node in read(output)["nodes"]] == ["clean"]
+
+    edit(project / "src" / PACKAGE / "nodes.py", NODES.replace("-> int", "-> float"))
+    assert watcher.poll() == []
+    assert watcher.poll() == []
+    assert read(output)["types"] == ["builtins.int"]